@@ -0,0 +1 @@
+"""In-process benchmarks for the TODO API (run with ``python -m benchmarks.<name>``)."""
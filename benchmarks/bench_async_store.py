@@ -0,0 +1,173 @@
+"""Benchmark how store calls from async routes affect unrelated requests.
+
+Concurrent writers send POST /todos while a probe sends GET /health,
+which never touches the store, every millisecond. The probe's latency,
+from when it was due, shows how long the event loop was held; the
+writers' throughput shows what the store sustains. Each backend is
+installed as the global store and driven through the todo and health
+routers in-process.
+
+Each blocking backend is measured twice: as is, and while a background
+thread holds its write lock for ``--stall-ms`` every 100ms (the WAL
+store's lock, or an SQLite write transaction on another connection), as
+a slow disk or another writer would.
+
+Usage:
+    python -m benchmarks.bench_async_store [--writers N] [--seconds S] [--stall-ms MS]
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from fastapi import FastAPI
+from perf_test import calculate_percentiles
+from benchmarks.asgi import call
+from src.api import health, todos
+from src.storage import memory
+from src.storage.memory import TodoStore
+from src.storage.sqlite import SQLiteTodoStore
+from src.storage.wal import WALTodoStore
+
+BODY = json.dumps({"title": "Benchmark todo"}).encode()
+STALL_EVERY = 0.1
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(todos.router)
+    app.include_router(health.router)
+    return app
+
+
+def hold_wal_lock(store: WALTodoStore, seconds: float):
+    with store._lock:
+        time.sleep(seconds)
+
+
+def sqlite_lock_holder(path: str):
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+
+    def hold(_store, seconds: float):
+        conn.execute("BEGIN IMMEDIATE")
+        time.sleep(seconds)
+        conn.execute("COMMIT")
+
+    return hold
+
+
+class Staller:
+    """Background thread calling ``hold(store, seconds)`` periodically."""
+
+    def __init__(self, hold, store, seconds: float):
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(hold, store, seconds), daemon=True
+        )
+
+    def _run(self, hold, store, seconds: float):
+        while not self._stop.wait(STALL_EVERY):
+            hold(store, seconds)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+async def measure(app, writers: int, seconds: float):
+    deadline = time.perf_counter() + seconds
+    writes = 0
+    probes = []
+
+    async def writer():
+        nonlocal writes
+        while time.perf_counter() < deadline:
+            status, _, _ = await call(app, "POST", "/todos", body=BODY)
+            assert status == 201, status
+            writes += 1
+            # Socket I/O would yield here between requests
+            await asyncio.sleep(0)
+
+    async def probe():
+        while time.perf_counter() < deadline:
+            # Timed from when it is due, so time spent waiting for a held
+            # event loop counts, as it would for a request arriving then
+            due = time.perf_counter() + 0.001
+            await asyncio.sleep(0.001)
+            status, _, _ = await call(app, "GET", "/health")
+            probes.append((time.perf_counter() - due) * 1000)
+            assert status == 200, status
+
+    await asyncio.gather(probe(), *(writer() for _ in range(writers)))
+    return writes / seconds, calculate_percentiles(probes)
+
+
+def run(args):
+    directory = tempfile.mkdtemp(prefix="bench-async-store-")
+    sqlite_path = f"{directory}/todos.db"
+    stall = args.stall_ms / 1000
+    cases = [
+        ("memory", TodoStore, None),
+        ("wal", lambda: WALTodoStore(f"{directory}/wal"), None),
+        ("wal, stalled", lambda: WALTodoStore(f"{directory}/wal"), hold_wal_lock),
+        ("sqlite", lambda: SQLiteTodoStore(sqlite_path), None),
+        (
+            "sqlite, stalled",
+            lambda: SQLiteTodoStore(sqlite_path),
+            sqlite_lock_holder(sqlite_path),
+        ),
+    ]
+    app = build_app()
+
+    print(
+        f"{args.writers} concurrent writers, {args.seconds:.0f}s per case, "
+        f"stalls of {args.stall_ms:.0f}ms every {STALL_EVERY * 1000:.0f}ms"
+    )
+    print("=" * 74)
+    print(
+        f"{'backend':<16} {'writes/s':>10} {'GET /health p50':>16} "
+        f"{'p99':>10} {'max':>10}"
+    )
+    try:
+        for name, factory, hold in cases:
+            store = factory()
+            memory._store = store
+            try:
+                if hold is None:
+                    result = asyncio.run(measure(app, args.writers, args.seconds))
+                else:
+                    with Staller(hold, store, stall):
+                        result = asyncio.run(measure(app, args.writers, args.seconds))
+            finally:
+                memory._store = None
+                store.close()
+
+            throughput, probe = result
+            print(
+                f"{name:<16} {throughput:>10,.0f} {probe['median']:>14.3f}ms "
+                f"{probe['p99']:>8.3f}ms {probe['max']:>8.3f}ms"
+            )
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    """Run async store benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--stall-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
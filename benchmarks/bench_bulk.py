@@ -0,0 +1,115 @@
+"""Benchmark bulk endpoints against the single-item routes.
+
+Creates, updates and deletes the same number of todos through the full
+application (middleware included), once one request per todo and once
+through the /todos/bulk endpoints, and reports items per second.
+
+Usage:
+    python -m benchmarks.bench_bulk [--items N] [--batch N] [--backend memory]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import tempfile
+import time
+from benchmarks.asgi import call
+from src.config import Settings
+from src.main import app
+from src.storage import memory
+from src.storage.memory import create_todo_store
+
+
+async def single_item(items: int):
+    """Return seconds spent on (create, update, delete) one todo per request."""
+    timings = []
+
+    start = time.perf_counter()
+    ids = []
+    for i in range(items):
+        _, _, body = await call(
+            app, "POST", "/todos", body=json.dumps({"title": f"Todo {i}"}).encode()
+        )
+        ids.append(json.loads(body)["id"])
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    update = json.dumps({"completed": True}).encode()
+    for todo_id in ids:
+        await call(app, "PUT", f"/todos/{todo_id}", body=update)
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for todo_id in ids:
+        await call(app, "DELETE", f"/todos/{todo_id}")
+    timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def bulk(items: int, batch: int):
+    """Return seconds spent on (create, update, delete) through /todos/bulk."""
+    timings = []
+    batches = [range(i, min(i + batch, items)) for i in range(0, items, batch)]
+
+    start = time.perf_counter()
+    ids = []
+    for chunk in batches:
+        body = json.dumps({"items": [{"title": f"Todo {i}"} for i in chunk]})
+        _, _, response = await call(app, "POST", "/todos/bulk", body=body.encode())
+        ids += [result["id"] for result in json.loads(response)["results"]]
+    timings.append(time.perf_counter() - start)
+
+    id_batches = [ids[i : i + batch] for i in range(0, len(ids), batch)]
+    start = time.perf_counter()
+    for chunk in id_batches:
+        body = json.dumps({"items": [{"id": i, "completed": True} for i in chunk]})
+        await call(app, "PATCH", "/todos/bulk", body=body.encode())
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for chunk in id_batches:
+        body = json.dumps({"ids": chunk})
+        await call(app, "DELETE", "/todos/bulk", body=body.encode())
+    timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def run(args):
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        single = await single_item(args.items)
+        batched = await bulk(args.items, args.batch)
+
+    print(f"Items/sec, {args.items} todos, {args.backend} backend")
+    print("=" * 60)
+    bulk_column = f"bulk({args.batch})"
+    print(f"{'operation':<10} {'single-item':>14} {bulk_column:>14} {'speedup':>9}")
+    for name, one, many in zip(
+        ("create", "update", "delete"), single, batched, strict=True
+    ):
+        print(
+            f"{name:<10} {args.items / one:>14,.0f} {args.items / many:>14,.0f} "
+            f"{one / many:>8.1f}x"
+        )
+
+
+def main():
+    """Run bulk endpoint benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--backend", default="memory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        settings = Settings(storage_backend=args.backend, data_dir=data_dir)
+        memory._store = create_todo_store(settings)
+        try:
+            asyncio.run(run(args))
+        finally:
+            memory._store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark store throughput under lock contention.
+
+Runs a mixed workload (80% get, 15% update, 5% create) from a growing
+number of threads against the single-lock and the lock-striped stores,
+with one extra thread repeatedly listing every todo.
+
+Usage:
+    python -m benchmarks.bench_contention [--seconds S] [--size N]
+"""
+
+import argparse
+import random
+import threading
+import time
+from src.models.todo import TodoCreate, TodoUpdate
+from src.storage.base import BaseTodoStore
+from src.storage.memory import TodoStore
+from src.storage.striped import StripedTodoStore
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+def run_workload(store: BaseTodoStore, threads: int, seconds: float, size: int):
+    """Return (operations/sec, list_all calls) for one configuration."""
+    stop = threading.Event()
+    counts = [0] * threads
+    listings = [0]
+    todo = TodoCreate(title="Contention")
+    update = TodoUpdate(completed=True)
+
+    def worker(index: int):
+        rng = random.Random(index)
+        done = 0
+        while not stop.is_set():
+            roll = rng.random()
+            todo_id = str(rng.randint(1, size))
+            if roll < 0.80:
+                store.get(todo_id)
+            elif roll < 0.95:
+                store.update(todo_id, update)
+            else:
+                store.create(todo)
+            done += 1
+        counts[index] = done
+
+    def lister():
+        while not stop.is_set():
+            store.list_all()
+            listings[0] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    workers.append(threading.Thread(target=lister))
+    for thread in workers:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in workers:
+        thread.join()
+
+    return sum(counts) / seconds, listings[0]
+
+
+def main():
+    """Run contention benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--stripes", type=int, default=16)
+    args = parser.parse_args()
+
+    stores = {
+        "single-lock": TodoStore,
+        f"striped({args.stripes})": lambda: StripedTodoStore(args.stripes),
+    }
+
+    print("Store throughput vs. thread count (ops/s, list_all calls)")
+    print("=" * 60)
+    for name, factory in stores.items():
+        print(f"\n{name}")
+        for threads in THREAD_COUNTS:
+            store = factory()
+            for _ in range(args.size):
+                store.create(TodoCreate(title="Contention"))
+            rate, listings = run_workload(store, threads, args.seconds, args.size)
+            print(f"   threads={threads:<3} {rate:>12,.0f} ops/s   lists={listings}")
+
+
+if __name__ == "__main__":
+    main()
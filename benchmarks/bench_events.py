@@ -0,0 +1,138 @@
+"""Benchmark the /todos/events fan-out with many connected subscribers.
+
+Runs N ``event_stream`` subscribers on one event loop, as the server does,
+and makes writes on the same loop. For each write it times the write call
+(store write plus ``notify``) and the fan-out, until every subscriber has
+received the change. Memory is the tracemalloc growth from connecting the
+subscribers. A fan-out that pushes each change into a bounded queue per
+subscriber is measured as a reference point.
+
+Usage:
+    python -m benchmarks.bench_events [--subscribers 1000 10000] [--writes N]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from perf_test import calculate_percentiles
+from src.api.events import ChangeFeed, event_stream
+from src.models.todo import TodoCreate
+from src.storage.aio import AsyncTodoStore
+from src.storage.memory import TodoStore
+
+BUFFER = 1000
+
+
+class Deliveries:
+    """Counts chunks received by subscribers; resolves once all have one."""
+
+    def __init__(self, subscribers: int):
+        self.subscribers = subscribers
+        self.count = 0
+        self.done = asyncio.Event()
+
+    def expect(self):
+        self.count = 0
+        self.done.clear()
+
+    def received(self):
+        self.count += 1
+        if self.count == self.subscribers:
+            self.done.set()
+
+
+async def feed_subscribers(store: TodoStore, subscribers: int, deliveries: Deliveries):
+    feed = ChangeFeed(keepalive=600)
+    since = store.collection_version()
+
+    async def subscriber():
+        async for _ in event_stream(AsyncTodoStore(store), feed, since, BUFFER):
+            deliveries.received()
+
+    tasks = [asyncio.create_task(subscriber()) for _ in range(subscribers)]
+
+    def write(title: str):
+        store.create(TodoCreate(title=title))
+        feed.notify()
+
+    return tasks, write
+
+
+async def queue_subscribers(store: TodoStore, subscribers: int, deliveries: Deliveries):
+    queues = [asyncio.Queue(maxsize=BUFFER) for _ in range(subscribers)]
+
+    async def subscriber(queue: asyncio.Queue):
+        while True:
+            await queue.get()
+            deliveries.received()
+
+    tasks = [asyncio.create_task(subscriber(queue)) for queue in queues]
+
+    def write(title: str):
+        todo = store.create(TodoCreate(title=title))
+        data = todo.model_dump_json().encode()
+        for queue in queues:
+            queue.put_nowait(data)
+
+    return tasks, write
+
+
+async def measure(setup, subscribers: int, writes: int):
+    store = TodoStore()
+    deliveries = Deliveries(subscribers)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks, write = await setup(store, subscribers, deliveries)
+    await asyncio.sleep(0.1)  # let every subscriber reach its first wait
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    write_ms, fanout_ms = [], []
+    for i in range(writes):
+        deliveries.expect()
+        start = time.perf_counter()
+        write(f"Todo {i}")
+        written = time.perf_counter()
+        await deliveries.done.wait()
+        write_ms.append((written - start) * 1000)
+        fanout_ms.append((time.perf_counter() - start) * 1000)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return memory, calculate_percentiles(write_ms), calculate_percentiles(fanout_ms)
+
+
+def run(subscriber_counts, writes: int):
+    print(f"Event fan-out, {writes} writes")
+    print("=" * 86)
+    print(
+        f"{'design':<14} {'subs':>6} {'KiB/sub':>8} {'write p50':>10} "
+        f"{'write p99':>10} {'fan-out p50':>12} {'fan-out p99':>12}"
+    )
+    for subscribers in subscriber_counts:
+        for name, setup in (
+            ("change feed", feed_subscribers),
+            ("queues", queue_subscribers),
+        ):
+            memory, write, fanout = asyncio.run(measure(setup, subscribers, writes))
+            print(
+                f"{name:<14} {subscribers:>6} {memory / subscribers / 1024:>8.2f} "
+                f"{write['median']:>8.3f}ms {write['p99']:>8.3f}ms "
+                f"{fanout['median']:>10.2f}ms {fanout['p99']:>10.2f}ms"
+            )
+
+
+def main():
+    """Run event fan-out benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--writes", type=int, default=100)
+    args = parser.parse_args()
+    run(args.subscribers, args.writes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark JSON list responses: response model path vs direct encoding.
+
+Serves 10k todos from an app holding only the todo router, plus one
+extra route that returns the models the way FastAPI routes do by default
+(``response_model`` validation and serialisation). The direct path is
+measured with each todo's cached encoding cold and warm.
+
+Usage:
+    python -m benchmarks.bench_json [--size N] [--iterations N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+from fastapi import FastAPI
+from benchmarks.asgi import call
+from src.api import todos
+from src.models.todo import TodoCreate, TodoResponse
+from src.storage.memory import get_todo_store
+
+
+def build_app(size: int) -> FastAPI:
+    app = FastAPI()
+    app.include_router(todos.router)
+
+    @app.get("/model/todos", response_model=List[TodoResponse])
+    async def list_todos_via_model():
+        return get_todo_store().list_all()
+
+    store = get_todo_store()
+    store.clear()
+    for i in range(size):
+        store.create(TodoCreate(title=f"Todo item {i}", completed=i % 3 == 0))
+    return app
+
+
+async def median_ms(app, path: str, iterations: int, cold: bool = False) -> float:
+    """Median GET latency in milliseconds; ``cold`` drops cached encodings."""
+    store = get_todo_store()
+    latencies = []
+    for _ in range(iterations):
+        if cold:
+            # Drop the encodings cached on each record
+            for record in store._todos.values():
+                record._json = None
+        start = time.perf_counter()
+        status, _, body = await call(app, "GET", path)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert status == 200, status
+    return statistics.median(latencies)
+
+
+async def run(size: int, iterations: int):
+    app = build_app(size)
+    results = [("response_model", await median_ms(app, "/model/todos", iterations))]
+    cold = await median_ms(app, "/todos", iterations, cold=True)
+    results.append(("direct, cold cache", cold))
+    results.append(("direct, warm cache", await median_ms(app, "/todos", iterations)))
+
+    print(f"GET /todos latency, {size:,} todos, median of {iterations}")
+    print("=" * 60)
+    baseline = results[0][1]
+    for name, latency in results:
+        print(f"{name:<32} {latency:>8.2f} ms {baseline / latency:>6.1f}x")
+
+
+def main():
+    """Run JSON response benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args.size, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
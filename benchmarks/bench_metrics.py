@@ -0,0 +1,95 @@
+"""Benchmark /metrics scrape cost as label combinations grow.
+
+Fills a private registry with counter and histogram series shaped like
+the request metrics, then times rendering the Prometheus text format,
+the OpenMetrics format, gzip compression, and a cached scrape.
+
+Usage:
+    python -m benchmarks.bench_metrics [--series 100 1000 10000]
+"""
+
+import argparse
+import functools
+import gzip
+import statistics
+import time
+from prometheus_client import CollectorRegistry, Counter, Histogram
+from prometheus_client.exposition import generate_latest
+from prometheus_client.openmetrics.exposition import (
+    generate_latest as generate_openmetrics,
+)
+from src.api.metrics import GZIP_LEVEL, ExpositionCache
+
+
+def build_registry(series: int) -> CollectorRegistry:
+    """A registry with ``series`` label sets on a counter and a histogram."""
+    registry = CollectorRegistry()
+    counter = Counter(
+        "http_requests_total", "Total", ["method", "path", "status"], registry=registry
+    )
+    histogram = Histogram(
+        "http_request_duration_seconds",
+        "Duration",
+        ["method", "path", "status"],
+        registry=registry,
+    )
+    for i in range(series):
+        labels = ("GET", f"/route/{i}", "200")
+        counter.labels(*labels).inc()
+        histogram.labels(*labels).observe(0.01)
+    return registry
+
+
+def median_ms(func, iterations: int) -> float:
+    """Median call time in milliseconds."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(series_counts, iterations: int):
+    print("Scrape cost, median (ms)")
+    print("=" * 78)
+    print(
+        f"{'series':>7} {'text':>9} {'openmetrics':>12} {'gzip':>8} "
+        f"{'cached':>8} {'raw KiB':>9} {'gzip KiB':>9}"
+    )
+    for series in series_counts:
+        registry = build_registry(series)
+        body = generate_latest(registry)
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+        # Bound with partial so each call uses this iteration's objects
+        render = functools.partial(generate_latest, registry)
+        cache = ExpositionCache(ttl=60)
+        cache.get("text", render)
+
+        text = median_ms(render, iterations)
+        openmetrics = median_ms(
+            functools.partial(generate_openmetrics, registry), iterations
+        )
+        gzipped = median_ms(
+            functools.partial(gzip.compress, body, compresslevel=GZIP_LEVEL),
+            iterations,
+        )
+        cached = median_ms(functools.partial(cache.get, "text", render), iterations)
+        print(
+            f"{series:>7} {text:>9.2f} {openmetrics:>12.2f} {gzipped:>8.2f} "
+            f"{cached:>8.4f} {len(body) / 1024:>9.1f} {len(compressed) / 1024:>9.1f}"
+        )
+
+
+def main():
+    """Run /metrics scrape benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    run(args.series, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
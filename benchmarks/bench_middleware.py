@@ -0,0 +1,75 @@
+"""Benchmark per-request overhead of the middleware stack.
+
+Sends the same requests to the full application and to an app with the
+same routes but no middleware, in-process, and reports the difference.
+Log lines are written to /dev/null.
+
+Usage:
+    python -m benchmarks.bench_middleware [--iterations N]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import time
+from fastapi import FastAPI
+from benchmarks.asgi import call
+from src.api import health, todos
+from src.main import app
+from src.models.todo import TodoCreate
+from src.storage.memory import get_todo_store
+
+PATHS = ("/health", "/todos/1")
+
+
+def bare_app() -> FastAPI:
+    """The application's routes without any middleware."""
+    bare = FastAPI()
+    bare.include_router(todos.router)
+    bare.include_router(health.router)
+    return bare
+
+
+async def median_latency(target, path: str, iterations: int) -> float:
+    """Median request latency in microseconds."""
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await call(target, "GET", path)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(latencies)
+
+
+async def run(iterations: int):
+    get_todo_store().create(TodoCreate(title="Benchmark"))
+    bare = bare_app()
+
+    results = []
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for path in PATHS:
+            # Warm up both apps before timing
+            await median_latency(app, path, 200)
+            await median_latency(bare, path, 200)
+            full = await median_latency(app, path, iterations)
+            none = await median_latency(bare, path, iterations)
+            results.append((path, none, full))
+
+    print("Per-request latency, median (µs)")
+    print("=" * 60)
+    print(f"{'path':<12} {'no middleware':>14} {'full stack':>11} {'overhead':>9}")
+    for path, none, full in results:
+        print(f"{path:<12} {none:>14.1f} {full:>11.1f} {full - none:>9.1f}")
+
+
+def main():
+    """Run middleware overhead benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark the overhead of the stack-sampling profiler.
+
+Drives GET /todos/{id} through the full application in-process for a
+fixed time, with the profiler off and sampling at each interval. The
+configurations are interleaved over several rounds and the median
+throughput of each is reported, along with the time one sample holds
+the GIL for. Log lines are written to /dev/null.
+
+Usage:
+    python -m benchmarks.bench_profiler [--seconds N] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import time
+from benchmarks.asgi import call
+from src.main import app
+from src.models.todo import TodoCreate
+from src.observability.profiler import StackSampler
+from src.storage.memory import get_todo_store
+
+INTERVALS_MS = (None, 10.0, 1.0)
+
+
+async def throughput(path: str, seconds: float) -> float:
+    """Requests per second over ``seconds``."""
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        await call(app, "GET", path)
+        count += 1
+    return count / seconds
+
+
+async def run(seconds: float, rounds: int):
+    todo = get_todo_store().create(TodoCreate(title="Benchmark"))
+    path = f"/todos/{todo.id}"
+
+    rates = {interval_ms: [] for interval_ms in INTERVALS_MS}
+    samples = {interval_ms: 0 for interval_ms in INTERVALS_MS}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        await throughput(path, 1.0)
+        for _ in range(rounds):
+            for interval_ms in INTERVALS_MS:
+                sampler = None
+                if interval_ms is not None:
+                    sampler = StackSampler(interval=interval_ms / 1000)
+                    sampler.start()
+                rates[interval_ms].append(await throughput(path, seconds))
+                if sampler is not None:
+                    sampler.stop()
+                    samples[interval_ms] += sampler.samples
+
+    results = [
+        (interval_ms, statistics.median(rates[interval_ms]), samples[interval_ms])
+        for interval_ms in INTERVALS_MS
+    ]
+    # Cost of one sample, taken while the app's threads exist
+    sampler = StackSampler()
+    start = time.perf_counter()
+    for _ in range(10_000):
+        sampler.sample()
+    per_sample_us = (time.perf_counter() - start) / 10_000 * 1_000_000
+
+    baseline = results[0][1]
+    print(f"GET /todos/{{id}} throughput, median of {rounds} x {seconds:g}s runs")
+    print("=" * 60)
+    print(f"{'profiler':<12} {'req/s':>10} {'overhead':>10} {'samples':>9}")
+    for interval_ms, rate, samples in results:
+        label = "off" if interval_ms is None else f"{interval_ms:g} ms"
+        overhead = (baseline - rate) / baseline * 100
+        print(f"{label:<12} {rate:>10,.0f} {overhead:>9.1f}% {samples:>9}")
+    print(f"\nOne sample: {per_sample_us:.1f} µs")
+
+
+def main():
+    """Run profiler overhead benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.seconds, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark memory per todo and read throughput of the in-memory store.
+
+Usage:
+    python -m benchmarks.bench_records [--size N]
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from src.models.todo import TodoCreate
+from src.storage.memory import TodoStore
+
+# Files whose allocations are the records themselves, as opposed to the
+# ID, status and title indexes
+RECORD_FILES = ("storage/memory.py", "storage/records.py")
+
+
+def build_store(size: int):
+    """Return (store, bytes per todo in total, bytes per todo in records)."""
+    # Titles are created up front so only the store's own structures count
+    todos = [TodoCreate(title=f"Todo {i}") for i in range(size)]
+    gc.collect()
+
+    tracemalloc.start()
+    store = TodoStore()
+    for todo in todos:
+        store.create(todo)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0]
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    records = sum(
+        stat.size
+        for stat in snapshot.statistics("filename")
+        if stat.traceback[0].filename.endswith(RECORD_FILES)
+    )
+    return store, used / size, records / size
+
+
+def per_second(func, count: int, repeat: int = 3) -> float:
+    """Items per second for ``func()`` producing ``count`` items, best of ``repeat``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def run(size: int):
+    store, bytes_per_todo, record_bytes = build_store(size)
+    rng = random.Random(0)
+    ids = [str(rng.randint(1, size)) for _ in range(100_000)]
+
+    def get_each():
+        for todo_id in ids:
+            store.get(todo_id)
+
+    def page_through():
+        after = None
+        while True:
+            _, after = store.list_page(1000, after)
+            if after is None:
+                break
+
+    results = [
+        ("get() x 100k", per_second(get_each, len(ids))),
+        ("list_all()", per_second(store.list_all, size)),
+        ("list_page(1000) over all", per_second(page_through, size)),
+    ]
+
+    print(f"In-memory store, {size:,} todos")
+    print("=" * 60)
+    print(f"{'store memory per todo':<28} {bytes_per_todo:>12.0f} bytes")
+    print(f"{'  of which records':<28} {record_bytes:>12.0f} bytes")
+    for name, rate in results:
+        print(f"{name:<28} {rate:>12,.0f} todos/s")
+
+
+def main():
+    """Run record layout benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run(args.size)
+
+
+if __name__ == "__main__":
+    main()
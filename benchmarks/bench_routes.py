@@ -0,0 +1,82 @@
+"""Benchmark read-route latency for GET /todos/{id} and GET /todos.
+
+Requests go straight to an app holding only the todo router, so the
+numbers reflect routing, storage and response encoding rather than
+middleware or network overhead.
+
+Usage:
+    python -m benchmarks.bench_routes [--size N] [--iterations N]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+from fastapi import FastAPI
+from perf_test import calculate_percentiles
+from benchmarks.asgi import call
+from src.api import todos
+from src.models.todo import TodoCreate
+from src.storage.memory import get_todo_store
+
+
+def build_app(size: int) -> FastAPI:
+    app = FastAPI()
+    app.include_router(todos.router)
+
+    store = get_todo_store()
+    store.clear()
+    for i in range(size):
+        store.create(TodoCreate(title=f"Todo item {i}", completed=i % 3 == 0))
+    return app
+
+
+async def measure(app, paths: List[str], query: str = ""):
+    latencies = []
+    for path in paths:
+        start = time.perf_counter()
+        status, _, _ = await call(app, "GET", path, query)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert status == 200, status
+    return latencies
+
+
+async def run(args):
+    app = build_app(args.size)
+    rng = random.Random(0)
+    ids = [str(rng.randint(1, args.size)) for _ in range(args.iterations)]
+
+    # Warm up (and fill any caches) before timing
+    for todo_id in ids[:100]:
+        await call(app, "GET", f"/todos/{todo_id}")
+    await call(app, "GET", "/todos")
+
+    cases = [
+        ("GET /todos/{id}", [f"/todos/{todo_id}" for todo_id in ids], ""),
+        ("GET /todos?limit=100", ["/todos"] * args.iterations, "limit=100"),
+        (f"GET /todos ({args.size} items)", ["/todos"] * args.list_iterations, ""),
+    ]
+    print(f"Read route latency, {args.size} todos")
+    print("=" * 60)
+    for name, paths, query in cases:
+        latencies = await measure(app, paths, query)
+        stats = calculate_percentiles(latencies)
+        print(
+            f"{name:<28} p50={stats['median']:.3f}ms p95={stats['p95']:.3f}ms "
+            f"p99={stats['p99']:.3f}ms"
+        )
+
+
+def main():
+    """Run read route benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=5_000)
+    parser.add_argument("--list-iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
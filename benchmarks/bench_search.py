@@ -0,0 +1,92 @@
+"""Benchmark title search latency and index memory overhead.
+
+Usage:
+    python -m benchmarks.bench_search [--sizes 100000 1000000] [--iterations N]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from perf_test import calculate_percentiles
+from src.models.todo import TodoCreate
+from src.storage.indexes import TitleIndex
+from src.storage.memory import TodoStore
+
+VERBS = ["購買", "繳交", "整理", "預約", "回覆", "準備", "Buy", "Review", "Call", "Fix"]
+OBJECTS = [
+    "牛奶",
+    "報告",
+    "房間",
+    "牙醫",
+    "郵件",
+    "簡報",
+    "milk",
+    "report",
+    "bug",
+    "plan",
+]
+QUERIES = ["牛奶", "購買牛奶", "報", "rep", "fix bug", "簡報 42", "不存在"]
+
+
+def make_title(rng: random.Random) -> str:
+    verb, first, second = rng.choice(VERBS), rng.choice(OBJECTS), rng.choice(OBJECTS)
+    return f"{verb}{first} {second} {rng.randint(1, 9999)}"
+
+
+def build_store(size: int):
+    """Return (store, seconds to build, bytes used by the title index)."""
+    rng = random.Random(size)
+    todos = [TodoCreate(title=make_title(rng)) for _ in range(size)]
+
+    store = TodoStore()
+    start = time.perf_counter()
+    for todo in todos:
+        store.create(todo)
+    build_seconds = time.perf_counter() - start
+
+    # Build a second title index under tracemalloc to isolate its footprint;
+    # titles are shared with the store, so only index structures are counted
+    tracemalloc.start()
+    index = TitleIndex()
+    for todo_id, todo in store._todos.items():
+        index.add(int(todo_id), todo.title)
+    index_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return store, build_seconds, index_bytes
+
+
+def main():
+    """Run search benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        store, build_seconds, index_bytes = build_store(size)
+        print(f"\n{size:,} todos")
+        print("=" * 60)
+        print(f"   insert incl. indexing: {build_seconds:.2f}s")
+        print(
+            f"   title index memory: {index_bytes / 2**20:.1f} MiB "
+            f"({index_bytes / size:.0f} bytes/todo)"
+        )
+
+        for query in QUERIES:
+            latencies = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                results = store.search(query, args.limit)
+                latencies.append((time.perf_counter() - start) * 1000)
+            stats = calculate_percentiles(latencies)
+            print(
+                f"   q={query!r:<12} hits={len(results):<3} "
+                f"p50: {stats['median']:.3f}ms  p95: {stats['p95']:.3f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
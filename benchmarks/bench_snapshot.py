@@ -0,0 +1,75 @@
+"""Benchmark write latency while large listings are being served.
+
+One thread calls ``list_all()`` on the in-memory store in a loop while
+the main thread times ``update()`` calls, spaced out so they land at
+random points of the listing. Latencies with no reader running are shown
+for comparison.
+
+Usage:
+    python -m benchmarks.bench_snapshot [--size N] [--writes N]
+"""
+
+import argparse
+import threading
+import time
+from perf_test import calculate_percentiles
+from src.models.todo import TodoCreate, TodoUpdate
+from src.storage.memory import TodoStore
+
+
+def time_writes(store: TodoStore, size: int, writes: int):
+    """Latencies of ``writes`` updates in milliseconds."""
+    latencies = []
+    for i in range(writes):
+        todo_id = str(i % size + 1)
+        start = time.perf_counter()
+        store.update(todo_id, TodoUpdate(completed=i % 2 == 0))
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.005)
+    return latencies
+
+
+def run(size: int, writes: int):
+    store = TodoStore()
+    store.create_many([TodoCreate(title=f"Todo item {i}") for i in range(size)])
+
+    idle = calculate_percentiles(time_writes(store, size, writes))
+
+    stop = threading.Event()
+    listings = 0
+
+    def list_forever():
+        nonlocal listings
+        while not stop.is_set():
+            store.list_all()
+            listings += 1
+
+    reader = threading.Thread(target=list_forever)
+    reader.start()
+    try:
+        busy = calculate_percentiles(time_writes(store, size, writes))
+    finally:
+        stop.set()
+        reader.join()
+
+    print(f"update() latency, {size:,} todos, {writes:,} writes")
+    print("=" * 60)
+    for name, stats in (("no reader", idle), ("during list_all()", busy)):
+        print(
+            f"{name:<18} p50={stats['median']:.3f}ms p99={stats['p99']:.3f}ms "
+            f"max={stats['max']:.3f}ms"
+        )
+    print(f"list_all() calls completed during the run: {listings}")
+
+
+def main():
+    """Run snapshot read/write benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--writes", type=int, default=300)
+    args = parser.parse_args()
+    run(args.size, args.writes)
+
+
+if __name__ == "__main__":
+    main()
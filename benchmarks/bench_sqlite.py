@@ -0,0 +1,77 @@
+"""Benchmark CRUD latency of the SQLite backend on a large database.
+
+Usage:
+    python -m benchmarks.bench_sqlite [--size N] [--iterations N]
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+from perf_test import calculate_percentiles
+from src.models.todo import TodoCreate, TodoUpdate
+from src.storage.sqlite import SQLiteTodoStore
+
+
+def populate(store: SQLiteTodoStore, size: int, batch: int = 50_000):
+    """Bulk-load ``size`` rows using batched transactions."""
+    rows = [("待辦事項 benchmark todo", False)] * batch
+    for start in range(0, size, batch):
+        with store.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO todos (title, completed) VALUES (?, ?)",
+                rows[: min(batch, size - start)],
+            )
+
+
+def measure(func, iterations: int):
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return calculate_percentiles(latencies)
+
+
+def main():
+    """Run SQLite CRUD benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=2_000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="bench-sqlite-")
+    try:
+        store = SQLiteTodoStore(f"{directory}/todos.db")
+        start = time.perf_counter()
+        populate(store, args.size)
+        print(f"Loaded {args.size:,} rows in {time.perf_counter() - start:.2f}s")
+        print("=" * 60)
+
+        todo = TodoCreate(title="Performance test")
+        update = TodoUpdate(completed=True)
+
+        def random_id() -> str:
+            return str(random.randint(1, args.size))
+
+        operations = {
+            "create": lambda: store.create(todo),
+            "get": lambda: store.get(random_id()),
+            "update": lambda: store.update(random_id(), update),
+            "delete": lambda: store.delete(random_id()),
+        }
+        for name, func in operations.items():
+            stats = measure(func, args.iterations)
+            print(
+                f"   {name:<7} p95: {stats['p95']:.3f}ms  "
+                f"p99: {stats['p99']:.3f}ms  mean: {stats['mean']:.3f}ms"
+            )
+
+        store.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Debug endpoints for in-process diagnostics."""
+
+import asyncio
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from src.config import Settings, get_settings
+from src.middleware.metrics import request_latencies
+from src.observability.profiler import StackSampler, collapse
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+# Reported percentiles, by response field name
+PERCENTILES = (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("p999", 0.999))
+
+# Only one profile runs at a time
+_profile_lock = asyncio.Lock()
+
+
+@router.get("/latency")
+async def latency_percentiles():
+    """
+    延遲百分位數端點
+
+    回傳最近時間窗口 (TODO_LATENCY_WINDOW 秒) 內，
+    各 method 與路由樣板的請求數及 p50 / p95 / p99 / p999 延遲 (毫秒)。
+    數值來自本行程的串流分位數草圖，相對誤差約 1%。
+    """
+    routes = []
+    for (method, route), sketch in sorted(request_latencies.snapshot().items()):
+        entry = {"method": method, "route": route, "count": sketch.count}
+        for name, q in PERCENTILES:
+            entry[name] = round(sketch.quantile(q) * 1000, 4)
+        routes.append(entry)
+
+    return {"window_seconds": request_latencies.window, "routes": routes}
+
+
+def require_admin(
+    x_admin_token: Optional[str] = Header(None),
+    settings: Settings = Depends(get_settings),
+) -> Settings:
+    """Reject the request unless profiling is enabled and the token matches."""
+    if not settings.profiler_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token.encode(), settings.profiler_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token"
+        )
+    return settings
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(5.0, gt=0),
+    interval_ms: float = Query(10.0, ge=1, le=1000),
+    settings: Settings = Depends(require_admin),
+):
+    """
+    取樣分析端點 (僅限管理者)
+
+    於指定秒數內，每 interval_ms 毫秒取樣一次所有執行緒
+    (事件迴圈與執行緒池) 的 Python 呼叫堆疊，
+    回傳可直接交給 flamegraph.pl / speedscope 的 collapsed stacks 文字。
+
+    預設關閉：需設定 TODO_PROFILER_TOKEN，並以 X-Admin-Token 標頭帶入；
+    同一時間只允許一個分析進行。
+    """
+    if seconds > settings.profiler_max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"seconds must be at most {settings.profiler_max_seconds:g}",
+        )
+    if _profile_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="A profile is already running"
+        )
+
+    async with _profile_lock:
+        sampler = StackSampler(interval=interval_ms / 1000)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            counts = await asyncio.to_thread(sampler.stop)
+
+    return PlainTextResponse(
+        collapse(counts),
+        headers={
+            "Content-Disposition": 'attachment; filename="profile.folded"',
+            "X-Profile-Samples": str(sampler.samples),
+        },
+    )
@@ -0,0 +1,184 @@
+"""Server-Sent Events feed of todo changes."""
+
+import asyncio
+from typing import AsyncIterator, Dict, Optional, Tuple
+from prometheus_client import Counter, Gauge
+from src.config import get_settings
+from src.storage.aio import AsyncTodoStore
+from src.storage.changes import ChangeBatch, ChangeEvent
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+todo_event_subscribers = Gauge(
+    "todo_event_subscribers", "Clients connected to /todos/events"
+)
+todo_event_disconnects_total = Counter(
+    "todo_event_disconnects_total",
+    "Event stream clients disconnected by the server",
+    ["reason"],
+)
+
+# Sent before closing a stream whose client must resync from a listing
+RESYNC_EVENT = (
+    b"event: resync\n"
+    b'data: {"detail":"Changes since the last event are no longer available"}\n\n'
+)
+# Comment line: keeps proxies from timing out idle streams
+KEEPALIVE = b": keepalive\n\n"
+
+
+def format_event(change: ChangeEvent) -> bytes:
+    """Format one change as an SSE event named after its operation.
+
+    The event ID is the change's sequence number, so a reconnecting
+    ``EventSource`` resumes from it through ``Last-Event-ID``.
+    """
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (
+        change.seq,
+        change.op.encode("ascii"),
+        change.data,
+    )
+
+
+class ChangeFeed:
+    """Wakes event stream subscribers when todos change.
+
+    Writers call ``notify``, which only schedules one wake-up on the event
+    loop however many clients are subscribed, and a burst of writes
+    coalesces into a single wake-up. Publishing therefore costs a writer
+    the same with ten subscribers or ten thousand and never waits on any
+    of them.
+
+    Subscribers read what they have not sent yet from the store's change
+    log through ``read``, which keeps each batch it formats until the next
+    wake-up: subscribers that are in step, normally all of them, share one
+    store read per wake-up. The feed also wakes subscribers every
+    ``keepalive`` seconds, so idle streams send keepalives and changes
+    written by other processes are picked up, without a timer per client.
+
+    A feed serves a single store.
+    """
+
+    def __init__(self, keepalive: float = 15.0):
+        self.keepalive = keepalive
+        self.subscribers = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event: Optional[asyncio.Event] = None
+        self._pending = False
+        self._ticker: Optional[asyncio.TimerHandle] = None
+        # Reads (formatted) started since the last wake-up, by (since, limit)
+        self._batches: Dict[Tuple[int, int], asyncio.Future] = {}
+
+    def waiter(self) -> asyncio.Event:
+        """Event set by the next wake-up.
+
+        Take it before reading changes, so a change made between the read
+        and the wait still wakes the caller.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._event = asyncio.Event()
+            self._ticker = None
+            self._batches.clear()
+        if self._ticker is None:
+            self._ticker = loop.call_later(self.keepalive, self._tick)
+        return self._event
+
+    async def read(
+        self, store: AsyncTodoStore, since: int, limit: int
+    ) -> Tuple[Optional[ChangeBatch], bytes]:
+        """``store.changes_json(since, limit)`` plus its changes as SSE events."""
+        key = (since, limit)
+        read = self._batches.get(key)
+        if read is None:
+            if store.inline:
+                # Completes without suspending, so nobody else can wait on it
+                read = asyncio.get_running_loop().create_future()
+                read.set_result(await self._read(store, since, limit))
+            else:
+                read = asyncio.ensure_future(self._read(store, since, limit))
+            self._batches[key] = read
+
+        if read.done():
+            return read.result()
+        # Shielded: a subscriber disconnecting must not cancel a shared read
+        return await asyncio.shield(read)
+
+    @staticmethod
+    async def _read(
+        store: AsyncTodoStore, since: int, limit: int
+    ) -> Tuple[Optional[ChangeBatch], bytes]:
+        batch = await store.changes_json(since, limit)
+        events = b""
+        if batch is not None:
+            events = b"".join(format_event(change) for change in batch.changes)
+        return batch, events
+
+    def notify(self):
+        """Wake every subscriber; never blocks, and may be called from any thread."""
+        loop = self._loop
+        if loop is None or self._pending:
+            return
+
+        self._pending = True
+        try:
+            loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            # The loop subscribers ran on is closed
+            self._pending = False
+
+    def _wake(self):
+        # Cleared before waking, so a write that still sees it set is
+        # already visible to the reads this wake-up starts
+        self._pending = False
+        self._batches.clear()
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+    def _tick(self):
+        # Restarted by the next waiter() call, i.e. while anyone listens
+        self._ticker = None
+        if self.subscribers:
+            self._wake()
+
+
+async def event_stream(
+    store: AsyncTodoStore, feed: ChangeFeed, since: int, buffer: int
+) -> AsyncIterator[bytes]:
+    """Stream the store's changes after ``since`` as SSE events.
+
+    Each read takes at most ``buffer`` changes: a client that falls further
+    behind (because it reads slowly or the retained log moved past it) is
+    sent a ``resync`` event and disconnected, so it holds at most one
+    batch. A wake-up that brings no new changes sends a keepalive comment.
+    """
+    feed.subscribers += 1
+    todo_event_subscribers.inc()
+    try:
+        woken = False
+        while True:
+            wake = feed.waiter()
+            batch, events = await feed.read(store, since, buffer)
+            if batch is None or batch.has_more:
+                todo_event_disconnects_total.labels(
+                    reason="resync" if batch is None else "slow"
+                ).inc()
+                yield RESYNC_EVENT
+                return
+
+            if events:
+                yield events
+                since = batch.next_since
+            elif woken:
+                yield KEEPALIVE
+
+            await wake.wait()
+            woken = True
+    finally:
+        feed.subscribers -= 1
+        todo_event_subscribers.dec()
+
+
+# Global instance notified by the write endpoints
+change_feed = ChangeFeed(keepalive=get_settings().events_keepalive)
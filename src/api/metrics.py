@@ -1,13 +1,134 @@
 """Metrics endpoint for Prometheus."""
 
-from fastapi import APIRouter, Response
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+import gzip
+import os
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from fastapi import APIRouter, Header, Response
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess
+from prometheus_client.exposition import choose_encoder
+from src.config import get_settings
 
 router = APIRouter(tags=["metrics"])
 
+GZIP_LEVEL = 6
+
+
+def multiprocess_dir() -> Optional[str]:
+    """
+    Return the shared metrics directory when running in multi-process mode.
+
+    prometheus_client decides at import time, from PROMETHEUS_MULTIPROC_DIR,
+    whether metric values live in this process or in per-process files in
+    that directory, so the same variable selects the mode here.
+    """
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or os.environ.get(
+        "prometheus_multiproc_dir"
+    )
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Registry to expose: this process's, or every worker's combined."""
+    if multiprocess_dir() is None:
+        return REGISTRY
+
+    # Aggregate the value files written by every worker at scrape time
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def mark_process_dead():
+    """Drop this worker's live gauge files on shutdown (multi-process mode)."""
+    if multiprocess_dir() is not None:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Check whether an ``Accept-Encoding`` header allows gzip."""
+    for coding in (accept_encoding or "").lower().split(","):
+        name, *params = coding.split(";")
+        if name.strip() not in ("gzip", "*"):
+            continue
+
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        return quality > 0
+    return False
+
+
+class ExpositionCache:
+    """Rendered scrape bodies, reused for ``ttl`` seconds.
+
+    Entries are keyed by output variant (format and compression), so
+    scrapers negotiating different formats do not evict each other. With
+    a ``ttl`` of 0 every call renders.
+    """
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: Dict[Hashable, Tuple[float, bytes]] = {}
+
+    def get(self, key: Hashable, render: Callable[[], bytes]) -> bytes:
+        """Return the cached body for ``key``, rendering it when stale."""
+        if self.ttl <= 0:
+            return render()
+
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        body = render()
+        self._entries[key] = (now + self.ttl, body)
+        return body
+
+
+_cache: Optional[ExpositionCache] = None
+
+
+def exposition_cache() -> ExpositionCache:
+    """Get the process-wide scrape cache, configured from settings."""
+    global _cache
+    if _cache is None:
+        _cache = ExpositionCache(get_settings().metrics_cache_ttl)
+    return _cache
+
+
+def render_metrics(
+    accept: Optional[str], accept_encoding: Optional[str]
+) -> Tuple[bytes, Dict[str, str]]:
+    """Render (or reuse) the exposition negotiated by the request headers."""
+    encoder, content_type = choose_encoder(accept)
+    cache = exposition_cache()
+
+    def render() -> bytes:
+        return cache.get(content_type, lambda: encoder(metrics_registry()))
+
+    headers = {"Content-Type": content_type, "Vary": "Accept, Accept-Encoding"}
+    if not accepts_gzip(accept_encoding):
+        return render(), headers
+
+    headers["Content-Encoding"] = "gzip"
+    body = cache.get(
+        (content_type, "gzip"),
+        lambda: gzip.compress(render(), compresslevel=GZIP_LEVEL),
+    )
+    return body, headers
+
 
 @router.get("/metrics")
-async def metrics():
+async def metrics(
+    accept: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
     """
     Prometheus 指標端點
 
@@ -16,8 +137,13 @@ async def metrics():
     - http_request_duration_seconds: HTTP 請求延遲分布
 
     指標使用低基數標籤 (method, path, status) 避免高基數問題。
+    設定 PROMETHEUS_MULTIPROC_DIR 以多 worker 執行時，回傳所有 worker 的彙總值。
+
+    依 `Accept` 標頭回傳 Prometheus 文字格式或 OpenMetrics 格式，
+    `Accept-Encoding` 包含 gzip 時回傳壓縮內容；
+    設定 TODO_METRICS_CACHE_TTL 可在指定秒數內重用已產生的內容。
     """
-    # Generate Prometheus metrics in text format
-    metrics_output = generate_latest()
+    # Generate Prometheus metrics in the negotiated format
+    body, headers = render_metrics(accept, accept_encoding)
 
-    return Response(content=metrics_output, media_type=CONTENT_TYPE_LATEST)
+    return Response(content=body, headers=headers)
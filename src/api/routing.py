@@ -0,0 +1,60 @@
+"""Route class that splits request time into stages for Server-Timing."""
+
+import asyncio
+import functools
+import time
+from typing import Callable
+from fastapi import Request
+from fastapi.routing import APIRoute
+from starlette.responses import Response
+from src.observability.timing import PARSE, SERIALIZE, current_timer
+
+
+def timed_endpoint(endpoint: Callable) -> Callable:
+    """Wrap an async endpoint to mark where parsing ends and serialising starts."""
+    if not asyncio.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        timer = current_timer()
+        if timer is None:
+            return await endpoint(*args, **kwargs)
+
+        timer.add(PARSE, time.perf_counter() - timer.route_start)
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            timer.handler_end = time.perf_counter()
+
+    return wrapper
+
+
+class TimedRoute(APIRoute):
+    """APIRoute recording parse and serialize stages for timed requests.
+
+    Parse covers reading the body, Pydantic validation and dependencies,
+    up to the endpoint being called; serialize covers everything after it
+    returns until the response object is built (response model
+    validation and JSON encoding).
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            timer = current_timer()
+            if timer is None:
+                return await handler(request)
+
+            timer.route_start = time.perf_counter()
+            timer.handler_end = 0.0
+            response = await handler(request)
+            if timer.handler_end:
+                timer.add(SERIALIZE, time.perf_counter() - timer.handler_end)
+            return response
+
+        return timed_handler
@@ -1,59 +1,515 @@
 """Todo API endpoints."""
 
-from typing import List
-from fastapi import APIRouter, HTTPException, status
-from src.models.todo import TodoCreate, TodoUpdate, TodoResponse
+import base64
+import binascii
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from src.api.events import EVENT_STREAM_MEDIA_TYPE, change_feed, event_stream
+from src.api.routing import TimedRoute
+from src.config import Settings, get_settings
+from src.models.todo import (
+    TodoBulkCreate,
+    TodoBulkDelete,
+    TodoBulkResponse,
+    TodoBulkResult,
+    TodoBulkUpdate,
+    TodoChanges,
+    TodoCreate,
+    TodoResponse,
+    TodoUpdate,
+)
+from src.storage.encoding import (
+    encode_array,
+    encode_bulk_results,
+    encode_changes,
+    encode_todo,
+)
+from src.storage.aio import AsyncTodoStore, get_async_store, get_store_executor
 from src.storage.memory import get_todo_store
 
-router = APIRouter(prefix="/todos", tags=["todos"])
+router = APIRouter(prefix="/todos", tags=["todos"], route_class=TimedRoute)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_SEARCH_LIMIT = 50
+DEFAULT_CHANGES_LIMIT = 1000
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_BATCH_SIZE = 1000
+
+
+# Todo IDs and sequence numbers are 64-bit signed integers
+MAX_NUMBER = 2**63 - 1
+
+
+def parse_number(value: str) -> Optional[int]:
+    """Parse a decimal ID or sequence number sent by a client.
+
+    Returns None unless ``value`` is plain ASCII digits within 64 bits, so
+    callers never hand ``int()`` non-ASCII digits or unbounded input.
+    """
+    if not (value.isascii() and value.isdigit()) or len(value) > 19:
+        return None
+    number = int(value)
+    return number if number <= MAX_NUMBER else None
+
+
+def encode_cursor(after_id: str) -> str:
+    """Encode the last ID of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(after_id.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Decode a cursor back to the ID it points after."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after_id = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        after_id = ""
+
+    if parse_number(after_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return after_id
+
+
+def make_etag(version: int) -> str:
+    """Build a strong ETag from a store version."""
+    return f'"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def accepts_media_type(accept: Optional[str], media_type: str) -> bool:
+    """Check whether an ``Accept`` header names ``media_type`` with q > 0.
+
+    Media ranges are compared in full, case-insensitively, ignoring their
+    parameters, so ``application/x-ndjson-foo`` does not match
+    ``application/x-ndjson``; wildcards do not select it either.
+    """
+    if not accept:
+        return False
+    for media_range in accept.split(","):
+        name, *params = media_range.split(";")
+        if name.strip().lower() != media_type:
+            continue
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def not_modified(etag: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Answer a conditional GET whose ETag still matches."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, **(headers or {})},
+    )
+
+
+def json_response(
+    body: bytes,
+    headers: Optional[Dict[str, str]] = None,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """Send already-encoded JSON, skipping response model validation.
+
+    Read routes get their bodies from the store's ``*_json`` methods, which
+    cache each todo's encoding, and write routes encode the store's result
+    directly when ``response_encoding`` is "direct"; ``response_model`` is
+    still declared on every route so the OpenAPI schema is unchanged.
+    """
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def todo_response(
+    settings: Settings, todo: TodoResponse, status_code: int = status.HTTP_200_OK
+) -> Union[TodoResponse, Response]:
+    """Return a written todo, encoded directly if ``response_encoding`` says so.
+
+    By default the todo is returned as is, for FastAPI to validate and
+    serialise through the route's ``response_model``; both paths produce
+    the same bytes.
+    """
+    if settings.response_encoding != "direct":
+        return todo
+    return json_response(
+        encode_todo(todo.id, todo.title, todo.completed), status_code=status_code
+    )
+
+
+def bulk_response(
+    settings: Settings,
+    results: List[Tuple[str, int, Optional[TodoResponse]]],
+    status_code: int = status.HTTP_200_OK,
+) -> Union[TodoBulkResponse, Response]:
+    """Return ``(id, status, todo)`` bulk results like ``todo_response``."""
+    if settings.response_encoding == "direct":
+        return json_response(encode_bulk_results(results), status_code=status_code)
+    return TodoBulkResponse(
+        results=[
+            TodoBulkResult(id=todo_id, status=code, todo=todo)
+            for todo_id, code, todo in results
+        ]
+    )
+
+
+async def ndjson_chunks(completed: Optional[bool]) -> AsyncIterator[bytes]:
+    """Yield the todo collection as NDJSON, one chunk per store batch."""
+    # Not timed: the stream outlives the request
+    store = AsyncTodoStore(get_todo_store(), get_store_executor())
+    async for batch in store.scan_json(completed, STREAM_BATCH_SIZE):
+        yield b"\n".join(batch) + b"\n"
 
 
 @router.post("", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
-async def create_todo(todo: TodoCreate):
+async def create_todo(todo: TodoCreate, settings: Settings = Depends(get_settings)):
     """
     建立新的待辦事項
 
     - **title**: 待辦事項標題 (1-200字元)
     - **completed**: 完成狀態 (預設為 false)
     """
-    store = get_todo_store()
-    return store.create(todo)
+    store = get_async_store()
+    created = await store.create(todo)
+    change_feed.notify()
+    return todo_response(settings, created, status.HTTP_201_CREATED)
+
+
+@router.get(
+    "",
+    response_model=List[TodoResponse],
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def list_todos(
+    request: Request,
+    limit: Optional[int] = Query(
+        None, ge=1, le=MAX_PAGE_SIZE, description="每頁筆數 (1-1000)"
+    ),
+    cursor: Optional[str] = Query(None, description="上一頁回傳的分頁游標"),
+    completed: Optional[bool] = Query(None, description="依完成狀態篩選"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    取得待辦事項清單
+
+    - **limit**: 每頁筆數 (選填，提供 cursor 時預設為 100)
+    - **cursor**: 分頁游標，取自上一頁回應的 `Link` / `X-Next-Cursor` 標頭
+    - **completed**: 只回傳指定完成狀態的待辦事項 (選填)
+
+    未提供 limit 與 cursor 時回傳所有待辦事項，若無待辦事項則回傳空陣列。
+    分頁時依 ID 排序，若還有下一頁，回應會帶有 `rel="next"` 的 `Link` 標頭。
+
+    取得全部待辦事項時，若請求帶有 `Accept: application/x-ndjson`，
+    會以串流方式每行回傳一筆 JSON，適合匯出或同步大量資料。
+    因回應格式取決於 `Accept`，取得全部待辦事項的回應都帶有 `Vary: Accept`。
+
+    JSON 回應帶有 `ETag` 標頭 (清單內任何待辦事項變更時都會改變)，
+    請求帶上相同值的 `If-None-Match` 時回傳 304 Not Modified。
+    """
+    store = get_async_store()
+    full_listing = limit is None and cursor is None
+    # The full listing is NDJSON or a JSON array depending on Accept, so
+    # caches must key both it and its 304s on that header
+    vary = {"Vary": "Accept"} if full_listing else {}
+    if full_listing and accepts_media_type(
+        request.headers.get("accept"), NDJSON_MEDIA_TYPE
+    ):
+        return StreamingResponse(
+            ndjson_chunks(completed), media_type=NDJSON_MEDIA_TYPE, headers=vary
+        )
+
+    after = decode_cursor(cursor) if cursor else None
+
+    # Read the version before the data: the body is then at least as new as
+    # the ETag, so a later match can never hide a newer body
+    etag = make_etag(await store.collection_version())
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, vary)
+
+    if full_listing:
+        body = encode_array(await store.list_all_json(completed))
+        return json_response(body, {"ETag": etag, **vary})
+
+    limit = limit or DEFAULT_PAGE_SIZE
+    todos, next_after = await store.list_page_json(limit, after, completed)
+
+    headers = {"ETag": etag}
+    if next_after is not None:
+        next_cursor = encode_cursor(next_after)
+        next_url = request.url.include_query_params(limit=limit, cursor=next_cursor)
+        headers["Link"] = f'<{next_url}>; rel="next"'
+        headers["X-Next-Cursor"] = next_cursor
+
+    return json_response(encode_array(todos), headers)
+
+
+@router.get("/search", response_model=List[TodoResponse])
+async def search_todos(
+    q: str = Query(..., min_length=1, max_length=200, description="搜尋關鍵字"),
+    limit: int = Query(
+        DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_PAGE_SIZE, description="最多回傳筆數"
+    ),
+):
+    """
+    搜尋待辦事項標題
+
+    - **q**: 搜尋關鍵字，多個關鍵字以空白分隔，需全部符合
+    - **limit**: 最多回傳筆數 (預設 50)
+
+    英文等以空白分詞的文字以字首比對 (例如 `mil` 可找到 `milk`)，
+    中日韓文字以子字串比對 (例如 `牛奶` 可找到 `購買牛奶`)。結果依 ID 排序。
+    """
+    store = get_async_store()
+    return json_response(encode_array(await store.search_json(q, limit)))
+
+
+@router.get(
+    "/changes",
+    response_model=TodoChanges,
+    responses={status.HTTP_410_GONE: {"description": "變更已超出保留範圍，需重新同步"}},
+)
+async def list_changes(
+    since: int = Query(..., ge=0, description="上次同步取得的變更序號"),
+    limit: int = Query(
+        DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_PAGE_SIZE, description="最多回傳筆數"
+    ),
+):
+    """
+    取得指定序號之後的變更 (差異同步)
+
+    - **since**: 上次同步取得的變更序號
+    - **limit**: 最多回傳筆數 (預設 1000)
 
+    每次寫入都會產生一個遞增的變更序號，即集合版本 (`GET /todos` 回應的
+    `ETag` 去掉引號後的值)。首次同步先取得完整清單並記下其 `ETag`，
+    之後以 `since` 取得其後的變更，並以回應的 `next_since` 作為下次的 `since`；
+    `has_more` 為 true 時請立即再取下一批。
 
-@router.get("", response_model=List[TodoResponse])
-async def list_todos():
+    變更依序號排序，同一批次內同一待辦事項只回傳最後一次變更；
+    刪除以 `deleted: true` 表示。伺服器只保留最近的變更
+    (`TODO_CHANGE_RETENTION` 筆)，`since` 已超出保留範圍 (或伺服器重新啟動、
+    資料被清空) 時回傳 410 Gone，用戶端需重新取得完整清單。
     """
-    取得所有待辦事項清單
+    store = get_async_store()
+    batch = await store.changes_json(since, limit)
+    if batch is None:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=(
+                "Changes since this sequence are no longer available; "
+                "resync required"
+            ),
+        )
+
+    return json_response(
+        encode_changes(
+            (change.data for change in batch.changes), batch.next_since, batch.has_more
+        )
+    )
+
 
-    回傳所有待辦事項，若無待辦事項則回傳空陣列。
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {EVENT_STREAM_MEDIA_TYPE: {}}},
+        status.HTTP_410_GONE: {"description": "變更已超出保留範圍，需重新同步"},
+    },
+)
+async def stream_events(
+    since: Optional[int] = Query(None, ge=0, description="從此變更序號之後開始推送"),
+    last_event_id: Optional[str] = Header(None),
+):
     """
-    store = get_todo_store()
-    return store.list_all()
+    以 Server-Sent Events 推送待辦事項變更
+
+    - **since**: 從此變更序號之後開始推送 (選填，預設只推送連線後的新變更)
+
+    每次新增、更新、刪除各推送一個事件，事件名稱為 `create`、`update` 或 `delete`，
+    `data` 格式同 `GET /todos/changes` 的單筆變更，事件 `id` 為變更序號；
+    瀏覽器 `EventSource` 斷線重連時會帶上 `Last-Event-ID`，從中斷處繼續推送。
+
+    用戶端落後超過 `TODO_EVENTS_BUFFER` 筆變更時 (讀取太慢或變更已超出保留範圍)，
+    伺服器會送出 `resync` 事件並關閉連線，用戶端需重新取得清單後再連線；
+    連線時 `since` 已無法接續則直接回傳 410 Gone。
+    """
+    settings = get_settings()
+    # Not timed: the stream outlives the request
+    store = AsyncTodoStore(get_todo_store(), get_store_executor())
+    if last_event_id is not None:
+        since = parse_number(last_event_id)
+        if since is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid Last-Event-ID",
+            )
+    elif since is None:
+        since = await store.collection_version()
+
+    batch = await store.changes_json(since, settings.events_buffer)
+    if batch is None or batch.has_more:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=(
+                "Changes since this sequence are no longer available; "
+                "resync required"
+            ),
+        )
+
+    return StreamingResponse(
+        event_stream(store, change_feed, since, settings.events_buffer),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        # Ask proxies not to buffer or transform the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/bulk", response_model=TodoBulkResponse, status_code=status.HTTP_201_CREATED
+)
+async def bulk_create_todos(
+    body: TodoBulkCreate, settings: Settings = Depends(get_settings)
+):
+    """
+    批次建立待辦事項
+
+    - **items**: 待建立的待辦事項 (1-1000 筆，格式同 `POST /todos`)
+
+    整批驗證後一次寫入，任一筆驗證失敗則整批回傳 422 且不建立任何資料。
+    結果依請求順序排列。
+    """
+    store = get_async_store()
+    created = await store.create_many(body.items)
+    change_feed.notify()
+    return bulk_response(
+        settings,
+        [(todo.id, status.HTTP_201_CREATED, todo) for todo in created],
+        status.HTTP_201_CREATED,
+    )
+
+
+@router.patch("/bulk", response_model=TodoBulkResponse)
+async def bulk_update_todos(
+    body: TodoBulkUpdate, settings: Settings = Depends(get_settings)
+):
+    """
+    批次更新待辦事項
+
+    - **items**: 每筆包含 **id** 及要更新的 **title** / **completed** (1-1000 筆)
+
+    每筆結果各自帶有狀態碼：成功為 200，待辦事項不存在為 404。
+    結果依請求順序排列。
+    """
+    store = get_async_store()
+    updated = await store.update_many(
+        [
+            (item.id, TodoUpdate(title=item.title, completed=item.completed))
+            for item in body.items
+        ]
+    )
+    change_feed.notify()
+    return bulk_response(
+        settings,
+        [
+            (
+                item.id,
+                status.HTTP_200_OK if todo else status.HTTP_404_NOT_FOUND,
+                todo,
+            )
+            for item, todo in zip(body.items, updated, strict=True)
+        ],
+    )
+
+
+@router.delete("/bulk", response_model=TodoBulkResponse)
+async def bulk_delete_todos(
+    body: TodoBulkDelete, settings: Settings = Depends(get_settings)
+):
+    """
+    批次刪除待辦事項
+
+    - **ids**: 待刪除的待辦事項識別碼 (1-1000 筆)
+
+    每筆結果各自帶有狀態碼：成功刪除為 204，待辦事項不存在為 404。
+    結果依請求順序排列。
+    """
+    store = get_async_store()
+    deleted = await store.delete_many(body.ids)
+    change_feed.notify()
+    return bulk_response(
+        settings,
+        [
+            (
+                todo_id,
+                status.HTTP_204_NO_CONTENT if ok else status.HTTP_404_NOT_FOUND,
+                None,
+            )
+            for todo_id, ok in zip(body.ids, deleted, strict=True)
+        ],
+    )
 
 
 @router.get("/{todo_id}", response_model=TodoResponse)
-async def get_todo(todo_id: str):
+async def get_todo(todo_id: str, if_none_match: Optional[str] = Header(None)):
     """
     取得單一待辦事項
 
     - **todo_id**: 待辦事項唯一識別碼
 
     若待辦事項不存在，回傳 404 錯誤。
+    回應帶有 `ETag` 標頭，請求帶上相同值的 `If-None-Match` 時回傳 304 Not Modified。
     """
-    store = get_todo_store()
-    todo = store.get(todo_id)
-
-    if todo is None:
+    store = get_async_store()
+    # One call, so the ETag and the body describe the same write
+    found = await store.get_versioned_json(todo_id)
+    if found is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Todo with id '{todo_id}' not found",
         )
 
-    return todo
+    version, todo = found
+    etag = make_etag(version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return json_response(todo, {"ETag": etag})
 
 
 @router.put("/{todo_id}", response_model=TodoResponse)
-async def update_todo(todo_id: str, todo_update: TodoUpdate):
+async def update_todo(
+    todo_id: str,
+    todo_update: TodoUpdate,
+    settings: Settings = Depends(get_settings),
+):
     """
     更新待辦事項
 
@@ -63,16 +519,17 @@ async def update_todo(todo_id: str, todo_update: TodoUpdate):
 
     若待辦事項不存在，回傳 404 錯誤。
     """
-    store = get_todo_store()
-    updated_todo = store.update(todo_id, todo_update)
+    store = get_async_store()
+    updated_todo = await store.update(todo_id, todo_update)
 
     if updated_todo is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Todo with id '{todo_id}' not found",
         )
+    change_feed.notify()
 
-    return updated_todo
+    return todo_response(settings, updated_todo)
 
 
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -85,13 +542,14 @@ async def delete_todo(todo_id: str):
     若待辦事項不存在，回傳 404 錯誤。
     成功刪除回傳 204 No Content。
     """
-    store = get_todo_store()
-    deleted = store.delete(todo_id)
+    store = get_async_store()
+    deleted = await store.delete(todo_id)
 
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Todo with id '{todo_id}' not found",
         )
+    change_feed.notify()
 
     return None
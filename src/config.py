@@ -0,0 +1,135 @@
+"""Application settings loaded from environment variables."""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+def _env_str(name: str, default: str) -> str:
+    return os.environ.get(name, default)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime settings for the TODO API.
+
+    Every field maps to a ``TODO_*`` environment variable so deployments
+    can be configured without code changes.
+    """
+
+    # Storage backend: "memory" (default), "striped", "wal" or "sqlite"
+    storage_backend: str = "memory"
+    data_dir: str = "data"
+
+    # Striped memory store: number of lock stripes
+    storage_stripes: int = 16
+
+    # SQLite: maximum number of pooled connections
+    sqlite_pool_size: int = 4
+
+    # Threads that run calls to blocking backends ("wal", "sqlite") off
+    # the event loop
+    store_workers: int = 8
+
+    # Write-ahead log: fsync policy is "always", "batch" or "interval"
+    wal_fsync_policy: str = "always"
+    wal_fsync_interval: float = 1.0
+    wal_snapshot_every: int = 100_000
+
+    # Delta sync (/todos/changes): number of most recent changes kept
+    change_retention: int = 10_000
+
+    # /todos/events: changes a client may fall behind before it is
+    # disconnected, and idle seconds between keepalive comments
+    events_buffer: int = 1000
+    events_keepalive: float = 15.0
+
+    # Log output: "sync" prints each line as it is logged, "async" queues
+    # lines for a background writer; a full queue drops or blocks
+    log_sink: str = "sync"
+    log_queue_size: int = 10_000
+    log_batch_size: int = 256
+    log_queue_full_policy: str = "drop"
+
+    # Log sampling: successful requests are sampled per route down to about
+    # this many lines per second (0 logs every request); errors and
+    # requests slower than log_slow_ms are always logged
+    log_sample_target: float = 0.0
+    log_slow_ms: float = 500.0
+
+    # /metrics: seconds a rendered scrape is reused (0 renders every time)
+    metrics_cache_ttl: float = 0.0
+
+    # /debug/latency: seconds of request latencies the percentiles cover
+    latency_window: float = 60.0
+
+    # /debug/profile: disabled unless an admin token is set; requests must
+    # send it in X-Admin-Token and may profile for at most this many seconds
+    profiler_token: str = ""
+    profiler_max_seconds: float = 60.0
+
+    # Write route responses (create, update, bulk): "model" serialises them
+    # through the route's response_model, "direct" encodes them straight to
+    # JSON bytes, skipping validation. Reads always send cached encodings
+    response_encoding: str = "model"
+
+    # Server-Timing stage breakdown: "off", "request" (only for requests
+    # sending X-Server-Timing) or "always"
+    server_timing: str = "off"
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from ``TODO_*`` environment variables."""
+        return cls(
+            storage_backend=_env_str("TODO_STORAGE_BACKEND", cls.storage_backend),
+            data_dir=_env_str("TODO_DATA_DIR", cls.data_dir),
+            storage_stripes=_env_int("TODO_STORAGE_STRIPES", cls.storage_stripes),
+            sqlite_pool_size=_env_int("TODO_SQLITE_POOL_SIZE", cls.sqlite_pool_size),
+            store_workers=_env_int("TODO_STORE_WORKERS", cls.store_workers),
+            wal_fsync_policy=_env_str("TODO_WAL_FSYNC_POLICY", cls.wal_fsync_policy),
+            wal_fsync_interval=_env_float(
+                "TODO_WAL_FSYNC_INTERVAL", cls.wal_fsync_interval
+            ),
+            wal_snapshot_every=_env_int(
+                "TODO_WAL_SNAPSHOT_EVERY", cls.wal_snapshot_every
+            ),
+            change_retention=_env_int("TODO_CHANGE_RETENTION", cls.change_retention),
+            events_buffer=_env_int("TODO_EVENTS_BUFFER", cls.events_buffer),
+            events_keepalive=_env_float("TODO_EVENTS_KEEPALIVE", cls.events_keepalive),
+            log_sink=_env_str("TODO_LOG_SINK", cls.log_sink),
+            log_queue_size=_env_int("TODO_LOG_QUEUE_SIZE", cls.log_queue_size),
+            log_batch_size=_env_int("TODO_LOG_BATCH_SIZE", cls.log_batch_size),
+            log_queue_full_policy=_env_str(
+                "TODO_LOG_QUEUE_FULL_POLICY", cls.log_queue_full_policy
+            ),
+            log_sample_target=_env_float(
+                "TODO_LOG_SAMPLE_TARGET", cls.log_sample_target
+            ),
+            log_slow_ms=_env_float("TODO_LOG_SLOW_MS", cls.log_slow_ms),
+            metrics_cache_ttl=_env_float(
+                "TODO_METRICS_CACHE_TTL", cls.metrics_cache_ttl
+            ),
+            latency_window=_env_float("TODO_LATENCY_WINDOW", cls.latency_window),
+            profiler_token=_env_str("TODO_PROFILER_TOKEN", cls.profiler_token),
+            profiler_max_seconds=_env_float(
+                "TODO_PROFILER_MAX_SECONDS", cls.profiler_max_seconds
+            ),
+            response_encoding=_env_str("TODO_RESPONSE_ENCODING", cls.response_encoding),
+            server_timing=_env_str("TODO_SERVER_TIMING", cls.server_timing),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance."""
+    return Settings.from_env()
@@ -1,28 +1,48 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from src.middleware.request_id import RequestIDMiddleware
-from src.middleware.logging import LoggingMiddleware
+from src.middleware.logging import LoggingMiddleware, log_sink
 from src.middleware.metrics import MetricsMiddleware
-from src.api import todos, health, metrics
+from src.middleware.server_timing import ServerTimingMiddleware
+from src.api import todos, health, metrics, debug
+from src.api.metrics import mark_process_dead
+from src.storage.aio import shutdown_store_executor
+from src.storage.memory import get_todo_store
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Flush and close the todo store and the log sink on shutdown."""
+    yield
+    shutdown_store_executor()
+    get_todo_store().close()
+    if log_sink is not None:
+        log_sink.close()
+    mark_process_dead()
+
 
 # Create FastAPI application
 app = FastAPI(
     title="TODO API",
     description="具備可觀測性的 RESTful API 待辦事項系統",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Register middleware (order matters: last added = first executed)
-# Execution order: Metrics -> Logging -> RequestID -> Routes
+# Execution order: ServerTiming -> RequestID -> Logging -> Metrics -> Routes
 app.add_middleware(MetricsMiddleware)
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(RequestIDMiddleware)
+app.add_middleware(ServerTimingMiddleware)
 
 # Register routers
 app.include_router(todos.router)
 app.include_router(health.router)
 app.include_router(metrics.router)
+app.include_router(debug.router)
 
 
 @app.get("/")
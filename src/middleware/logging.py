@@ -1,55 +1,97 @@
 """Structured logging middleware."""
 
 import time
+from typing import Optional
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.config import Settings, get_settings
+from src.middleware.metrics import route_template
+from src.observability.log_sink import AsyncLogSink
+from src.observability.sampling import AdaptiveSampler
 
-# Configure structlog
-structlog.configure(
-    processors=[
+
+def configure_logging(settings: Settings) -> Optional[AsyncLogSink]:
+    """Configure structlog; returns the background sink if one is used.
+
+    Context, level and timestamp are always added by the caller, since they
+    describe the moment of logging. With the async sink, JSON rendering and
+    the write happen on the sink's thread instead.
+    """
+    processors = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-    logger_factory=structlog.PrintLoggerFactory(),
-)
+    ]
+
+    if settings.log_sink == "sync":
+        structlog.configure(
+            processors=[*processors, structlog.processors.JSONRenderer()],
+            logger_factory=structlog.PrintLoggerFactory(),
+        )
+        return None
+    if settings.log_sink == "async":
+        sink = AsyncLogSink(
+            queue_size=settings.log_queue_size,
+            batch_size=settings.log_batch_size,
+            full_policy=settings.log_queue_full_policy,
+        )
+        structlog.configure(processors=processors, logger_factory=sink.logger_factory)
+        return sink
+
+    raise ValueError(f"Unknown log sink '{settings.log_sink}'")
+
+
+# Configure structlog
+log_sink = configure_logging(get_settings())
 
 logger = structlog.get_logger()
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all HTTP requests with structured logging."""
+class LoggingMiddleware:
+    """Middleware to log all HTTP requests with structured logging.
+
+    Plain ASGI: the route runs in the same task, so the bound request_id
+    is also visible to anything the route logs itself.
+
+    With ``log_sample_target`` set, successful requests are sampled per
+    route by an ``AdaptiveSampler`` and each line carries a
+    ``sample_weight``; failures (status >= 400 or exceptions) and requests
+    slower than ``log_slow_ms`` are always logged with weight 1.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Optional[Settings] = None):
+        self.app = app
+        settings = settings or get_settings()
+        self.sampler = None
+        if settings.log_sample_target > 0:
+            self.sampler = AdaptiveSampler(settings.log_sample_target)
+        self.slow_ms = settings.log_slow_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         # Get request_id from request state (set by RequestIDMiddleware)
-        request_id = getattr(request.state, "request_id", "unknown")
+        request_id = scope.get("state", {}).get("request_id", "unknown")
 
         # Bind request_id to logging context
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(request_id=request_id)
 
+        status_code = None
+
+        async def send_capturing_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         start_time = time.time()
 
         try:
             # Process request
-            response = await call_next(request)
-
-            # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Log successful request
-            logger.info(
-                "request_completed",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                latency_ms=round(latency_ms, 2),
-            )
-
-            return response
-
+            await self.app(scope, receive, send_capturing_status)
         except Exception as exc:
             # Calculate latency
             latency_ms = (time.time() - start_time) * 1000
@@ -57,10 +99,33 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Log error
             logger.error(
                 "request_failed",
-                method=request.method,
-                path=request.url.path,
+                method=scope["method"],
+                path=scope["path"],
                 latency_ms=round(latency_ms, 2),
                 error=str(exc),
                 exc_info=True,
             )
             raise
+
+        # Calculate latency
+        latency_ms = (time.time() - start_time) * 1000
+
+        sampling = {}
+        if self.sampler is not None:
+            weight = 1
+            succeeded = status_code is not None and status_code < 400
+            if succeeded and latency_ms < self.slow_ms:
+                weight = self.sampler.sample((scope["method"], route_template(scope)))
+                if not weight:
+                    return
+            sampling["sample_weight"] = weight
+
+        # Log successful request
+        logger.info(
+            "request_completed",
+            method=scope["method"],
+            path=scope["path"],
+            status_code=status_code,
+            latency_ms=round(latency_ms, 2),
+            **sampling,
+        )
@@ -1,10 +1,11 @@
 """Prometheus metrics middleware."""
 
 import time
-import re
+from typing import Dict, Tuple
 from prometheus_client import Counter, Histogram
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.config import get_settings
+from src.observability.latency import RollingLatency
 
 
 # Initialize Prometheus metrics
@@ -19,40 +20,110 @@ http_request_duration_seconds = Histogram(
     buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0),
 )
 
+# Per-stage latency of requests timed by ServerTimingMiddleware
+http_request_stage_seconds = Histogram(
+    "http_request_stage_seconds",
+    "HTTP request latency by stage",
+    ["method", "path", "stage"],
+    buckets=(
+        0.00001,
+        0.00005,
+        0.0001,
+        0.00025,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        1.0,
+    ),
+)
+
+
+# Label for requests that matched no route (e.g. 404s for unknown paths),
+# so arbitrary client paths never become label values
+UNMATCHED_ROUTE = "unmatched"
+
+# Label children by label values: ``labels()`` re-validates and re-hashes
+# its arguments under a lock on every call, a plain dict lookup does not
+_request_counters: Dict[Tuple[str, str, int], Counter] = {}
+_request_durations: Dict[Tuple[str, str], Histogram] = {}
+_stage_durations: Dict[Tuple[str, str, str], Histogram] = {}
+
+# Fine-grained per-route latencies behind /debug/latency; the histogram
+# buckets above are too coarse for sub-millisecond percentiles
+request_latencies = RollingLatency(window=get_settings().latency_window)
 
-def normalize_path(path: str) -> str:
+
+def route_template(scope: Scope) -> str:
     """
-    Normalize path to avoid high cardinality in metrics labels.
-    Replace IDs with placeholders.
+    Return the path template of the route that handled the request.
+    The router stores the matched route in the scope, e.g. /todos/{todo_id}.
     """
-    # Replace UUIDs and numeric IDs with {id}
-    path = re.sub(r"/[0-9a-f-]+(?=/|$)", "/{id}", path)
-    path = re.sub(r"/\d+(?=/|$)", "/{id}", path)
-    return path
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return template or UNMATCHED_ROUTE
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect Prometheus metrics."""
+def record_request(method: str, path: str, status: int, latency: float):
+    """Count a request and observe its latency via cached label children."""
+    counter = _request_counters.get((method, path, status))
+    if counter is None:
+        counter = http_requests_total.labels(method=method, path=path, status=status)
+        _request_counters[(method, path, status)] = counter
+    counter.inc()
 
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+    histogram = _request_durations.get((method, path))
+    if histogram is None:
+        histogram = http_request_duration_seconds.labels(method=method, path=path)
+        _request_durations[(method, path)] = histogram
+    histogram.observe(latency)
 
-        # Process request
-        response = await call_next(request)
+    request_latencies.record((method, path), latency)
 
-        # Calculate latency
-        latency = time.time() - start_time
 
-        # Normalize path to avoid high cardinality
-        normalized_path = normalize_path(request.url.path)
+def record_stages(method: str, path: str, stages: Dict[str, float]):
+    """Observe the per-stage durations of a timed request."""
+    for stage, seconds in stages.items():
+        histogram = _stage_durations.get((method, path, stage))
+        if histogram is None:
+            histogram = http_request_stage_seconds.labels(
+                method=method, path=path, stage=stage
+            )
+            _stage_durations[(method, path, stage)] = histogram
+        histogram.observe(seconds)
+
 
-        # Record metrics
-        http_requests_total.labels(
-            method=request.method, path=normalized_path, status=response.status_code
-        ).inc()
+class MetricsMiddleware:
+    """Middleware to collect Prometheus metrics (plain ASGI)."""
 
-        http_request_duration_seconds.labels(
-            method=request.method, path=normalized_path
-        ).observe(latency)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = None
+
+        async def send_capturing_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start_time = time.perf_counter()
+
+        # Process request
+        await self.app(scope, receive, send_capturing_status)
+
+        # Calculate latency
+        latency = time.perf_counter() - start_time
 
-        return response
+        # Label by route template to keep cardinality low
+        record_request(scope["method"], route_template(scope), status_code, latency)
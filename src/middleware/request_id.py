@@ -1,26 +1,37 @@
 """Request ID middleware for tracking requests."""
 
 import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to generate or extract request IDs for tracking."""
+class RequestIDMiddleware:
+    """Middleware to generate or extract request IDs for tracking.
+
+    Implemented as plain ASGI so it adds no task or stream wrapping to the
+    request; it only touches the scope and the response start message.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         # Extract request_id from header or generate new one
-        request_id = request.headers.get("X-Request-ID")
+        request_id = Headers(scope=scope).get("X-Request-ID")
         if not request_id:
             request_id = str(uuid.uuid4())
 
         # Store in request state for access in handlers
-        request.state.request_id = request_id
-
-        # Process request
-        response = await call_next(request)
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Add request_id to response headers
-        response.headers["X-Request-ID"] = request_id
+        async def send_with_request_id(message: Message):
+            if message["type"] == "http.response.start":
+                # Add request_id to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_request_id)
@@ -0,0 +1,56 @@
+"""Server-Timing middleware reporting per-stage request latency."""
+
+import time
+from typing import Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.config import Settings, get_settings
+from src.middleware.metrics import record_stages, route_template
+from src.observability.timing import MIDDLEWARE, start_timer
+
+# Request header asking for a Server-Timing breakdown (mode "request")
+REQUEST_HEADER = "X-Server-Timing"
+
+MODES = ("off", "request", "always")
+
+
+class ServerTimingMiddleware:
+    """Time request stages and report them in a ``Server-Timing`` header.
+
+    Runs outermost so that the middleware stage covers every other
+    middleware. Stages are measured up to the response start, when the
+    header is sent; the same values are observed in the
+    ``http_request_stage_seconds`` histogram. Requests that are not timed
+    pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Optional[Settings] = None):
+        self.app = app
+        self.mode = (settings or get_settings()).server_timing
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown Server-Timing mode '{self.mode}'")
+
+    def _wanted(self, scope: Scope) -> bool:
+        if self.mode == "always":
+            return True
+        if self.mode == "request":
+            return REQUEST_HEADER in Headers(scope=scope)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        timer = start_timer()
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                total = time.perf_counter() - start_time
+                timer.add(MIDDLEWARE, total - sum(timer.stages.values()))
+                MutableHeaders(scope=message)["Server-Timing"] = timer.header(total)
+                record_stages(scope["method"], route_template(scope), timer.stages)
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
@@ -1,5 +1,6 @@
 """Todo Pydantic models for data validation."""
 
+from typing import Literal
 from pydantic import BaseModel, Field
 
 
@@ -41,3 +42,75 @@ class TodoResponse(BaseModel):
             "examples": [{"id": "1", "title": "購買牛奶", "completed": False}]
         }
     }
+
+
+# Upper bound on the number of items in one bulk request
+MAX_BULK_ITEMS = 1000
+
+
+class TodoBulkCreate(BaseModel):
+    """Model for creating many todo items in one request."""
+
+    items: list[TodoCreate] = Field(
+        ..., min_length=1, max_length=MAX_BULK_ITEMS, description="待建立的待辦事項"
+    )
+
+
+class TodoBulkUpdateItem(TodoUpdate):
+    """One entry of a bulk update: the target ID plus the fields to change."""
+
+    id: str = Field(..., description="唯一識別碼")
+
+
+class TodoBulkUpdate(BaseModel):
+    """Model for updating many todo items in one request."""
+
+    items: list[TodoBulkUpdateItem] = Field(
+        ..., min_length=1, max_length=MAX_BULK_ITEMS, description="待更新的待辦事項"
+    )
+
+    model_config = {
+        "json_schema_extra": {"examples": [{"items": [{"id": "1", "completed": True}]}]}
+    }
+
+
+class TodoBulkDelete(BaseModel):
+    """Model for deleting many todo items in one request."""
+
+    ids: list[str] = Field(
+        ..., min_length=1, max_length=MAX_BULK_ITEMS, description="待刪除的識別碼"
+    )
+
+
+class TodoBulkResult(BaseModel):
+    """Outcome of one item in a bulk request."""
+
+    id: str = Field(..., description="唯一識別碼")
+    status: int = Field(..., description="此項目的 HTTP 狀態碼")
+    todo: TodoResponse | None = Field(None, description="處理後的待辦事項")
+
+
+class TodoBulkResponse(BaseModel):
+    """Model for bulk responses; results follow the request order."""
+
+    results: list[TodoBulkResult]
+
+
+class TodoChange(BaseModel):
+    """One change in a delta sync response."""
+
+    seq: int = Field(..., description="變更序號")
+    op: Literal["create", "update", "delete"] = Field(..., description="變更類型")
+    id: str = Field(..., description="唯一識別碼")
+    deleted: bool = Field(..., description="是否為刪除")
+    todo: TodoResponse | None = Field(
+        None, description="變更後的待辦事項 (刪除時為 null)"
+    )
+
+
+class TodoChanges(BaseModel):
+    """Model for delta sync responses; changes are in sequence order."""
+
+    changes: list[TodoChange]
+    next_since: int = Field(..., description="下次請求使用的 since 值")
+    has_more: bool = Field(..., description="是否還有更多變更")
@@ -0,0 +1 @@
+"""Observability support shared by the middleware and debug endpoints."""
@@ -0,0 +1,135 @@
+"""Mergeable latency sketches over a rolling time window."""
+
+import math
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+# Latencies at or below this many seconds share the lowest bucket
+MIN_TRACKED = 1e-6
+
+
+class LatencySketch:
+    """Log-bucketed quantile sketch with bounded relative error.
+
+    Values fall into buckets whose bounds grow by a factor ``gamma``, so a
+    reported quantile is within ``relative_accuracy`` of a recorded value
+    whatever the latency range (the DDSketch scheme). Sketches with the
+    same accuracy merge exactly by adding bucket counts.
+    """
+
+    __slots__ = ("relative_accuracy", "count", "_gamma", "_multiplier", "_buckets")
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+
+    def add(self, value: float):
+        """Record one value (in seconds)."""
+        if value <= MIN_TRACKED:
+            value = MIN_TRACKED
+        index = math.ceil(math.log(value) * self._multiplier)
+        buckets = self._buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        self.count += 1
+
+    def merge(self, other: "LatencySketch"):
+        """Add the counts recorded by ``other`` to this sketch."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracies")
+        buckets = self._buckets
+        for index, count in other._buckets.items():
+            buckets[index] = buckets.get(index, 0) + count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated ``q``-quantile in seconds, or None when empty."""
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                break
+        # Midpoint (in relative terms) of the bucket's bounds
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def clear(self):
+        """Forget all recorded values."""
+        self._buckets.clear()
+        self.count = 0
+
+
+class _Slot:
+    __slots__ = ("epoch", "sketch")
+
+    def __init__(self, relative_accuracy: float):
+        self.epoch = -1
+        self.sketch = LatencySketch(relative_accuracy)
+
+
+class RollingLatency:
+    """Per-key latency sketches covering the last ``window`` seconds.
+
+    Each key keeps a ring of ``slots`` sketches, one per ``window / slots``
+    seconds; a slot is cleared when time comes back round to it, and a
+    snapshot merges the slots still inside the window. The window
+    therefore advances in steps of one slot.
+
+    Not thread-safe: it is meant to be called from the event loop only.
+    """
+
+    def __init__(
+        self,
+        window: float = 60.0,
+        slots: int = 6,
+        relative_accuracy: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if window <= 0 or slots <= 0:
+            raise ValueError("Window and slot count must be positive")
+
+        self.window = window
+        self.relative_accuracy = relative_accuracy
+        self._slots = slots
+        self._slot_seconds = window / slots
+        self._clock = clock
+        self._rings: Dict[Hashable, List[_Slot]] = {}
+
+    def record(self, key: Hashable, seconds: float):
+        """Record a latency for ``key``."""
+        epoch = int(self._clock() / self._slot_seconds)
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings[key] = [
+                _Slot(self.relative_accuracy) for _ in range(self._slots)
+            ]
+
+        slot = ring[epoch % self._slots]
+        if slot.epoch != epoch:
+            slot.epoch = epoch
+            slot.sketch.clear()
+        slot.sketch.add(seconds)
+
+    def snapshot(self) -> Dict[Hashable, LatencySketch]:
+        """Merged sketch per key over the current window (empty keys omitted)."""
+        epoch = int(self._clock() / self._slot_seconds)
+        oldest = epoch - self._slots + 1
+
+        merged = {}
+        for key, ring in self._rings.items():
+            sketch = LatencySketch(self.relative_accuracy)
+            for slot in ring:
+                if oldest <= slot.epoch <= epoch:
+                    sketch.merge(slot.sketch)
+            if sketch.count:
+                merged[key] = sketch
+        return merged
+
+    def clear(self):
+        """Forget every key."""
+        self._rings.clear()
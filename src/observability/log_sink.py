@@ -0,0 +1,201 @@
+"""Queue-backed structlog sink that renders and writes on a background thread."""
+
+import json
+import queue
+import sys
+import threading
+from typing import Any, Dict, List, Optional, TextIO
+import structlog
+from prometheus_client import Counter
+
+FULL_DROP = "drop"
+FULL_BLOCK = "block"
+FULL_POLICIES = (FULL_DROP, FULL_BLOCK)
+
+log_lines_dropped_total = Counter(
+    "log_lines_dropped_total", "Log lines dropped because the log queue was full"
+)
+
+# Queued to tell the writer thread to exit
+_STOP = object()
+
+
+class QueueLogger:
+    """structlog logger that hands unrendered event dicts to an ``AsyncLogSink``.
+
+    It must be the target of a processor chain that ends with an event dict
+    rather than a renderer; the sink renders on its own thread.
+    """
+
+    def __init__(self, sink: "AsyncLogSink"):
+        self._sink = sink
+
+    def msg(self, **event_dict: Any):
+        """Queue one event."""
+        self._sink.submit(event_dict)
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+
+class AsyncLogSink:
+    """Bounded queue of log events drained by a background writer thread.
+
+    The writer takes up to ``batch_size`` events at a time, renders them
+    with ``renderer`` and writes the batch with one ``write`` and one
+    ``flush``, so request handlers never wait on a slow consumer of
+    ``stream``. Memory is bounded by ``queue_size`` events; when the queue
+    is full, ``full_policy`` decides between dropping the line (counted in
+    ``dropped`` and ``log_lines_dropped_total``) and blocking the caller.
+
+    Closing writes everything queued, including events submitted while
+    ``close`` runs; events submitted afterwards are written synchronously.
+    An event the renderer fails on is counted as dropped and replaced by a
+    ``log_render_failed`` line naming the error.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        renderer: Optional[Any] = None,
+        queue_size: int = 10_000,
+        batch_size: int = 256,
+        full_policy: str = FULL_DROP,
+    ):
+        if full_policy not in FULL_POLICIES:
+            raise ValueError(
+                f"Unknown log queue full policy '{full_policy}', "
+                f"expected one of {', '.join(FULL_POLICIES)}"
+            )
+        if queue_size < 1 or batch_size < 1:
+            raise ValueError("Log queue and batch sizes must be at least 1")
+
+        # None means whatever sys.stdout is at write time, like PrintLogger
+        self._stream = stream
+        self._renderer = renderer or structlog.processors.JSONRenderer()
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.full_policy = full_policy
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._closed = False
+
+        self._writer = threading.Thread(target=self._run, name="log-sink", daemon=True)
+        self._writer.start()
+
+    def logger_factory(self, *args: Any) -> QueueLogger:
+        """structlog ``logger_factory`` producing loggers bound to this sink."""
+        return QueueLogger(self)
+
+    def submit(self, event_dict: Dict[str, Any]):
+        """Queue an event, dropping or blocking if the queue is full."""
+        if self._closed:
+            # Late events (e.g. during shutdown) are written synchronously
+            self._write([event_dict])
+            return
+
+        if self.full_policy == FULL_BLOCK:
+            self._queue.put(event_dict)
+        else:
+            try:
+                self._queue.put_nowait(event_dict)
+            except queue.Full:
+                self._count_dropped(1)
+                return
+
+        # close() started meanwhile and the writer may have stopped before
+        # reaching this event. While it is still alive, close() drains the
+        # queue after it exits; once it is gone nothing else will
+        if self._closed and not self._writer.is_alive():
+            self._drain()
+
+    def flush(self):
+        """Wait until every queued event has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Write everything still queued and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+        # Events submit() queued behind _STOP while the writer was stopping
+        self._drain()
+
+    def _count_dropped(self, count: int):
+        with self._dropped_lock:
+            self.dropped += count
+        log_lines_dropped_total.inc(count)
+
+    def _take_batch(self) -> List[Any]:
+        """Block for one event, then take whatever else is already queued."""
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self):
+        """Write whatever is left in the queue after the writer has stopped."""
+        events = []
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is not _STOP:
+                events.append(event)
+            self._queue.task_done()
+        self._write(events)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = self._take_batch()
+            events = [event for event in batch if event is not _STOP]
+            stopping = len(events) < len(batch)
+            try:
+                self._write(events)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, events: List[Dict[str, Any]]):
+        if not events:
+            return
+
+        lines = []
+        for event_dict in events:
+            try:
+                lines.append(self._renderer(None, "msg", event_dict))
+            except Exception as exc:
+                # Any renderer error would otherwise kill the writer thread;
+                # keep it running and leave a trace of what was lost
+                self._count_dropped(1)
+                lines.append(_render_failure(event_dict, exc))
+        if not lines:
+            return
+
+        stream = self._stream or sys.stdout
+        try:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+        except (OSError, ValueError):
+            # Closed or broken stream: the lines are lost, but counted
+            self._count_dropped(len(lines))
+
+
+def _render_failure(event_dict: Dict[str, Any], exc: Exception) -> str:
+    """Line written in place of an event the renderer failed on."""
+    return json.dumps(
+        {
+            "event": "log_render_failed",
+            "level": "error",
+            "error": f"{type(exc).__name__}: {exc}",
+            "dropped_event": str(event_dict.get("event")),
+        },
+        ensure_ascii=False,
+    )
@@ -0,0 +1,67 @@
+"""Adaptive per-route sampling of request log lines."""
+
+import time
+from typing import Callable, Dict, Hashable
+
+
+class _RouteState:
+    __slots__ = ("window_start", "count", "every", "pending")
+
+    def __init__(self, now: float):
+        self.window_start = now
+        self.count = 0
+        # Log one request out of every ``every``
+        self.every = 1
+        # Requests seen since the last logged one, including skipped ones
+        self.pending = 0
+
+
+class AdaptiveSampler:
+    """Keep roughly ``target_per_second`` log lines per route.
+
+    Each route's request rate is measured over ``window`` seconds and the
+    next window logs one request out of every ``rate / target``. Sampling
+    is systematic rather than random, and the weight returned for a logged
+    request is the number of requests it stands for (itself plus those
+    skipped since the previous line), so summing weights downstream gives
+    exact request counts.
+
+    Not thread-safe: it is meant to be called from the event loop only.
+    """
+
+    def __init__(
+        self,
+        target_per_second: float,
+        window: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if target_per_second <= 0:
+            raise ValueError("Sampling target must be positive")
+
+        self.target_per_second = target_per_second
+        self.window = window
+        self._clock = clock
+        self._routes: Dict[Hashable, _RouteState] = {}
+
+    def sample(self, key: Hashable) -> int:
+        """Return the weight to log this request with, or 0 to skip it."""
+        now = self._clock()
+        state = self._routes.get(key)
+        if state is None:
+            state = self._routes[key] = _RouteState(now)
+
+        elapsed = now - state.window_start
+        if elapsed >= self.window:
+            rate = state.count / elapsed
+            state.every = max(1, int(rate / self.target_per_second))
+            state.window_start = now
+            state.count = 0
+
+        state.count += 1
+        state.pending += 1
+        if state.pending < state.every:
+            return 0
+
+        weight = state.pending
+        state.pending = 0
+        return weight
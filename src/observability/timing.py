@@ -0,0 +1,127 @@
+"""Per-request stage timings for the Server-Timing header.
+
+A ``StageTimer`` is placed in a context variable for requests that are
+being timed; instrumented code adds durations to it by stage name. When
+no timer is active every hook reduces to one context variable lookup.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+# Stage names, in the order they happen during a request
+MIDDLEWARE = "middleware"
+PARSE = "parse"
+QUEUE = "queue"
+LOCK = "lock"
+STORE = "store"
+SERIALIZE = "serialize"
+STAGES = (MIDDLEWARE, PARSE, QUEUE, LOCK, STORE, SERIALIZE)
+
+_current: ContextVar[Optional["StageTimer"]] = ContextVar("stage_timer", default=None)
+
+
+class StageTimer:
+    """Accumulated seconds per stage for one request."""
+
+    __slots__ = ("stages", "route_start", "handler_end")
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        # Route boundaries, set by src.api.routing.TimedRoute
+        self.route_start = 0.0
+        self.handler_end = 0.0
+
+    def add(self, stage: str, seconds: float):
+        """Add ``seconds`` to ``stage``."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def header(self, total: float) -> str:
+        """Format as a Server-Timing header value (milliseconds)."""
+        entries = [
+            f"{stage};dur={self.stages[stage] * 1000:.3f}"
+            for stage in STAGES
+            if stage in self.stages
+        ]
+        entries.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(entries)
+
+
+def current_timer() -> Optional[StageTimer]:
+    """The timer of the request being handled, if it is being timed."""
+    return _current.get()
+
+
+def start_timer() -> StageTimer:
+    """Start timing the current request (and tasks/threads it spawns)."""
+    timer = StageTimer()
+    _current.set(timer)
+    return timer
+
+
+class TimedLock:
+    """``threading.Lock`` that reports acquisition waits as the lock stage."""
+
+    __slots__ = ("_lock",)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        timer = _current.get()
+        if timer is None:
+            self._lock.acquire()
+            return self
+        start = time.perf_counter()
+        self._lock.acquire()
+        timer.add(LOCK, time.perf_counter() - start)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        return self._lock.acquire(blocking, timeout)
+
+    def release(self):
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+
+class TimedStore:
+    """Proxy that adds the time spent in store methods to the store stage.
+
+    Lock waits inside a call are already reported as the lock stage, so
+    they are subtracted to keep stages from overlapping.
+    """
+
+    def __init__(self, store: Any, timer: StageTimer):
+        self._store = store
+        self._timer = timer
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._store, name)
+        if not callable(attr):
+            return attr
+
+        timer = self._timer
+
+        def timed(*args, **kwargs):
+            waited = timer.stages.get(LOCK, 0.0)
+            start = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                timer.add(STORE, elapsed - (timer.stages.get(LOCK, 0.0) - waited))
+
+        return timed
+
+
+def timed_store(store: Any) -> Any:
+    """Wrap ``store`` in a TimedStore when the current request is timed."""
+    timer = _current.get()
+    return store if timer is None else TimedStore(store, timer)
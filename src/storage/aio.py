@@ -0,0 +1,158 @@
+"""Awaitable access to todo stores from the event loop."""
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple
+from src.config import get_settings
+from src.models.todo import TodoCreate, TodoResponse, TodoUpdate
+from src.observability.timing import QUEUE, StageTimer, current_timer, timed_store
+from src.storage.base import BaseTodoStore
+from src.storage.changes import ChangeBatch
+from src.storage.memory import get_todo_store
+
+
+def _queued(
+    timer: StageTimer, submitted: float, method: Callable[..., Any], *args: Any
+) -> Any:
+    """Report how long the call waited for a worker, then run it."""
+    timer.add(QUEUE, time.perf_counter() - submitted)
+    return method(*args)
+
+
+class AsyncTodoStore:
+    """The ``BaseTodoStore`` contract as coroutines, for async routes.
+
+    Stores that only work in memory (``blocking = False``) are called
+    inline: their critical sections are short, so a thread hand-off would
+    cost more than it saves. Every other store runs on ``executor`` (the
+    event loop's default executor when None), so an fsync, a query or a
+    wait for the store's locks holds up only the requests waiting on that
+    store, never the event loop. The caller's context variables, such as
+    the request's stage timer, are carried into the worker thread; the
+    time a call waits for a free worker is reported as the queue stage.
+    """
+
+    __slots__ = ("store", "inline", "_executor")
+
+    def __init__(self, store: BaseTodoStore, executor: Optional[Executor] = None):
+        self.store = store
+        # True when calls run on the caller's thread without suspending
+        self.inline = not store.blocking
+        self._executor = executor
+
+    async def _call(self, method: Callable[..., Any], *args: Any) -> Any:
+        if self.inline:
+            return method(*args)
+
+        loop = asyncio.get_running_loop()
+        timer = current_timer()
+        if timer is not None:
+            method = functools.partial(_queued, timer, time.perf_counter(), method)
+        call = functools.partial(contextvars.copy_context().run, method, *args)
+        return await loop.run_in_executor(self._executor, call)
+
+    async def create(self, todo: TodoCreate) -> TodoResponse:
+        return await self._call(self.store.create, todo)
+
+    async def create_many(self, todos: List[TodoCreate]) -> List[TodoResponse]:
+        return await self._call(self.store.create_many, todos)
+
+    async def get_json(self, todo_id: str) -> Optional[bytes]:
+        return await self._call(self.store.get_json, todo_id)
+
+    async def get_versioned_json(self, todo_id: str) -> Optional[Tuple[int, bytes]]:
+        return await self._call(self.store.get_versioned_json, todo_id)
+
+    async def list_all_json(self, completed: Optional[bool] = None) -> List[bytes]:
+        return await self._call(self.store.list_all_json, completed)
+
+    async def scan_json(
+        self, completed: Optional[bool] = None, batch_size: int = 1000
+    ) -> AsyncIterator[List[bytes]]:
+        """Iterate ``store.scan_json``, fetching each batch like any other call.
+
+        The generator is closed through the same path, as closing it can
+        release backend resources (e.g. end a read transaction).
+        """
+        batches = self.store.scan_json(completed, batch_size)
+        try:
+            while True:
+                batch = await self._call(next, batches, None)
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            await self._call(batches.close)
+
+    async def list_page_json(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        return await self._call(self.store.list_page_json, limit, after, completed)
+
+    async def search_json(self, query: str, limit: int) -> List[bytes]:
+        return await self._call(self.store.search_json, query, limit)
+
+    async def update(
+        self, todo_id: str, todo_update: TodoUpdate
+    ) -> Optional[TodoResponse]:
+        return await self._call(self.store.update, todo_id, todo_update)
+
+    async def update_many(
+        self, updates: List[Tuple[str, TodoUpdate]]
+    ) -> List[Optional[TodoResponse]]:
+        return await self._call(self.store.update_many, updates)
+
+    async def delete(self, todo_id: str) -> bool:
+        return await self._call(self.store.delete, todo_id)
+
+    async def delete_many(self, todo_ids: List[str]) -> List[bool]:
+        return await self._call(self.store.delete_many, todo_ids)
+
+    async def collection_version(self) -> int:
+        return await self._call(self.store.collection_version)
+
+    async def todo_version(self, todo_id: str) -> Optional[int]:
+        return await self._call(self.store.todo_version, todo_id)
+
+    async def changes_json(self, since: int, limit: int) -> Optional[ChangeBatch]:
+        return await self._call(self.store.changes_json, since, limit)
+
+
+# Global executor for blocking stores, created on first use and bounded by
+# ``settings.store_workers`` so a slow backend cannot pile up threads
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_store_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs blocking store calls."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_settings().store_workers,
+                    thread_name_prefix="todo-store",
+                )
+    return _executor
+
+
+def shutdown_store_executor():
+    """Wait for running store calls and stop the pool (recreated on next use)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def get_async_store() -> AsyncTodoStore:
+    """Awaitable view of the global store, timed when the request is."""
+    return AsyncTodoStore(timed_store(get_todo_store()), get_store_executor())
@@ -0,0 +1,166 @@
+"""Storage interface shared by every todo backend."""
+
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Tuple
+from src.models.todo import TodoCreate, TodoUpdate, TodoResponse
+from src.storage.changes import ChangeBatch
+
+
+class BaseTodoStore(ABC):
+    """Method contract every todo storage backend implements."""
+
+    # Whether methods may wait on disk or network I/O. Async callers run
+    # blocking stores on a thread pool (see src.storage.aio); only stores
+    # that never leave memory should set this to False.
+    blocking = True
+
+    @abstractmethod
+    def create(self, todo: TodoCreate) -> TodoResponse:
+        """Create a new todo item and assign it a unique ID."""
+
+    @abstractmethod
+    def get(self, todo_id: str) -> Optional[TodoResponse]:
+        """Retrieve a todo item by ID, or None if it does not exist."""
+
+    @abstractmethod
+    def list_all(self, completed: Optional[bool] = None) -> List[TodoResponse]:
+        """Return all todo items in creation order, optionally by status."""
+
+    @abstractmethod
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[TodoResponse], Optional[str]]:
+        """Return up to ``limit`` todos with IDs after ``after``, in ID order.
+
+        When ``completed`` is given only todos with that status are returned.
+
+        The second element is the ID to pass as ``after`` for the next page,
+        or None when there are no more todos.
+        """
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> List[TodoResponse]:
+        """Return up to ``limit`` todos whose titles match ``query``, in ID order.
+
+        Every query token must match: words match title words by prefix and
+        CJK text matches as a substring.
+        """
+
+    @abstractmethod
+    def get_json(self, todo_id: str) -> Optional[bytes]:
+        """Like ``get`` but return the todo as encoded JSON bytes."""
+
+    @abstractmethod
+    def list_all_json(self, completed: Optional[bool] = None) -> List[bytes]:
+        """Like ``list_all`` but return each todo as encoded JSON bytes."""
+
+    @abstractmethod
+    def list_page_json(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """Like ``list_page`` but return each todo as encoded JSON bytes."""
+
+    @abstractmethod
+    def search_json(self, query: str, limit: int) -> List[bytes]:
+        """Like ``search`` but return each todo as encoded JSON bytes."""
+
+    @abstractmethod
+    def update(self, todo_id: str, todo_update: TodoUpdate) -> Optional[TodoResponse]:
+        """Update the provided fields, or return None if the todo does not exist."""
+
+    @abstractmethod
+    def delete(self, todo_id: str) -> bool:
+        """Remove a todo item. Returns True if deleted, False if not found."""
+
+    @abstractmethod
+    def collection_version(self) -> int:
+        """Return the version of the whole collection.
+
+        It increases with every write and never repeats for a store's data,
+        not even across restarts, so it can back collection ETags.
+        """
+
+    @abstractmethod
+    def todo_version(self, todo_id: str) -> Optional[int]:
+        """Return the version of one todo, or None if it does not exist.
+
+        A todo's version is the collection version of its last write.
+        """
+
+    @abstractmethod
+    def changes_json(self, since: int, limit: int) -> Optional[ChangeBatch]:
+        """Return up to ``limit`` changes made after collection version ``since``.
+
+        Every write is one change, numbered by the collection version it
+        produced; deletions are reported as tombstones. Returns None when
+        the changes after ``since`` are no longer retained (or ``since`` is
+        not a version of this store), and the caller must resync from a
+        full listing.
+        """
+
+    def get_versioned_json(self, todo_id: str) -> Optional[Tuple[int, bytes]]:
+        """Return a todo's ``(version, JSON bytes)``, or None if it does not exist.
+
+        Backends override this to read both from the same state. The
+        default makes two calls, version first, so the body is at least as
+        new as the version and an ETag built from it never hides a newer
+        body.
+        """
+        version = self.todo_version(todo_id)
+        if version is None:
+            return None
+        body = self.get_json(todo_id)
+        return None if body is None else (version, body)
+
+    def create_many(self, todos: List[TodoCreate]) -> List[TodoResponse]:
+        """Create several todos, returning them in request order.
+
+        The default applies ``create`` one by one; backends override this
+        to apply the whole batch in one critical section or transaction.
+        """
+        return [self.create(todo) for todo in todos]
+
+    def update_many(
+        self, updates: List[Tuple[str, TodoUpdate]]
+    ) -> List[Optional[TodoResponse]]:
+        """Apply ``(todo_id, update)`` pairs; None marks a missing todo."""
+        return [self.update(todo_id, update) for todo_id, update in updates]
+
+    def delete_many(self, todo_ids: List[str]) -> List[bool]:
+        """Delete several todos; False marks a missing todo."""
+        return [self.delete(todo_id) for todo_id in todo_ids]
+
+    @abstractmethod
+    def clear(self):
+        """Remove all todos and reset ID generation (for testing purposes)."""
+
+    def scan_json(
+        self, completed: Optional[bool] = None, batch_size: int = 1000
+    ) -> Iterator[List[bytes]]:
+        """Yield every todo as JSON bytes, in ID order, ``batch_size`` at a time.
+
+        Backends override this to yield one consistent snapshot of the
+        store, as of the first batch, however long the scan takes.
+
+        The default walks the collection with ``list_page_json``, which is
+        not a snapshot: each batch is read consistently and every todo is
+        yielded at most once, but a todo changed mid-scan shows up in either
+        its old or its new state, and new todos are picked up when the scan
+        reaches them.
+        """
+        after = None
+        while True:
+            todos, after = self.list_page_json(batch_size, after, completed)
+            if todos:
+                yield todos
+            if after is None:
+                return
+
+    def close(self):
+        """Release resources held by the store."""
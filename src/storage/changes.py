@@ -0,0 +1,132 @@
+"""Change log for delta sync: what changed since a given sequence number."""
+
+from bisect import bisect_right
+from typing import List, NamedTuple, Optional, Tuple
+from src.storage.encoding import encode_change
+from src.storage.records import TodoRecord
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+
+# (sequence number, operation, todo ID, encoded todo or None for a deletion)
+Change = Tuple[int, str, str, Optional[bytes]]
+
+
+class ChangeEvent(NamedTuple):
+    """One encoded change (see ``encode_change``) with its sequence and op."""
+
+    seq: int
+    op: str
+    data: bytes
+
+
+class ChangeBatch(NamedTuple):
+    """One batch of changes, oldest first."""
+
+    # At most one change per todo
+    changes: List[ChangeEvent]
+    # Sequence number to pass as ``since`` to continue after this batch
+    next_since: int
+    # True when the batch stopped at its limit and more changes follow
+    has_more: bool
+
+
+def build_batch(entries: List[Change], since: int, limit: int) -> ChangeBatch:
+    """Encode up to ``limit`` of ``entries`` (in sequence order) as a batch.
+
+    ``entries`` may hold one extra change, which only tells whether more
+    follow. A todo changed several times within the batch is reported once,
+    at its last change; that change counts as its creation when the todo
+    was created within the batch and still exists.
+    """
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    last = {}
+    created = set()
+    for position, (_, op, todo_id, _) in enumerate(entries):
+        last[todo_id] = position
+        if op == CREATE:
+            created.add(todo_id)
+
+    changes = []
+    for position, (seq, op, todo_id, todo) in enumerate(entries):
+        if last[todo_id] != position:
+            continue
+        if op == UPDATE and todo_id in created:
+            op = CREATE
+        changes.append(ChangeEvent(seq, op, encode_change(seq, op, todo_id, todo)))
+    next_since = entries[-1][0] if entries else since
+    return ChangeBatch(changes, next_since, has_more)
+
+
+class ChangeLog:
+    """The most recent changes to an in-memory store, by sequence number.
+
+    Sequence numbers are the store's collection versions, so every write
+    appends exactly one entry and entries arrive in increasing order. A
+    read bisects to the first entry after ``since``, so its cost grows
+    with the number of changes returned, not with the collection.
+
+    Deletions are kept as tombstones (entries without a record). Only the
+    newest ``retention`` entries are guaranteed to be kept; the oldest are
+    dropped in chunks so trimming stays cheap per write. ``floor`` is the
+    oldest ``since`` the log can still answer: every change after it is
+    retained.
+
+    Not thread-safe: stores call it while holding the lock under which
+    they bump the collection version.
+    """
+
+    __slots__ = ("retention", "floor", "_seqs", "_entries")
+
+    def __init__(self, floor: int, retention: int = 10_000):
+        if retention < 1:
+            raise ValueError("Change retention must be at least 1")
+
+        self.retention = retention
+        self.floor = floor
+        self._seqs: List[int] = []
+        # (op, todo ID, record), parallel to _seqs
+        self._entries: List[Tuple[str, str, Optional[TodoRecord]]] = []
+
+    def __len__(self) -> int:
+        return len(self._seqs)
+
+    def append(self, seq: int, op: str, todo_id: str, record: Optional[TodoRecord]):
+        """Record a write of ``todo_id``; ``record`` is None for a deletion."""
+        self._seqs.append(seq)
+        self._entries.append((op, todo_id, record))
+
+        excess = len(self._seqs) - self.retention
+        if excess > self.retention // 8:
+            self.floor = self._seqs[excess - 1]
+            del self._seqs[:excess]
+            del self._entries[:excess]
+
+    def reset(self, floor: int):
+        """Forget every change, e.g. after the whole store was cleared."""
+        self.floor = floor
+        self._seqs.clear()
+        self._entries.clear()
+
+    def read(
+        self, since: int, limit: int, version: int
+    ) -> Optional[List[Tuple[int, str, str, Optional[TodoRecord]]]]:
+        """Return up to ``limit`` changes after ``since``, oldest first.
+
+        Returns None when ``since`` is older than the retained window or
+        newer than ``version`` (the store's current version, e.g. a sequence
+        number from before a restart or from another store).
+        """
+        if since < self.floor or since > version:
+            return None
+
+        start = bisect_right(self._seqs, since)
+        end = start + limit
+        return [
+            (seq, op, todo_id, record)
+            for seq, (op, todo_id, record) in zip(
+                self._seqs[start:end], self._entries[start:end], strict=True
+            )
+        ]
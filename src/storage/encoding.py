@@ -0,0 +1,64 @@
+"""JSON encoding of todo records for responses that bypass Pydantic."""
+
+from json.encoder import encode_basestring
+from typing import Iterable, Optional, Tuple
+from src.models.todo import TodoResponse
+
+# Todos have a fixed shape, so their JSON is assembled around the stdlib's
+# C string escaper, the one json.dumps(ensure_ascii=False) uses, instead
+# of building a dict and calling json.dumps for every todo
+_TODO_TEMPLATE = '{"id":%s,"title":%s,"completed":%s}'
+_BOOLEANS = {False: "false", True: "true"}
+
+
+def encode_todo(todo_id: str, title: str, completed: bool) -> bytes:
+    """Encode a todo exactly as FastAPI would render a ``TodoResponse``."""
+    return (
+        _TODO_TEMPLATE
+        % (encode_basestring(todo_id), encode_basestring(title), _BOOLEANS[completed])
+    ).encode("utf-8")
+
+
+def encode_array(items: Iterable[bytes]) -> bytes:
+    """Join pre-encoded JSON values into a JSON array."""
+    return b"[" + b",".join(items) + b"]"
+
+
+def encode_bulk_results(
+    results: Iterable[Tuple[str, int, Optional[TodoResponse]]],
+) -> bytes:
+    """Encode ``(id, status, todo)`` triples as a ``TodoBulkResponse``."""
+    items = (
+        b'{"id":%s,"status":%d,"todo":%s}'
+        % (
+            encode_basestring(todo_id).encode("utf-8"),
+            status,
+            (
+                b"null"
+                if todo is None
+                else encode_todo(todo.id, todo.title, todo.completed)
+            ),
+        )
+        for todo_id, status, todo in results
+    )
+    return b'{"results":' + encode_array(items) + b"}"
+
+
+def encode_change(seq: int, op: str, todo_id: str, todo: Optional[bytes]) -> bytes:
+    """Encode one ``TodoChange``; ``todo`` is None for a deletion."""
+    return b'{"seq":%d,"op":"%s","id":%s,"deleted":%s,"todo":%s}' % (
+        seq,
+        op.encode("ascii"),
+        encode_basestring(todo_id).encode("utf-8"),
+        b"true" if todo is None else b"false",
+        b"null" if todo is None else todo,
+    )
+
+
+def encode_changes(changes: Iterable[bytes], next_since: int, has_more: bool) -> bytes:
+    """Encode pre-encoded change entries as a ``TodoChanges`` response."""
+    return b'{"changes":%s,"next_since":%d,"has_more":%s}' % (
+        encode_array(changes),
+        next_since,
+        b"true" if has_more else b"false",
+    )
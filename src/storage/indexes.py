@@ -0,0 +1,217 @@
+"""Secondary index structures shared by the in-memory stores.
+
+Indexes are not thread-safe on their own; stores only touch them while
+holding the lock that protects the records they describe.
+"""
+
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Han, kana and hangul: scripts written without spaces between words
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_PATTERN = re.compile(f"[{_CJK}]+|[^\\W_{_CJK}]+")
+_CJK_PATTERN = re.compile(f"[{_CJK}]")
+
+# Longest word prefix indexed; longer query words are verified on the title
+MAX_PREFIX_LENGTH = 12
+
+
+class OrderedIdIndex:
+    """Sorted set of integer todo IDs with O(log n + k) range scans.
+
+    IDs are allocated in increasing order, so inserts are almost always
+    plain appends.
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._ids: List[int] = sorted(ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __contains__(self, todo_id: int) -> bool:
+        index = bisect_left(self._ids, todo_id)
+        return index < len(self._ids) and self._ids[index] == todo_id
+
+    def add(self, todo_id: int):
+        """Insert an ID, keeping the index sorted."""
+        if not self._ids or todo_id > self._ids[-1]:
+            self._ids.append(todo_id)
+            return
+
+        index = bisect_left(self._ids, todo_id)
+        if index == len(self._ids) or self._ids[index] != todo_id:
+            self._ids.insert(index, todo_id)
+
+    def discard(self, todo_id: int):
+        """Remove an ID if present."""
+        index = bisect_left(self._ids, todo_id)
+        if index < len(self._ids) and self._ids[index] == todo_id:
+            del self._ids[index]
+
+    def after(self, todo_id: int, limit: int) -> List[int]:
+        """Return up to ``limit`` IDs strictly greater than ``todo_id``."""
+        start = bisect_right(self._ids, todo_id)
+        return self._ids[start : start + limit]
+
+    def clear(self):
+        """Remove every ID."""
+        self._ids.clear()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into normalised tokens.
+
+    Text is NFKC-normalised and case-folded. Words in space-separated
+    scripts become one token each; every run of CJK characters becomes a
+    single token, which ``index_terms`` then breaks into n-grams.
+    """
+    return _TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+def _is_cjk(token: str) -> bool:
+    return _CJK_PATTERN.match(token) is not None
+
+
+def index_terms(title: str) -> Set[str]:
+    """Return every term a title is indexed under.
+
+    Words contribute all their prefixes (edge n-grams) up to
+    ``MAX_PREFIX_LENGTH`` so prefix queries are plain lookups. CJK runs
+    contribute their characters and character bigrams.
+    """
+    terms = set()
+    for token in tokenize(title):
+        if _is_cjk(token):
+            terms.update(token)
+            terms.update(token[i : i + 2] for i in range(len(token) - 1))
+        else:
+            terms.update(
+                token[:length]
+                for length in range(1, min(len(token), MAX_PREFIX_LENGTH) + 1)
+            )
+    return terms
+
+
+def query_terms(query: str) -> Tuple[List[str], List[str], bool]:
+    """Turn a search query into index lookups.
+
+    Returns ``(query tokens, terms to intersect, needs verification)``.
+    Lookups can over-match when a word is longer than the indexed prefix
+    or a CJK run spans more than one bigram, in which case candidates have
+    to be checked with ``title_matches``.
+    """
+    tokens = tokenize(query)
+    terms = []
+    verify = False
+    for token in tokens:
+        if _is_cjk(token):
+            if len(token) == 1:
+                terms.append(token)
+            else:
+                terms.extend(token[i : i + 2] for i in range(len(token) - 1))
+                verify = verify or len(token) > 2
+        else:
+            terms.append(token[:MAX_PREFIX_LENGTH])
+            verify = verify or len(token) > MAX_PREFIX_LENGTH
+    return tokens, terms, verify
+
+
+def title_matches(title: str, tokens: List[str]) -> bool:
+    """Check that every query token occurs in the title.
+
+    Word tokens must prefix a title word; CJK tokens must be a substring of
+    a CJK run in the title.
+    """
+    title_tokens = tokenize(title)
+    for token in tokens:
+        if _is_cjk(token):
+            found = any(token in title_token for title_token in title_tokens)
+        else:
+            found = any(title_token.startswith(token) for title_token in title_tokens)
+        if not found:
+            return False
+    return True
+
+
+class TitleIndex:
+    """Inverted index from title terms to todo IDs.
+
+    Each posting list is a set of IDs; a query intersects the posting lists
+    of its terms starting from the smallest, so its cost depends on how
+    many todos match rather than on the store size.
+    """
+
+    __slots__ = ("_postings", "_titles")
+
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = {}
+        # Indexed title per ID, so discard() can find its posting lists
+        self._titles: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def add(self, todo_id: int, title: str, terms: Optional[Set[str]] = None):
+        """Index a title, replacing any previous title for the same ID.
+
+        ``terms`` is ``index_terms(title)`` when the caller has already
+        computed it, e.g. outside a lock it holds while calling this.
+        """
+        self.discard(todo_id)
+        self._titles[todo_id] = title
+        for term in index_terms(title) if terms is None else terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                self._postings[term] = {todo_id}
+            else:
+                postings.add(todo_id)
+
+    def discard(self, todo_id: int, terms: Optional[Set[str]] = None):
+        """Remove an ID from every posting list.
+
+        ``terms``, if given, must be ``index_terms`` of the indexed title.
+        """
+        title = self._titles.pop(todo_id, None)
+        if title is None:
+            return
+        for term in index_terms(title) if terms is None else terms:
+            postings = self._postings[term]
+            postings.discard(todo_id)
+            if not postings:
+                del self._postings[term]
+
+    def search(self, terms: List[str], limit: Optional[int] = None) -> List[int]:
+        """Return IDs whose titles contain every term, in ID order.
+
+        With ``limit`` only the lowest ``limit`` IDs are selected, which
+        avoids sorting every match of a broad query.
+        """
+        if not terms:
+            return []
+
+        postings = []
+        for term in set(terms):
+            ids = self._postings.get(term)
+            if not ids:
+                return []
+            postings.append(ids)
+
+        postings.sort(key=len)
+        matches = postings[0].intersection(*postings[1:])
+        if limit is not None and limit < len(matches):
+            return heapq.nsmallest(limit, matches)
+        return sorted(matches)
+
+    def clear(self):
+        """Remove every ID."""
+        self._postings.clear()
+        self._titles.clear()
@@ -1,77 +1,380 @@
 """In-memory storage for todo items."""
 
 import threading
-from typing import Dict, List, Optional
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from src.config import Settings, get_settings
 from src.models.todo import TodoCreate, TodoUpdate, TodoResponse
+from src.observability.timing import TimedLock
+from src.storage.base import BaseTodoStore
+from src.storage.changes import ChangeBatch, ChangeLog, build_batch
+from src.storage.indexes import (
+    OrderedIdIndex,
+    TitleIndex,
+    query_terms,
+    title_matches,
+)
+from src.storage.records import TodoRecord
 
+# Turns a stored record into what a read method returns
+Render = Callable[[TodoRecord], Any]
 
-class TodoStore:
-    """Thread-safe in-memory storage for todo items."""
+_to_response = TodoRecord.to_response
+_to_json = TodoRecord.to_json
 
-    def __init__(self):
-        self._todos: Dict[str, Dict[str, any]] = {}
-        self._lock = threading.Lock()
+
+def _to_versioned_json(record: TodoRecord) -> Tuple[int, bytes]:
+    return record.version, record.to_json()
+
+
+class TodoStore(BaseTodoStore):
+    """Thread-safe in-memory storage for todo items.
+
+    Todos are kept as slotted ``TodoRecord`` objects. Read methods come in
+    two flavours: the plain ones build ``TodoResponse`` models without
+    re-validating, the ``*_json`` ones return each todo's JSON encoding,
+    cached on its record, so repeated reads of unchanged todos do no
+    Pydantic or JSON work at all.
+
+    Writes replace records instead of modifying them (copy-on-write), so
+    readers only hold the lock long enough to copy references to the
+    records they need, then render that snapshot without it. A large
+    listing no longer stalls writers for the time it takes to render.
+
+    Every write bumps ``_version`` and stamps it on the written todo. The
+    counter starts from the wall clock so versions handed out before a
+    restart are never reused for different data after it. Versions double
+    as change sequence numbers: ``_changes`` logs every write for delta
+    sync, keeping the most recent ``change_retention`` of them.
+    """
+
+    blocking = False
+
+    def __init__(self, change_retention: int = 10_000):
+        self._todos: Dict[str, TodoRecord] = {}
+        self._lock = TimedLock()
         self._counter = 0
+        self._version = time.time_ns()
+        self._order = OrderedIdIndex()
+        self._by_status = {False: OrderedIdIndex(), True: OrderedIdIndex()}
+        self._title_index = TitleIndex()
+        self._changes = ChangeLog(self._version, change_retention)
 
     def create(self, todo: TodoCreate) -> TodoResponse:
         """Create a new todo item with thread-safe ID generation."""
         with self._lock:
-            self._counter += 1
-            todo_id = str(self._counter)
-            todo_dict = {
-                "id": todo_id,
-                "title": todo.title,
-                "completed": todo.completed,
-            }
-            self._todos[todo_id] = todo_dict
-            return TodoResponse(**todo_dict)
+            return self._create_locked(todo)
+
+    def collection_version(self) -> int:
+        """Return the version of the last write."""
+        return self._version
+
+    def todo_version(self, todo_id: str) -> Optional[int]:
+        """Return the version of the last write to one todo."""
+        with self._lock:
+            record = self._todos.get(todo_id)
+            return record.version if record else None
+
+    def create_many(self, todos: List[TodoCreate]) -> List[TodoResponse]:
+        """Create a batch of todos under a single lock acquisition."""
+        with self._lock:
+            return [self._create_locked(todo) for todo in todos]
 
     def get(self, todo_id: str) -> Optional[TodoResponse]:
         """Retrieve a todo item by ID with thread safety."""
+        return self._get(todo_id, _to_response)
+
+    def get_json(self, todo_id: str) -> Optional[bytes]:
+        """Retrieve a todo item as cached JSON bytes."""
+        return self._get(todo_id, _to_json)
+
+    def get_versioned_json(self, todo_id: str) -> Optional[Tuple[int, bytes]]:
+        """Return a todo's version and cached JSON, both from one record."""
+        return self._get(todo_id, _to_versioned_json)
+
+    def list_all(self, completed: Optional[bool] = None) -> List[TodoResponse]:
+        """Return all todo items with thread safety."""
+        return self._list_all(completed, _to_response)
+
+    def list_all_json(self, completed: Optional[bool] = None) -> List[bytes]:
+        """Return all todo items as cached JSON bytes."""
+        return self._list_all(completed, _to_json)
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[TodoResponse], Optional[str]]:
+        """Return one page of todos using the ordered ID or status index."""
+        return self._list_page(limit, after, completed, _to_response)
+
+    def list_page_json(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """Return one page of todos as cached JSON bytes."""
+        return self._list_page(limit, after, completed, _to_json)
+
+    def search(self, query: str, limit: int) -> List[TodoResponse]:
+        """Search titles through the inverted title index."""
+        return self._search(query, limit, _to_response)
+
+    def search_json(self, query: str, limit: int) -> List[bytes]:
+        """Search titles, returning cached JSON bytes."""
+        return self._search(query, limit, _to_json)
+
+    def changes_json(self, since: int, limit: int) -> Optional[ChangeBatch]:
+        """Return changes after ``since`` from the in-memory change log."""
         with self._lock:
-            todo_dict = self._todos.get(todo_id)
-            if todo_dict:
-                return TodoResponse(**todo_dict)
+            # One extra entry tells whether more changes follow
+            entries = self._changes.read(since, limit + 1, self._version)
+        if entries is None:
             return None
 
-    def list_all(self) -> List[TodoResponse]:
-        """Return all todo items with thread safety."""
+        return build_batch(
+            [
+                (seq, op, todo_id, None if record is None else _to_json(record))
+                for seq, op, todo_id, record in entries
+            ],
+            since,
+            limit,
+        )
+
+    def _get(self, todo_id: str, render: Render) -> Any:
+        with self._lock:
+            record = self._todos.get(todo_id)
+        return render(record) if record else None
+
+    def scan_json(
+        self, completed: Optional[bool] = None, batch_size: int = 1000
+    ) -> Iterator[List[bytes]]:
+        """Yield a point-in-time snapshot of the todos as JSON bytes.
+
+        Record references are copied once, under the lock; records are
+        never modified, so rendering them batch by batch afterwards cannot
+        pick up later writes.
+        """
+        records = self._snapshot(completed)
+        for start in range(0, len(records), batch_size):
+            yield [_to_json(record) for record in records[start : start + batch_size]]
+
+    def _list_all(self, completed: Optional[bool], render: Render) -> List[Any]:
+        return [render(record) for record in self._snapshot(completed)]
+
+    def _snapshot(self, completed: Optional[bool]) -> List[TodoRecord]:
+        # Copying the references is far shorter than rendering. Records are
+        # in ID order, as they are never re-inserted; a status filter walks
+        # its index, so only matching todos are visited
+        with self._lock:
+            if completed is None:
+                return list(self._todos.values())
+            todos = self._todos
+            return [todos[str(i)] for i in self._by_status[completed]]
+
+    def _list_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        completed: Optional[bool],
+        render: Render,
+    ) -> Tuple[List[Any], Optional[str]]:
         with self._lock:
-            return [TodoResponse(**todo_dict) for todo_dict in self._todos.values()]
+            index = self._order if completed is None else self._by_status[completed]
+            # Fetch one extra ID to learn whether another page exists
+            ids = index.after(int(after) if after else 0, limit + 1)
+            records = [self._todos[str(i)] for i in ids[:limit]]
+
+        todos = [render(record) for record in records]
+        next_after = str(ids[limit - 1]) if len(ids) > limit else None
+        return todos, next_after
+
+    def _search(self, query: str, limit: int, render: Render) -> List[Any]:
+        tokens, terms, verify = query_terms(query)
+        records = []
+        with self._lock:
+            # Without verification every candidate is a hit, so only the
+            # first ``limit`` IDs are needed
+            candidates = self._title_index.search(terms, None if verify else limit)
+            for todo_id in candidates:
+                record = self._todos[str(todo_id)]
+                if verify and not title_matches(record.title, tokens):
+                    continue
+                records.append(record)
+                if len(records) == limit:
+                    break
+        return [render(record) for record in records]
 
     def update(self, todo_id: str, todo_update: TodoUpdate) -> Optional[TodoResponse]:
         """Update an existing todo item with thread safety."""
         with self._lock:
-            if todo_id not in self._todos:
-                return None
-
-            # Update fields if provided
-            if todo_update.title is not None:
-                self._todos[todo_id]["title"] = todo_update.title
-            if todo_update.completed is not None:
-                self._todos[todo_id]["completed"] = todo_update.completed
+            return self._update_locked(todo_id, todo_update)
 
-            return TodoResponse(**self._todos[todo_id])
+    def update_many(
+        self, updates: List[Tuple[str, TodoUpdate]]
+    ) -> List[Optional[TodoResponse]]:
+        """Apply a batch of updates under a single lock acquisition."""
+        with self._lock:
+            return [self._update_locked(todo_id, update) for todo_id, update in updates]
 
     def delete(self, todo_id: str) -> bool:
-        """Remove a todo item with thread safety. Returns True if deleted, False if not found."""
+        """Remove a todo item with thread safety.
+
+        Returns True if deleted, False if not found.
+        """
+        with self._lock:
+            return self._delete_locked(todo_id)
+
+    def delete_many(self, todo_ids: List[str]) -> List[bool]:
+        """Delete a batch of todos under a single lock acquisition."""
         with self._lock:
-            if todo_id in self._todos:
-                del self._todos[todo_id]
-                return True
-            return False
+            return [self._delete_locked(todo_id) for todo_id in todo_ids]
+
+    def _create_locked(self, todo: TodoCreate) -> TodoResponse:
+        todo_id = str(self._counter + 1)
+        record = TodoRecord(todo_id, todo.title, todo.completed, self._version + 1)
+        self._journal("create", todo_id, record)
+
+        self._counter += 1
+        self._version = record.version
+        self._todos[todo_id] = record
+        self._order.add(self._counter)
+        self._by_status[todo.completed].add(self._counter)
+        self._title_index.add(self._counter, todo.title)
+        self._on_write("create", todo_id, record)
+        return record.to_response()
+
+    def _update_locked(
+        self, todo_id: str, todo_update: TodoUpdate
+    ) -> Optional[TodoResponse]:
+        old = self._todos.get(todo_id)
+        if old is None:
+            return None
+
+        # Replace rather than modify: readers may still be rendering ``old``
+        record = TodoRecord(
+            todo_id,
+            old.title if todo_update.title is None else todo_update.title,
+            old.completed if todo_update.completed is None else todo_update.completed,
+            self._version + 1,
+        )
+        self._journal("update", todo_id, record)
+
+        self._version = record.version
+        self._todos[todo_id] = record
+
+        # Update indexes for the fields that were provided
+        if todo_update.title is not None:
+            self._title_index.add(int(todo_id), todo_update.title)
+        if record.completed != old.completed:
+            self._by_status[old.completed].discard(int(todo_id))
+            self._by_status[record.completed].add(int(todo_id))
+
+        self._on_write("update", todo_id, record)
+        return record.to_response()
+
+    def _delete_locked(self, todo_id: str) -> bool:
+        if todo_id in self._todos:
+            self._journal("delete", todo_id, None)
+
+            record = self._todos.pop(todo_id)
+            self._version += 1
+            self._order.discard(int(todo_id))
+            self._by_status[record.completed].discard(int(todo_id))
+            self._title_index.discard(int(todo_id))
+            self._on_write("delete", todo_id, None)
+            return True
+        return False
 
     def clear(self):
         """Clear all todos (for testing purposes)."""
         with self._lock:
+            self._journal("clear", None, None)
+
             self._todos.clear()
+            self._order.clear()
+            for index in self._by_status.values():
+                index.clear()
+            self._title_index.clear()
             self._counter = 0
+            self._version += 1
+            self._on_write("clear", None, None)
+
+    def _rebuild_indexes(self):
+        """Recompute derived state from ``_todos`` (e.g. after recovery)."""
+        # Recovered todos carry no version; stamp them with this run's start
+        # (before any reader can see them)
+        for record in self._todos.values():
+            record.version = self._version
+        self._order = OrderedIdIndex(int(todo_id) for todo_id in self._todos)
+        self._by_status = {
+            status: OrderedIdIndex(
+                int(todo_id)
+                for todo_id, record in self._todos.items()
+                if record.completed is status
+            )
+            for status in (False, True)
+        }
+        self._title_index = TitleIndex()
+        for todo_id, record in self._todos.items():
+            self._title_index.add(int(todo_id), record.title)
+
+    def _journal(self, op: str, todo_id: Optional[str], record: Optional[TodoRecord]):
+        """Hook called under the lock before a mutation is applied.
+
+        Persistent subclasses record the change here, ahead of it. If this
+        raises, nothing has been changed yet, so the failed write is never
+        visible to readers, versions or the change log.
+        """
+
+    def _on_write(self, op: str, todo_id: Optional[str], record: Optional[TodoRecord]):
+        """Hook called under the lock after every mutation.
+
+        Records the change for delta sync. Clearing the store cannot be expressed
+        as per-todo changes, so it empties the change log instead and
+        clients holding older sequence numbers must resync.
+        """
+        if op == "clear":
+            self._changes.reset(self._version)
+        else:
+            self._changes.append(self._version, op, todo_id, record)
+
+
+def create_todo_store(settings: Optional[Settings] = None) -> BaseTodoStore:
+    """Create the todo store selected by ``settings.storage_backend``."""
+    settings = settings or get_settings()
+
+    if settings.storage_backend == "memory":
+        return TodoStore(change_retention=settings.change_retention)
+    if settings.storage_backend == "striped":
+        from src.storage.striped import StripedTodoStore
+
+        return StripedTodoStore.from_settings(settings)
+    if settings.storage_backend == "wal":
+        from src.storage.wal import WALTodoStore
+
+        return WALTodoStore.from_settings(settings)
+    if settings.storage_backend == "sqlite":
+        from src.storage.sqlite import SQLiteTodoStore
+
+        return SQLiteTodoStore.from_settings(settings)
+
+    raise ValueError(f"Unknown storage backend '{settings.storage_backend}'")
 
 
-# Global instance
-_store = TodoStore()
+# Global instance, created on first use so persistent backends do not touch
+# the disk at import time
+_store: Optional[BaseTodoStore] = None
+_store_lock = threading.Lock()
 
 
-def get_todo_store() -> TodoStore:
+def get_todo_store() -> BaseTodoStore:
     """Get the global todo store instance."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = create_todo_store()
     return _store
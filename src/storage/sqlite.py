@@ -0,0 +1,598 @@
+"""SQLite storage for todo items."""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+from src.config import Settings
+from src.models.todo import TodoCreate, TodoUpdate, TodoResponse
+from src.storage.base import BaseTodoStore
+from src.storage.changes import DELETE, Change, ChangeBatch, build_batch
+from src.storage.encoding import encode_todo
+from src.storage.indexes import index_terms, query_terms, title_matches
+
+# Statements are kept as module constants: sqlite3 caches prepared statements
+# per connection keyed by SQL text, so reusing the exact same strings means
+# every pooled connection compiles each statement only once.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS todos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_todos_completed ON todos (completed, id);
+"""
+# Versions for ETags: a single-row table holds the collection version, and
+# triggers bump it on every write and stamp it on the written row
+_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS todos_version (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    version INTEGER NOT NULL
+);
+"""
+# Delta sync: the same triggers log each write's version, operation and
+# todo ID in todos_changes, which keeps the newest ``retention`` rows. ``start`` is the
+# version the log began at, the oldest ``since`` an empty log can answer.
+_CHANGES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS todos_changes (
+    seq INTEGER PRIMARY KEY,
+    todo_id INTEGER NOT NULL,
+    op TEXT NOT NULL DEFAULT 'update'
+);
+CREATE TABLE IF NOT EXISTS todos_changes_window (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    start INTEGER NOT NULL,
+    retention INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS todos_changes_prune AFTER INSERT ON todos_changes BEGIN
+    DELETE FROM todos_changes
+    WHERE seq <= new.seq - (SELECT retention FROM todos_changes_window);
+END;
+"""
+_HAS_CHANGE_OP_COLUMN = (
+    "SELECT 1 FROM pragma_table_info('todos_changes') WHERE name = 'op'"
+)
+_ADD_CHANGE_OP_COLUMN = (
+    "ALTER TABLE todos_changes ADD COLUMN op TEXT NOT NULL DEFAULT 'update'"
+)
+_INIT_CHANGES_WINDOW = (
+    "INSERT INTO todos_changes_window (id, start, retention) "
+    "SELECT 0, version, ? FROM todos_version WHERE true "
+    "ON CONFLICT (id) DO UPDATE SET retention = excluded.retention"
+)
+# Recreated on every open, in one transaction, so databases created before
+# a trigger changed pick up its current definition
+_VERSION_TRIGGERS = """
+BEGIN;
+DROP TRIGGER IF EXISTS todos_version_insert;
+CREATE TRIGGER todos_version_insert AFTER INSERT ON todos BEGIN
+    UPDATE todos_version SET version = version + 1;
+    UPDATE todos SET version = (SELECT version FROM todos_version) WHERE id = new.id;
+    INSERT INTO todos_changes (seq, todo_id, op)
+    SELECT version, new.id, 'create' FROM todos_version;
+END;
+DROP TRIGGER IF EXISTS todos_version_update;
+CREATE TRIGGER todos_version_update
+AFTER UPDATE OF title, completed ON todos BEGIN
+    UPDATE todos_version SET version = version + 1;
+    UPDATE todos SET version = (SELECT version FROM todos_version) WHERE id = new.id;
+    INSERT INTO todos_changes (seq, todo_id, op)
+    SELECT version, new.id, 'update' FROM todos_version;
+END;
+DROP TRIGGER IF EXISTS todos_version_delete;
+CREATE TRIGGER todos_version_delete AFTER DELETE ON todos BEGIN
+    UPDATE todos_version SET version = version + 1;
+    INSERT INTO todos_changes (seq, todo_id, op)
+    SELECT version, old.id, 'delete' FROM todos_version;
+END;
+COMMIT;
+"""
+_HAS_VERSION_COLUMN = "SELECT 1 FROM pragma_table_info('todos') WHERE name = 'version'"
+_ADD_VERSION_COLUMN = "ALTER TABLE todos ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+# Like the in-memory stores, a new database starts counting from the wall
+# clock so a recreated file does not reuse versions clients may still hold
+_INIT_VERSION = "INSERT OR IGNORE INTO todos_version (id, version) VALUES (0, ?)"
+_SELECT_COLLECTION_VERSION = "SELECT version FROM todos_version"
+_SELECT_TODO_VERSION = "SELECT version FROM todos WHERE id = ?"
+# Retained changes are contiguous versions, so the oldest answerable
+# ``since`` is just before the oldest row
+_SELECT_CHANGES_WINDOW = (
+    "SELECT v.version, COALESCE((SELECT min(seq) - 1 FROM todos_changes), w.start) "
+    "FROM todos_version v, todos_changes_window w"
+)
+_SELECT_CHANGES = (
+    "SELECT c.seq, c.op, c.todo_id, t.title, t.completed FROM todos_changes c "
+    "LEFT JOIN todos t ON t.id = c.todo_id AND c.op != 'delete' "
+    "WHERE c.seq > ? ORDER BY c.seq LIMIT ?"
+)
+# Title search: an FTS5 table holds the same terms as the in-memory
+# TitleIndex (word prefixes, CJK characters and bigrams), computed by the
+# todo_terms() Python function and kept in sync by triggers. Diacritics are
+# kept, as they are in TitleIndex: "cafe" must not match "Café"
+_FTS_TOKENIZER = "unicode61 remove_diacritics 0"
+_FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS todos_fts
+USING fts5(terms, tokenize='{_FTS_TOKENIZER}');
+CREATE TRIGGER IF NOT EXISTS todos_fts_insert AFTER INSERT ON todos BEGIN
+    INSERT INTO todos_fts (rowid, terms) VALUES (new.id, todo_terms(new.title));
+END;
+CREATE TRIGGER IF NOT EXISTS todos_fts_update AFTER UPDATE OF title ON todos BEGIN
+    UPDATE todos_fts SET terms = todo_terms(new.title) WHERE rowid = new.id;
+END;
+CREATE TRIGGER IF NOT EXISTS todos_fts_delete AFTER DELETE ON todos BEGIN
+    DELETE FROM todos_fts WHERE rowid = old.id;
+END;
+"""
+_FTS_DEFINITION = "SELECT sql FROM sqlite_master WHERE name = 'todos_fts'"
+# Tables built with another tokenizer are dropped and backfilled again
+_DROP_FTS = "DROP TABLE todos_fts"
+_FTS_BACKFILL = (
+    "INSERT INTO todos_fts (rowid, terms) SELECT id, todo_terms(title) FROM todos"
+)
+_INSERT = "INSERT INTO todos (title, completed) VALUES (?, ?) RETURNING id"
+_SELECT_ONE = "SELECT id, title, completed FROM todos WHERE id = ?"
+_SELECT_ONE_VERSIONED = "SELECT id, title, completed, version FROM todos WHERE id = ?"
+_SELECT_ALL = "SELECT id, title, completed FROM todos ORDER BY id"
+_SELECT_BY_STATUS = (
+    "SELECT id, title, completed FROM todos WHERE completed = ? ORDER BY id"
+)
+_SELECT_PAGE = "SELECT id, title, completed FROM todos WHERE id > ? ORDER BY id LIMIT ?"
+_SELECT_PAGE_BY_STATUS = (
+    "SELECT id, title, completed FROM todos "
+    "WHERE completed = ? AND id > ? ORDER BY id LIMIT ?"
+)
+_SEARCH = (
+    "SELECT t.id, t.title, t.completed FROM todos_fts "
+    "JOIN todos t ON t.id = todos_fts.rowid "
+    "WHERE todos_fts MATCH ? ORDER BY t.id"
+)
+_UPDATE = (
+    "UPDATE todos SET title = COALESCE(?, title), completed = COALESCE(?, completed) "
+    "WHERE id = ? RETURNING id, title, completed"
+)
+_DELETE = "DELETE FROM todos WHERE id = ?"
+_DELETE_ALL = "DELETE FROM todos"
+_RESET_SEQUENCE = "DELETE FROM sqlite_sequence WHERE name = 'todos'"
+# After a clear the change log starts over at the current version: IDs are
+# reused, so older rows would describe todos that no longer exist
+_DELETE_CHANGES = "DELETE FROM todos_changes"
+_RESTART_CHANGES_WINDOW = (
+    "UPDATE todos_changes_window SET start = (SELECT version FROM todos_version)"
+)
+
+_STATEMENT_CACHE_SIZE = 32
+
+DATABASE_FILENAME = "todos.db"
+
+
+# Largest value SQLite can store in an INTEGER column
+_MAX_ROWID = 2**63 - 1
+
+
+def _parse_id(todo_id: str) -> Optional[int]:
+    """Convert an API ID to a rowid, or None for IDs no todo can have.
+
+    Only IDs in the form the store hands out match: ASCII digits without a
+    leading zero, within SQLite's integer range. Other spellings of a number
+    ("01", " 1", "1_0") are missing, as they are in the in-memory stores,
+    and out-of-range values never reach SQLite, which could not bind them.
+    """
+    if not (todo_id.isascii() and todo_id.isdigit()) or todo_id[0] == "0":
+        return None
+    if len(todo_id) > 19:
+        return None
+
+    rowid = int(todo_id)
+    return rowid if rowid <= _MAX_ROWID else None
+
+
+def _todo_terms(title: str) -> str:
+    return " ".join(sorted(index_terms(title)))
+
+
+Row = Tuple[int, str, int]
+
+
+def _to_response(row: Row) -> TodoResponse:
+    return TodoResponse(id=str(row[0]), title=row[1], completed=bool(row[2]))
+
+
+def _to_json(row: Row) -> bytes:
+    # The database is the source of truth, so rows are encoded directly
+    # rather than cached; this still skips building Pydantic models
+    return encode_todo(str(row[0]), row[1], bool(row[2]))
+
+
+def _to_change(row: Tuple[int, str, int, Optional[str], Optional[int]]) -> Change:
+    seq, op, rowid, title, completed = row
+    # Joined with the todo's current row: one written and deleted since
+    # is already gone, and is reported as deleted
+    if title is None:
+        return seq, DELETE, str(rowid), None
+    return seq, op, str(rowid), encode_todo(str(rowid), title, bool(completed))
+
+
+class ConnectionPool:
+    """Small bounded pool of SQLite connections.
+
+    Each connection is used by one thread at a time. Idle connections are
+    handed out most-recently-used first so a busy pool keeps reusing warm
+    connections (and their prepared statement caches).
+    """
+
+    def __init__(self, path: str, size: int = 4):
+        if size < 1:
+            raise ValueError("SQLite pool size must be at least 1")
+
+        self.path = path
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # isolation_level=None: autocommit, transactions are explicit
+        conn = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: commits do not fsync, checkpoints do
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.create_function("todo_terms", 1, _todo_terms, deterministic=True)
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._all) < self.size:
+                conn = self._connect()
+                self._all.append(conn)
+                return conn
+
+        return self._idle.get()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of the block."""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        """Close every connection created by the pool."""
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+        self._idle = queue.LifoQueue()
+
+
+class SQLiteTodoStore(BaseTodoStore):
+    """Todo storage backed by an SQLite database in WAL mode.
+
+    Readers never block the writer and vice versa; SQLite itself serialises
+    writers, so no Python-level lock is needed. Title search runs on an
+    FTS5 table maintained by triggers, so every write stays one statement.
+
+    The delta sync change log is a table filled by the same triggers. A
+    change is reported with the todo's current row rather than the row as
+    it was written, which can only be newer; a deleted todo is a tombstone.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4, change_retention: int = 10_000):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._pool = ConnectionPool(path, pool_size)
+        with self._pool.connection() as conn:
+            conn.executescript(_SCHEMA)
+            if conn.execute(_HAS_VERSION_COLUMN).fetchone() is None:
+                conn.execute(_ADD_VERSION_COLUMN)
+            conn.executescript(_VERSION_TABLE)
+            conn.execute(_INIT_VERSION, (time.time_ns(),))
+            conn.executescript(_CHANGES_SCHEMA)
+            if conn.execute(_HAS_CHANGE_OP_COLUMN).fetchone() is None:
+                conn.execute(_ADD_CHANGE_OP_COLUMN)
+            conn.execute(_INIT_CHANGES_WINDOW, (change_retention,))
+            conn.executescript(_VERSION_TRIGGERS)
+            fts = conn.execute(_FTS_DEFINITION).fetchone()
+            backfill = fts is None or _FTS_TOKENIZER not in fts[0]
+            if fts is not None and backfill:
+                conn.execute(_DROP_FTS)
+            conn.executescript(_FTS_SCHEMA)
+            if backfill:
+                conn.execute(_FTS_BACKFILL)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SQLiteTodoStore":
+        """Create a store from application settings."""
+        return cls(
+            os.path.join(settings.data_dir, DATABASE_FILENAME),
+            pool_size=settings.sqlite_pool_size,
+            change_retention=settings.change_retention,
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run several statements in one write transaction (one commit)."""
+        with self._pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def create(self, todo: TodoCreate) -> TodoResponse:
+        """Insert a new todo; SQLite assigns the next ID."""
+        with self._pool.connection() as conn:
+            # fetchall() steps RETURNING statements to completion so the
+            # autocommit transaction ends before the connection is returned
+            [(rowid,)] = conn.execute(_INSERT, (todo.title, todo.completed)).fetchall()
+        return TodoResponse(id=str(rowid), title=todo.title, completed=todo.completed)
+
+    def create_many(self, todos: List[TodoCreate]) -> List[TodoResponse]:
+        """Insert a batch of todos in one transaction."""
+        created = []
+        with self.transaction() as conn:
+            for todo in todos:
+                [(rowid,)] = conn.execute(
+                    _INSERT, (todo.title, todo.completed)
+                ).fetchall()
+                created.append(
+                    TodoResponse(
+                        id=str(rowid), title=todo.title, completed=todo.completed
+                    )
+                )
+        return created
+
+    def collection_version(self) -> int:
+        """Return the collection version maintained by triggers."""
+        with self._pool.connection() as conn:
+            return conn.execute(_SELECT_COLLECTION_VERSION).fetchone()[0]
+
+    def todo_version(self, todo_id: str) -> Optional[int]:
+        """Return the version of one todo."""
+        rowid = _parse_id(todo_id)
+        if rowid is None:
+            return None
+
+        with self._pool.connection() as conn:
+            row = conn.execute(_SELECT_TODO_VERSION, (rowid,)).fetchone()
+        return row[0] if row else None
+
+    def changes_json(self, since: int, limit: int) -> Optional[ChangeBatch]:
+        """Return changes after ``since`` from the change log table."""
+        with self._pool.connection() as conn:
+            # One read transaction, so pruning cannot open a gap between
+            # checking the window and reading from it
+            conn.execute("BEGIN")
+            try:
+                version, floor = conn.execute(_SELECT_CHANGES_WINDOW).fetchone()
+                rows = []
+                if floor <= since <= version:
+                    rows = conn.execute(_SELECT_CHANGES, (since, limit + 1)).fetchall()
+            finally:
+                conn.execute("COMMIT")
+
+        if not floor <= since <= version:
+            return None
+        return build_batch([_to_change(row) for row in rows], since, limit)
+
+    def get(self, todo_id: str) -> Optional[TodoResponse]:
+        """Retrieve a todo item by ID."""
+        return self._get(todo_id, _to_response)
+
+    def get_json(self, todo_id: str) -> Optional[bytes]:
+        """Retrieve a todo item as JSON bytes."""
+        return self._get(todo_id, _to_json)
+
+    def get_versioned_json(self, todo_id: str) -> Optional[Tuple[int, bytes]]:
+        """Return a todo's version and JSON bytes from a single row read."""
+        rowid = _parse_id(todo_id)
+        if rowid is None:
+            return None
+
+        with self._pool.connection() as conn:
+            row = conn.execute(_SELECT_ONE_VERSIONED, (rowid,)).fetchone()
+        return (row[3], _to_json(row)) if row else None
+
+    def list_all(self, completed: Optional[bool] = None) -> List[TodoResponse]:
+        """Return all todo items in ID order."""
+        return self._list_all(completed, _to_response)
+
+    def list_all_json(self, completed: Optional[bool] = None) -> List[bytes]:
+        """Return all todo items in ID order as JSON bytes."""
+        return self._list_all(completed, _to_json)
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[TodoResponse], Optional[str]]:
+        """Return one page of todos with an index range scan."""
+        return self._list_page(limit, after, completed, _to_response)
+
+    def list_page_json(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """Return one page of todos as JSON bytes."""
+        return self._list_page(limit, after, completed, _to_json)
+
+    def search(self, query: str, limit: int) -> List[TodoResponse]:
+        """Search titles through the FTS5 term table."""
+        return self._search(query, limit, _to_response)
+
+    def search_json(self, query: str, limit: int) -> List[bytes]:
+        """Search titles, returning JSON bytes."""
+        return self._search(query, limit, _to_json)
+
+    def _get(self, todo_id: str, render: Callable[[Row], Any]) -> Any:
+        rowid = _parse_id(todo_id)
+        if rowid is None:
+            return None
+
+        with self._pool.connection() as conn:
+            row = conn.execute(_SELECT_ONE, (rowid,)).fetchone()
+        return render(row) if row else None
+
+    def _list_all(
+        self, completed: Optional[bool], render: Callable[[Row], Any]
+    ) -> List[Any]:
+        with self._pool.connection() as conn:
+            if completed is None:
+                rows = conn.execute(_SELECT_ALL).fetchall()
+            else:
+                rows = conn.execute(_SELECT_BY_STATUS, (completed,)).fetchall()
+        return [render(row) for row in rows]
+
+    def scan_json(
+        self, completed: Optional[bool] = None, batch_size: int = 1000
+    ) -> Iterator[List[bytes]]:
+        """Yield the todos as JSON bytes from a single read transaction.
+
+        The transaction pins one snapshot of the database (WAL mode keeps it
+        stable while writers commit), so the scan reflects a single point in
+        time. Its connection stays out of the pool until the scan finishes
+        or the iterator is closed.
+        """
+        with self._pool.connection() as conn:
+            conn.execute("BEGIN")
+            cursor = None
+            try:
+                if completed is None:
+                    cursor = conn.execute(_SELECT_ALL)
+                else:
+                    cursor = conn.execute(_SELECT_BY_STATUS, (completed,))
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    yield [_to_json(row) for row in rows]
+            finally:
+                if cursor is not None:
+                    cursor.close()
+                conn.execute("COMMIT")
+
+    def _list_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        completed: Optional[bool],
+        render: Callable[[Row], Any],
+    ) -> Tuple[List[Any], Optional[str]]:
+        after_id = int(after) if after else 0
+        with self._pool.connection() as conn:
+            if completed is None:
+                rows = conn.execute(_SELECT_PAGE, (after_id, limit + 1)).fetchall()
+            else:
+                rows = conn.execute(
+                    _SELECT_PAGE_BY_STATUS, (completed, after_id, limit + 1)
+                ).fetchall()
+
+        todos = [render(row) for row in rows[:limit]]
+        next_after = str(rows[limit - 1][0]) if len(rows) > limit else None
+        return todos, next_after
+
+    def _search(
+        self, query: str, limit: int, render: Callable[[Row], Any]
+    ) -> List[Any]:
+        tokens, terms, verify = query_terms(query)
+        if not terms:
+            return []
+
+        match = " AND ".join(f'"{term}"' for term in sorted(set(terms)))
+        todos = []
+        with self._pool.connection() as conn:
+            for row in conn.execute(_SEARCH, (match,)):
+                if verify and not title_matches(row[1], tokens):
+                    continue
+                todos.append(render(row))
+                if len(todos) == limit:
+                    break
+        return todos
+
+    def update(self, todo_id: str, todo_update: TodoUpdate) -> Optional[TodoResponse]:
+        """Update the provided fields in a single statement."""
+        rowid = _parse_id(todo_id)
+        if rowid is None:
+            return None
+
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                _UPDATE, (todo_update.title, todo_update.completed, rowid)
+            ).fetchall()
+        return _to_response(rows[0]) if rows else None
+
+    def update_many(
+        self, updates: List[Tuple[str, TodoUpdate]]
+    ) -> List[Optional[TodoResponse]]:
+        """Apply a batch of updates in one transaction."""
+        results = []
+        with self.transaction() as conn:
+            for todo_id, update in updates:
+                rowid = _parse_id(todo_id)
+                rows = []
+                if rowid is not None:
+                    rows = conn.execute(
+                        _UPDATE, (update.title, update.completed, rowid)
+                    ).fetchall()
+                results.append(_to_response(rows[0]) if rows else None)
+        return results
+
+    def delete(self, todo_id: str) -> bool:
+        """Remove a todo item. Returns True if deleted, False if not found."""
+        rowid = _parse_id(todo_id)
+        if rowid is None:
+            return False
+
+        with self._pool.connection() as conn:
+            return conn.execute(_DELETE, (rowid,)).rowcount > 0
+
+    def delete_many(self, todo_ids: List[str]) -> List[bool]:
+        """Delete a batch of todos in one transaction."""
+        results = []
+        with self.transaction() as conn:
+            for todo_id in todo_ids:
+                rowid = _parse_id(todo_id)
+                results.append(
+                    rowid is not None and conn.execute(_DELETE, (rowid,)).rowcount > 0
+                )
+        return results
+
+    def clear(self):
+        """Delete all todos and restart IDs at 1 (for testing purposes).
+
+        The change log is emptied too, so a ``since`` from before the clear
+        gets None (410) instead of rows joined to todos reusing old IDs.
+        """
+        with self.transaction() as conn:
+            conn.execute(_DELETE_ALL)
+            conn.execute(_RESET_SEQUENCE)
+            conn.execute(_DELETE_CHANGES)
+            conn.execute(_RESTART_CHANGES_WINDOW)
+
+    def close(self):
+        """Close all pooled connections."""
+        self._pool.close()
@@ -0,0 +1,413 @@
+"""Lock-striped in-memory storage for todo items."""
+
+import itertools
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from src.config import Settings
+from src.models.todo import TodoCreate, TodoUpdate, TodoResponse
+from src.observability.timing import TimedLock
+from src.storage.base import BaseTodoStore
+from src.storage.changes import (
+    CREATE,
+    DELETE,
+    UPDATE,
+    ChangeBatch,
+    ChangeLog,
+    build_batch,
+)
+from src.storage.indexes import (
+    OrderedIdIndex,
+    TitleIndex,
+    index_terms,
+    query_terms,
+    title_matches,
+)
+from src.storage.records import TodoRecord
+
+
+class _Stripe:
+    """One partition of the store with its own lock."""
+
+    __slots__ = ("lock", "todos")
+
+    def __init__(self):
+        self.lock = TimedLock()
+        self.todos: Dict[str, TodoRecord] = {}
+
+
+def _peek_terms(
+    stripe: _Stripe, todo_id: str
+) -> Tuple[Optional[str], Optional[Set[str]]]:
+    """Tokenize a todo's current title before its stripe lock is taken.
+
+    Records are immutable and a dict lookup is atomic, so the unlocked read
+    is safe; callers check the title again under the lock, as another
+    writer may change it first.
+    """
+    record = stripe.todos.get(todo_id)
+    if record is None:
+        return None, None
+    return record.title, index_terms(record.title)
+
+
+# Turns a stored record into what a read method returns; called after the
+# stripe lock is released, as records are never modified
+Render = Callable[[TodoRecord], Any]
+
+_to_response = TodoRecord.to_response
+_to_json = TodoRecord.to_json
+
+
+def _to_versioned_json(record: TodoRecord) -> Tuple[int, bytes]:
+    return record.version, record.to_json()
+
+
+class StripedTodoStore(BaseTodoStore):
+    """Thread-safe in-memory storage partitioned into lock stripes.
+
+    Todos are spread over ``stripes`` partitions by the hash of their ID,
+    and each partition has its own lock, so operations on different todos
+    rarely wait for each other. IDs come from ``itertools.count``, whose
+    ``next()`` is atomic in CPython, so allocation needs no lock at all.
+
+    Indexes that span every stripe (the ordered ID, status and title
+    indexes) sit behind a separate ``_index_lock``. It is
+    held only for the index update itself, and always acquired after the
+    stripe lock, so index order matches record state without deadlocks.
+    Titles are tokenized before ``_index_lock`` is taken, so it only
+    covers set and list updates.
+
+    The ``*_json`` read methods return each todo's JSON encoding, cached
+    on its record; updates replace records rather than modifying them, so
+    reads only copy references under a stripe lock and render afterwards.
+    The collection version is bumped, and the write appended to the delta
+    sync change log, under ``_index_lock``, which every write takes anyway.
+    """
+
+    blocking = False
+
+    def __init__(self, stripes: int = 16, change_retention: int = 10_000):
+        if stripes < 1:
+            raise ValueError("Number of stripes must be at least 1")
+
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self._ids = itertools.count(1)
+        self._index_lock = TimedLock()
+        # Starts from the wall clock so versions are not reused after a restart
+        self._version = time.time_ns()
+        self._changes = ChangeLog(self._version, change_retention)
+        self._order = OrderedIdIndex()
+        self._by_status = {False: OrderedIdIndex(), True: OrderedIdIndex()}
+        self._title_index = TitleIndex()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "StripedTodoStore":
+        """Create a store from application settings."""
+        return cls(
+            stripes=settings.storage_stripes,
+            change_retention=settings.change_retention,
+        )
+
+    def collection_version(self) -> int:
+        """Return the version of the last write."""
+        return self._version
+
+    def todo_version(self, todo_id: str) -> Optional[int]:
+        """Return the version of the last write to one todo."""
+        stripe = self._stripe_for(todo_id)
+        with stripe.lock:
+            record = stripe.todos.get(todo_id)
+            return record.version if record else None
+
+    def _stripe_for(self, todo_id: str) -> _Stripe:
+        return self._stripes[hash(todo_id) % len(self._stripes)]
+
+    def create(self, todo: TodoCreate) -> TodoResponse:
+        """Create a new todo item; only the owning stripe is locked."""
+        todo_id = str(next(self._ids))
+        record = TodoRecord(todo_id, todo.title, todo.completed)
+        terms = index_terms(todo.title)
+
+        stripe = self._stripe_for(todo_id)
+        with stripe.lock:
+            stripe.todos[todo_id] = record
+            with self._index_lock:
+                self._version += 1
+                record.version = self._version
+                self._changes.append(self._version, CREATE, todo_id, record)
+                self._order.add(int(todo_id))
+                self._by_status[todo.completed].add(int(todo_id))
+                self._title_index.add(int(todo_id), todo.title, terms)
+        return record.to_response()
+
+    def get(self, todo_id: str) -> Optional[TodoResponse]:
+        """Retrieve a todo item by ID."""
+        return self._read(todo_id, _to_response)
+
+    def get_json(self, todo_id: str) -> Optional[bytes]:
+        """Retrieve a todo item as cached JSON bytes."""
+        return self._read(todo_id, _to_json)
+
+    def get_versioned_json(self, todo_id: str) -> Optional[Tuple[int, bytes]]:
+        """Return a todo's version and cached JSON, both from one record."""
+        return self._read(todo_id, _to_versioned_json)
+
+    def list_all(self, completed: Optional[bool] = None) -> List[TodoResponse]:
+        """Return all todo items in ID order, locking one stripe at a time."""
+        return self._list_all(completed, _to_response)
+
+    def list_all_json(self, completed: Optional[bool] = None) -> List[bytes]:
+        """Return all todo items in ID order as cached JSON bytes."""
+        return self._list_all(completed, _to_json)
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[TodoResponse], Optional[str]]:
+        """Return one page of todos using the ordered ID or status index."""
+        return self._list_page(limit, after, completed, _to_response)
+
+    def list_page_json(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """Return one page of todos as cached JSON bytes."""
+        return self._list_page(limit, after, completed, _to_json)
+
+    def search(self, query: str, limit: int) -> List[TodoResponse]:
+        """Search titles through the inverted title index."""
+        return self._search(query, limit, _to_response)
+
+    def search_json(self, query: str, limit: int) -> List[bytes]:
+        """Search titles, returning cached JSON bytes."""
+        return self._search(query, limit, _to_json)
+
+    def changes_json(self, since: int, limit: int) -> Optional[ChangeBatch]:
+        """Return changes after ``since`` from the in-memory change log."""
+        with self._index_lock:
+            # One extra entry tells whether more changes follow
+            entries = self._changes.read(since, limit + 1, self._version)
+        if entries is None:
+            return None
+
+        return build_batch(
+            [
+                (seq, op, todo_id, None if record is None else record.to_json())
+                for seq, op, todo_id, record in entries
+            ],
+            since,
+            limit,
+        )
+
+    def scan_json(
+        self, completed: Optional[bool] = None, batch_size: int = 1000
+    ) -> Iterator[List[bytes]]:
+        """Yield a point-in-time snapshot of the todos as JSON bytes.
+
+        Every stripe lock is held while the record references are copied
+        (taken in the same order as ``clear``), so no write is half-visible
+        across stripes. Records are never modified, so they are rendered
+        batch by batch after the locks are released.
+        """
+        for stripe in self._stripes:
+            stripe.lock.acquire()
+        try:
+            if completed is None:
+                records = [
+                    record
+                    for stripe in self._stripes
+                    for record in stripe.todos.values()
+                ]
+            else:
+                # No write is in progress, so the index matches the stripes
+                with self._index_lock:
+                    ids = list(map(str, self._by_status[completed]))
+                records = [self._stripe_for(todo_id).todos[todo_id] for todo_id in ids]
+        finally:
+            for stripe in reversed(self._stripes):
+                stripe.lock.release()
+
+        if completed is None:
+            records.sort(key=lambda record: int(record.id))
+        for start in range(0, len(records), batch_size):
+            yield [record.to_json() for record in records[start : start + batch_size]]
+
+    def _read(
+        self,
+        todo_id: str,
+        render: Render,
+        accept: Optional[Callable[[TodoRecord], bool]] = None,
+    ) -> Any:
+        """Render one todo if it exists and is accepted.
+
+        Only the lookup holds the stripe lock; the record it returns is
+        never modified, so it is checked and rendered after release.
+        """
+        stripe = self._stripe_for(todo_id)
+        with stripe.lock:
+            record = stripe.todos.get(todo_id)
+        if record is None or (accept is not None and not accept(record)):
+            return None
+        return render(record)
+
+    def _list_all(self, completed: Optional[bool], render: Render) -> List[Any]:
+        if completed is not None:
+            return self._list_by_status(completed, render)
+
+        records: List[TodoRecord] = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                records.extend(stripe.todos.values())
+
+        records.sort(key=lambda record: int(record.id))
+        return [render(record) for record in records]
+
+    def _list_by_status(self, completed: bool, render: Render) -> List[Any]:
+        """Render the todos with one status, visiting only those in its index."""
+        with self._index_lock:
+            ids = list(self._by_status[completed])
+
+        # Group the IDs by stripe so each stripe lock is taken once
+        by_stripe: Dict[int, List[str]] = {}
+        for todo_id in map(str, ids):
+            by_stripe.setdefault(hash(todo_id) % len(self._stripes), []).append(todo_id)
+
+        records: List[TodoRecord] = []
+        for index, todo_ids in by_stripe.items():
+            stripe = self._stripes[index]
+            with stripe.lock:
+                todos = stripe.todos
+                records.extend(
+                    record
+                    for record in map(todos.get, todo_ids)
+                    # Skip todos deleted or re-labelled since the index read
+                    if record is not None and record.completed is completed
+                )
+
+        records.sort(key=lambda record: int(record.id))
+        return [render(record) for record in records]
+
+    def _list_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        completed: Optional[bool],
+        render: Render,
+    ) -> Tuple[List[Any], Optional[str]]:
+        index = self._order if completed is None else self._by_status[completed]
+        with self._index_lock:
+            ids = index.after(int(after) if after else 0, limit + 1)
+
+        # Todos deleted or re-labelled since the scan are skipped
+        def accept(record: TodoRecord) -> bool:
+            return completed is None or record.completed is completed
+
+        todos = []
+        for todo_id in ids[:limit]:
+            todo = self._read(str(todo_id), render, accept)
+            if todo is not None:
+                todos.append(todo)
+
+        next_after = str(ids[limit - 1]) if len(ids) > limit else None
+        return todos, next_after
+
+    def _search(self, query: str, limit: int, render: Render) -> List[Any]:
+        tokens, terms, verify = query_terms(query)
+        with self._index_lock:
+            ids = self._title_index.search(terms, None if verify else limit)
+
+        # Skip todos deleted or retitled since the index lookup
+        def accept(record: TodoRecord) -> bool:
+            return title_matches(record.title, tokens)
+
+        todos = []
+        for todo_id in ids:
+            todo = self._read(str(todo_id), render, accept)
+            if todo is None:
+                continue
+            todos.append(todo)
+            if len(todos) == limit:
+                break
+        return todos
+
+    def update(self, todo_id: str, todo_update: TodoUpdate) -> Optional[TodoResponse]:
+        """Update an existing todo item under its stripe lock."""
+        stripe = self._stripe_for(todo_id)
+        if todo_update.title is not None:
+            terms = index_terms(todo_update.title)
+            seen_title, old_terms = _peek_terms(stripe, todo_id)
+
+        with stripe.lock:
+            old = stripe.todos.get(todo_id)
+            if old is None:
+                return None
+
+            with self._index_lock:
+                self._version += 1
+                record = TodoRecord(
+                    todo_id,
+                    old.title if todo_update.title is None else todo_update.title,
+                    (
+                        old.completed
+                        if todo_update.completed is None
+                        else todo_update.completed
+                    ),
+                    self._version,
+                )
+                stripe.todos[todo_id] = record
+                self._changes.append(self._version, UPDATE, todo_id, record)
+
+                # Update indexes for the fields that were provided
+                if todo_update.title is not None:
+                    if seen_title != old.title:
+                        old_terms = None  # Retitled since the peek
+                    self._title_index.discard(int(todo_id), old_terms)
+                    self._title_index.add(int(todo_id), todo_update.title, terms)
+                if record.completed != old.completed:
+                    self._by_status[old.completed].discard(int(todo_id))
+                    self._by_status[record.completed].add(int(todo_id))
+
+        return record.to_response()
+
+    def delete(self, todo_id: str) -> bool:
+        """Remove a todo item. Returns True if deleted, False if not found."""
+        stripe = self._stripe_for(todo_id)
+        seen_title, old_terms = _peek_terms(stripe, todo_id)
+        with stripe.lock:
+            record = stripe.todos.pop(todo_id, None)
+            if record is None:
+                return False
+            if seen_title != record.title:
+                old_terms = None  # Retitled since the peek
+
+            with self._index_lock:
+                self._version += 1
+                self._changes.append(self._version, DELETE, todo_id, None)
+                self._order.discard(int(todo_id))
+                self._by_status[record.completed].discard(int(todo_id))
+                self._title_index.discard(int(todo_id), old_terms)
+            return True
+
+    def clear(self):
+        """Clear all todos (for testing purposes)."""
+        # Take every stripe lock, always in the same order, so clear is atomic
+        for stripe in self._stripes:
+            stripe.lock.acquire()
+        try:
+            for stripe in self._stripes:
+                stripe.todos.clear()
+            with self._index_lock:
+                self._version += 1
+                self._changes.reset(self._version)
+                self._order.clear()
+                for index in self._by_status.values():
+                    index.clear()
+                self._title_index.clear()
+            self._ids = itertools.count(1)
+        finally:
+            for stripe in reversed(self._stripes):
+                stripe.lock.release()
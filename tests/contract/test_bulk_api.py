@@ -0,0 +1,86 @@
+"""Contract tests for the bulk todo endpoints."""
+
+import pytest
+
+
+@pytest.mark.contract
+def test_bulk_create_returns_201_with_results_in_order(client):
+    """Test POST /todos/bulk creates every item and reports each one."""
+    response = client.post(
+        "/todos/bulk",
+        json={
+            "items": [{"title": "購買牛奶"}, {"title": "繳交報告", "completed": True}]
+        },
+    )
+
+    assert response.status_code == 201
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [201, 201]
+    assert [result["todo"]["title"] for result in results] == ["購買牛奶", "繳交報告"]
+    assert results[1]["todo"]["completed"] is True
+    assert [todo["title"] for todo in client.get("/todos").json()] == [
+        "購買牛奶",
+        "繳交報告",
+    ]
+
+
+@pytest.mark.contract
+def test_bulk_create_rejects_whole_batch_on_invalid_item(client):
+    """Test POST /todos/bulk returns 422 and creates nothing if any item is invalid."""
+    response = client.post(
+        "/todos/bulk", json={"items": [{"title": "Valid"}, {"title": ""}]}
+    )
+
+    assert response.status_code == 422
+    assert client.get("/todos").json() == []
+
+
+@pytest.mark.contract
+def test_bulk_requests_enforce_batch_size(client):
+    """Test bulk endpoints reject empty and oversized batches."""
+    assert client.post("/todos/bulk", json={"items": []}).status_code == 422
+    oversized = {"items": [{"title": "x"}] * 1001}
+    assert client.post("/todos/bulk", json=oversized).status_code == 422
+
+
+@pytest.mark.contract
+def test_bulk_update_reports_per_item_status(client):
+    """Test PATCH /todos/bulk updates existing todos and 404s missing ones."""
+    first = client.post("/todos", json={"title": "First"}).json()
+    second = client.post("/todos", json={"title": "Second"}).json()
+
+    response = client.patch(
+        "/todos/bulk",
+        json={
+            "items": [
+                {"id": first["id"], "completed": True},
+                {"id": "999", "title": "Missing"},
+                {"id": second["id"], "title": "Second (edited)"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(result["id"], result["status"]) for result in results] == [
+        (first["id"], 200),
+        ("999", 404),
+        (second["id"], 200),
+    ]
+    assert results[0]["todo"]["completed"] is True
+    assert results[1]["todo"] is None
+    assert client.get(f"/todos/{second['id']}").json()["title"] == "Second (edited)"
+
+
+@pytest.mark.contract
+def test_bulk_delete_reports_per_item_status(client):
+    """Test DELETE /todos/bulk removes existing todos and 404s missing ones."""
+    todo = client.post("/todos", json={"title": "Delete me"}).json()
+
+    response = client.request(
+        "DELETE", "/todos/bulk", json={"ids": [todo["id"], "999"]}
+    )
+
+    assert response.status_code == 200
+    assert [result["status"] for result in response.json()["results"]] == [204, 404]
+    assert client.get(f"/todos/{todo['id']}").status_code == 404
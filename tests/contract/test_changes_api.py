@@ -0,0 +1,78 @@
+"""Contract tests for the delta sync endpoint."""
+
+import pytest
+
+
+def listing_version(client) -> int:
+    """The change sequence number of a full listing (its ETag)."""
+    return int(client.get("/todos").headers["ETag"].strip('"'))
+
+
+@pytest.mark.contract
+def test_changes_since_a_listing(client):
+    """Test GET /todos/changes returns the writes made after a listing."""
+    kept = client.post("/todos", json={"title": "Kept"}).json()
+    removed = client.post("/todos", json={"title": "Removed"}).json()
+    since = listing_version(client)
+
+    client.put(f"/todos/{kept['id']}", json={"completed": True})
+    client.delete(f"/todos/{removed['id']}")
+    response = client.get("/todos/changes", params={"since": since})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"changes", "next_since", "has_more"}
+    assert [change["id"] for change in data["changes"]] == [kept["id"], removed["id"]]
+    assert data["changes"][0]["todo"] == {**kept, "completed": True}
+    assert [change["op"] for change in data["changes"]] == ["update", "delete"]
+    assert data["changes"][1]["deleted"] is True
+    assert data["changes"][1]["todo"] is None
+    assert data["next_since"] == listing_version(client)
+    assert data["has_more"] is False
+
+
+@pytest.mark.contract
+def test_changes_are_paged_by_limit(client):
+    """Test has_more and next_since walk the changes one batch at a time."""
+    since = listing_version(client)
+    for i in range(3):
+        client.post("/todos", json={"title": f"Todo {i}"})
+
+    first = client.get("/todos/changes", params={"since": since, "limit": 2}).json()
+    second = client.get(
+        "/todos/changes", params={"since": first["next_since"], "limit": 2}
+    ).json()
+
+    assert len(first["changes"]) == 2
+    assert first["has_more"] is True
+    assert [change["todo"]["title"] for change in second["changes"]] == ["Todo 2"]
+    assert second["has_more"] is False
+
+
+@pytest.mark.contract
+def test_changes_without_updates_are_empty(client):
+    """Test an up-to-date client gets no changes and keeps its sequence."""
+    client.post("/todos", json={"title": "Todo"})
+    since = listing_version(client)
+
+    response = client.get("/todos/changes", params={"since": since})
+
+    assert response.json() == {"changes": [], "next_since": since, "has_more": False}
+
+
+@pytest.mark.contract
+def test_changes_outside_retention_require_resync(client):
+    """Test a sequence the server no longer covers returns 410 Gone."""
+    client.post("/todos", json={"title": "Todo"})
+
+    response = client.get("/todos/changes", params={"since": 0})
+
+    assert response.status_code == 410
+    assert "resync" in response.json()["detail"]
+
+
+@pytest.mark.contract
+def test_changes_require_since(client):
+    """Test since is a required non-negative integer."""
+    assert client.get("/todos/changes").status_code == 422
+    assert client.get("/todos/changes", params={"since": -1}).status_code == 422
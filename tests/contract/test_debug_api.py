@@ -0,0 +1,45 @@
+"""Contract tests for debug endpoints."""
+
+import pytest
+from src.middleware.metrics import request_latencies
+
+
+@pytest.fixture(autouse=True)
+def reset_latencies():
+    """Start each test with no recorded latencies."""
+    request_latencies.clear()
+    yield
+    request_latencies.clear()
+
+
+@pytest.mark.contract
+def test_latency_endpoint_reports_percentiles_per_route(client):
+    """Test GET /debug/latency returns percentiles per method and route."""
+    for _ in range(5):
+        client.get("/health")
+    client.post("/todos", json={"title": "Test"})
+
+    response = client.get("/debug/latency")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["window_seconds"] > 0
+    routes = {(entry["method"], entry["route"]): entry for entry in data["routes"]}
+
+    health = routes[("GET", "/health")]
+    assert health["count"] == 5
+    assert 0 < health["p50"] <= health["p95"] <= health["p99"] <= health["p999"]
+    assert routes[("POST", "/todos")]["count"] == 1
+
+
+@pytest.mark.contract
+def test_latency_endpoint_labels_by_route_template(client):
+    """Test latencies are grouped by route template, not raw path."""
+    client.get("/todos/1")
+    client.get("/todos/2")
+
+    data = client.get("/debug/latency").json()
+    routes = {(entry["method"], entry["route"]) for entry in data["routes"]}
+
+    assert ("GET", "/todos/{todo_id}") in routes
+    assert ("GET", "/todos/1") not in routes
@@ -0,0 +1,34 @@
+"""Contract tests for the todo event stream endpoint."""
+
+import pytest
+
+
+@pytest.mark.contract
+def test_events_from_a_lost_sequence_return_gone(client):
+    """Test connecting with a sequence the server no longer covers returns 410."""
+    client.post("/todos", json={"title": "Todo"})
+
+    response = client.get("/todos/events", params={"since": 0})
+
+    assert response.status_code == 410
+    assert "resync" in response.json()["detail"]
+
+
+@pytest.mark.contract
+@pytest.mark.parametrize("last_event_id", ["abc", "²", "9" * 5000, str(2**63)])
+def test_events_reject_invalid_last_event_id(client, last_event_id):
+    """Test Last-Event-ID must be a 64-bit sequence number."""
+    headers = {"Last-Event-ID": last_event_id.encode("latin-1")}
+
+    response = client.get("/todos/events", headers=headers)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.contract
+def test_events_are_documented_as_event_stream(client):
+    """Test the OpenAPI schema declares the text/event-stream response."""
+    operation = client.get("/openapi.json").json()["paths"]["/todos/events"]["get"]
+
+    assert "text/event-stream" in operation["responses"]["200"]["content"]
+    assert "410" in operation["responses"]
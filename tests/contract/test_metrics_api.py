@@ -68,3 +68,25 @@ def test_metrics_include_latency_histogram(client):
     assert "_bucket{" in content
     assert "_sum{" in content or "_sum " in content
     assert "_count{" in content or "_count " in content
+
+
+@pytest.mark.contract
+def test_metrics_endpoint_negotiates_openmetrics(client):
+    """Test GET /metrics returns OpenMetrics when the scraper asks for it."""
+    response = client.get(
+        "/metrics", headers={"Accept": "application/openmetrics-text; version=1.0.0"}
+    )
+
+    assert response.headers["content-type"].startswith("application/openmetrics-text")
+    assert response.text.rstrip().endswith("# EOF")
+
+
+@pytest.mark.contract
+def test_metrics_endpoint_gzips_when_accepted(client):
+    """Test GET /metrics compresses the body for scrapers that accept gzip."""
+    compressed = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/metrics", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "http_requests_total" in compressed.text
+    assert "content-encoding" not in plain.headers
@@ -0,0 +1,65 @@
+"""Contract tests for the profiler endpoint."""
+
+import pytest
+from src.config import Settings, get_settings
+from src.main import app
+
+
+@pytest.fixture
+def profiler_enabled():
+    """Enable the profiler with a known admin token."""
+    app.dependency_overrides[get_settings] = lambda: Settings(
+        profiler_token="secret", profiler_max_seconds=1
+    )
+    yield "secret"
+    app.dependency_overrides.pop(get_settings, None)
+
+
+@pytest.mark.contract
+def test_profile_endpoint_is_disabled_by_default(client):
+    """Test POST /debug/profile returns 404 when no admin token is configured."""
+    app.dependency_overrides[get_settings] = lambda: Settings()
+    try:
+        response = client.post("/debug/profile", headers={"X-Admin-Token": ""})
+    finally:
+        app.dependency_overrides.pop(get_settings, None)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.contract
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+def test_profile_endpoint_requires_admin_token(client, profiler_enabled, headers):
+    """Test POST /debug/profile returns 403 without the right token."""
+    response = client.post("/debug/profile?seconds=0.1", headers=headers)
+
+    assert response.status_code == 403
+
+
+@pytest.mark.contract
+def test_profile_endpoint_limits_duration(client, profiler_enabled):
+    """Test POST /debug/profile rejects durations above the configured limit."""
+    response = client.post(
+        "/debug/profile?seconds=5", headers={"X-Admin-Token": profiler_enabled}
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.contract
+def test_profile_endpoint_returns_collapsed_stacks(client, profiler_enabled):
+    """Test POST /debug/profile returns 'stack count' lines."""
+    response = client.post(
+        "/debug/profile?seconds=0.2&interval_ms=2",
+        headers={"X-Admin-Token": profiler_enabled},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert int(response.headers["x-profile-samples"]) > 0
+    lines = response.text.splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert ";" in stack
+        assert int(count) > 0
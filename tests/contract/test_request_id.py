@@ -64,3 +64,15 @@ def test_request_id_present_in_all_endpoints(client):
 
     response = client.post("/todos", json={"title": "Test"})
     assert "X-Request-ID" in response.headers
+
+
+@pytest.mark.contract
+def test_streaming_response_includes_request_id_header(client):
+    """Test that streamed responses carry the X-Request-ID header too."""
+    response = client.get(
+        "/todos",
+        headers={"Accept": "application/x-ndjson", "X-Request-ID": "stream-id"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["X-Request-ID"] == "stream-id"
@@ -0,0 +1,56 @@
+"""Contract tests for the todo search endpoint."""
+
+import pytest
+
+
+@pytest.mark.contract
+def test_search_returns_matching_todos(client):
+    """Test GET /todos/search returns todos whose titles match."""
+    client.post("/todos", json={"title": "購買牛奶"})
+    client.post("/todos", json={"title": "繳交報告"})
+
+    response = client.get("/todos/search", params={"q": "牛奶"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [todo["title"] for todo in data] == ["購買牛奶"]
+    assert set(data[0]) == {"id", "title", "completed"}
+
+
+@pytest.mark.contract
+def test_search_matches_prefixes(client):
+    """Test GET /todos/search matches word prefixes."""
+    client.post("/todos", json={"title": "Buy milk"})
+
+    response = client.get("/todos/search", params={"q": "MIL"})
+
+    assert [todo["title"] for todo in response.json()] == ["Buy milk"]
+
+
+@pytest.mark.contract
+def test_search_respects_limit(client):
+    """Test GET /todos/search returns at most limit results."""
+    for i in range(3):
+        client.post("/todos", json={"title": f"Task {i}"})
+
+    response = client.get("/todos/search", params={"q": "task", "limit": 2})
+
+    assert len(response.json()) == 2
+
+
+@pytest.mark.contract
+def test_search_returns_empty_array_when_nothing_matches(client):
+    """Test GET /todos/search returns [] when no title matches."""
+    client.post("/todos", json={"title": "Buy milk"})
+
+    response = client.get("/todos/search", params={"q": "報告"})
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.contract
+def test_search_without_query_returns_422(client):
+    """Test GET /todos/search requires a non-empty q."""
+    assert client.get("/todos/search").status_code == 422
+    assert client.get("/todos/search", params={"q": ""}).status_code == 422
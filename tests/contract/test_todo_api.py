@@ -1,6 +1,12 @@
 """Contract tests for Todo API endpoints."""
 
+import json
 import pytest
+from src.api import todos
+from src.config import Settings, get_settings
+from src.main import app
+from src.models.todo import TodoBulkResponse, TodoResponse
+from src.storage.memory import get_todo_store
 
 
 @pytest.mark.contract
@@ -179,3 +185,321 @@ def test_delete_todo_returns_404_when_not_found(client):
     response = client.delete("/todos/999")
 
     assert response.status_code == 404
+
+
+@pytest.mark.contract
+def test_get_todos_with_limit_returns_page_and_next_link(client):
+    """Test GET /todos?limit=N returns N todos and a rel=next Link header."""
+    for i in range(3):
+        client.post("/todos", json={"title": f"Task {i}"})
+
+    response = client.get("/todos", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert [todo["title"] for todo in response.json()] == ["Task 0", "Task 1"]
+    assert 'rel="next"' in response.headers["Link"]
+    assert "X-Next-Cursor" in response.headers
+
+
+@pytest.mark.contract
+def test_get_todos_next_cursor_returns_following_page(client):
+    """Test following the cursor returns the rest without a Link header."""
+    for i in range(3):
+        client.post("/todos", json={"title": f"Task {i}"})
+    cursor = client.get("/todos", params={"limit": 2}).headers["X-Next-Cursor"]
+
+    response = client.get("/todos", params={"limit": 2, "cursor": cursor})
+
+    assert response.status_code == 200
+    assert [todo["title"] for todo in response.json()] == ["Task 2"]
+    assert "Link" not in response.headers
+
+
+@pytest.mark.contract
+def test_get_todos_with_invalid_cursor_returns_400(client):
+    """Test GET /todos with a malformed cursor returns 400."""
+    response = client.get("/todos", params={"cursor": "not-a-cursor!"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.contract
+@pytest.mark.parametrize("after_id", ["²", "１", "9" * 5000, str(2**63), "-1"])
+def test_get_todos_with_unparsable_cursor_id_returns_400(client, after_id):
+    """Test cursors decoding to non-ASCII digits or huge numbers return 400."""
+    cursor = todos.encode_cursor(after_id)
+
+    response = client.get("/todos", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.contract
+def test_get_todos_with_out_of_range_limit_returns_422(client):
+    """Test GET /todos rejects limits outside 1-1000."""
+    assert client.get("/todos", params={"limit": 0}).status_code == 422
+    assert client.get("/todos", params={"limit": 1001}).status_code == 422
+
+
+@pytest.mark.contract
+def test_get_todos_filters_by_completed(client):
+    """Test GET /todos?completed=false returns only open todos."""
+    client.post("/todos", json={"title": "Open"})
+    client.post("/todos", json={"title": "Done", "completed": True})
+
+    open_todos = client.get("/todos", params={"completed": "false"}).json()
+    done_todos = client.get("/todos", params={"completed": "true"}).json()
+
+    assert [todo["title"] for todo in open_todos] == ["Open"]
+    assert [todo["title"] for todo in done_todos] == ["Done"]
+
+
+@pytest.mark.contract
+def test_get_todos_next_link_keeps_completed_filter(client):
+    """Test the next-page link preserves the completed filter."""
+    for i in range(4):
+        client.post("/todos", json={"title": f"Task {i}", "completed": True})
+
+    response = client.get("/todos", params={"limit": 2, "completed": "true"})
+
+    assert "completed=true" in response.headers["Link"]
+
+
+@pytest.mark.contract
+def test_get_todos_streams_ndjson_when_requested(client, monkeypatch):
+    """Test GET /todos with Accept: application/x-ndjson streams one todo per line."""
+    monkeypatch.setattr(todos, "STREAM_BATCH_SIZE", 2)
+    for i in range(5):
+        client.post("/todos", json={"title": f"Task {i}", "completed": i % 2 == 0})
+
+    response = client.get("/todos", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == client.get("/todos").json()
+    assert [todo["title"] for todo in lines] == [f"Task {i}" for i in range(5)]
+
+
+@pytest.mark.contract
+def test_get_todos_ndjson_keeps_completed_filter(client):
+    """Test the NDJSON stream honours the completed filter."""
+    client.post("/todos", json={"title": "Open"})
+    client.post("/todos", json={"title": "Done", "completed": True})
+
+    response = client.get(
+        "/todos",
+        params={"completed": "true"},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert [json.loads(line)["title"] for line in response.text.splitlines()] == [
+        "Done"
+    ]
+
+
+@pytest.mark.contract
+@pytest.mark.parametrize(
+    "accept",
+    [
+        "application/x-ndjson-foo",
+        "application/x-ndjson;q=0",
+        "application/*",
+        "*/*",
+        "application/json, text/x-ndjson",
+    ],
+)
+def test_get_todos_returns_json_unless_ndjson_is_accepted(client, accept):
+    """Test only an exact, acceptable NDJSON media range selects streaming."""
+    client.post("/todos", json={"title": "One"})
+
+    response = client.get("/todos", headers={"Accept": accept})
+
+    assert response.headers["content-type"] == "application/json"
+    assert [todo["title"] for todo in response.json()] == ["One"]
+
+
+@pytest.mark.contract
+@pytest.mark.parametrize(
+    "accept",
+    [
+        "Application/X-NDJSON",
+        "application/x-ndjson; charset=utf-8; q=0.5",
+        "application/json;q=0.1, application/x-ndjson",
+    ],
+)
+def test_get_todos_streams_ndjson_for_any_accepting_header(client, accept):
+    """Test NDJSON is streamed whenever the header lists it with q > 0."""
+    client.post("/todos", json={"title": "One"})
+
+    response = client.get("/todos", headers={"Accept": accept})
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["title"] for line in response.text.splitlines()] == ["One"]
+
+
+@pytest.mark.contract
+def test_full_listing_varies_on_accept(client):
+    """Test every representation of the full listing carries Vary: Accept."""
+    client.post("/todos", json={"title": "One"})
+
+    array = client.get("/todos")
+    cached = client.get("/todos", headers={"If-None-Match": array.headers["ETag"]})
+    stream = client.get("/todos", headers={"Accept": "application/x-ndjson"})
+    page = client.get("/todos", params={"limit": 1})
+
+    assert array.headers["Vary"] == "Accept"
+    assert cached.status_code == 304
+    assert cached.headers["Vary"] == "Accept"
+    assert stream.headers["Vary"] == "Accept"
+    assert "Vary" not in page.headers
+
+
+@pytest.mark.contract
+def test_get_todos_ndjson_empty_collection(client):
+    """Test the NDJSON stream of an empty collection has no body."""
+    response = client.get("/todos", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+@pytest.mark.contract
+def test_get_todo_returns_etag_and_304_when_unchanged(client):
+    """Test GET /todos/{id} answers a matching If-None-Match with 304."""
+    todo = client.post("/todos", json={"title": "Poll me"}).json()
+
+    first = client.get(f"/todos/{todo['id']}")
+    etag = first.headers["ETag"]
+    cached = client.get(f"/todos/{todo['id']}", headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+
+@pytest.mark.contract
+def test_get_todo_etag_changes_after_update(client):
+    """Test updating a todo invalidates its ETag."""
+    todo = client.post("/todos", json={"title": "Poll me"}).json()
+    etag = client.get(f"/todos/{todo['id']}").headers["ETag"]
+
+    client.put(f"/todos/{todo['id']}", json={"completed": True})
+    response = client.get(f"/todos/{todo['id']}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["completed"] is True
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.contract
+def test_get_todos_returns_etag_and_304_until_collection_changes(client):
+    """Test GET /todos supports conditional requests on the whole collection."""
+    client.post("/todos", json={"title": "First"})
+    etag = client.get("/todos").headers["ETag"]
+
+    cached = client.get("/todos", headers={"If-None-Match": f'W/{etag}, "other"'})
+    assert cached.status_code == 304
+
+    client.post("/todos", json={"title": "Second"})
+    fresh = client.get("/todos", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert len(fresh.json()) == 2
+
+
+@pytest.mark.contract
+def test_get_todo_reads_version_and_body_in_one_store_call(client, monkeypatch):
+    """Test GET /todos/{id} takes its ETag and body from the same read."""
+    todo = client.post("/todos", json={"title": "Once"}).json()
+    store = get_todo_store()
+
+    def separate_read(todo_id):
+        raise AssertionError("read separately from the version")
+
+    monkeypatch.setattr(store, "todo_version", separate_read)
+    monkeypatch.setattr(store, "get_json", separate_read)
+    response = client.get(f"/todos/{todo['id']}")
+    cached = client.get(
+        f"/todos/{todo['id']}", headers={"If-None-Match": response.headers["ETag"]}
+    )
+
+    assert response.json() == todo
+    assert cached.status_code == 304
+
+
+@pytest.mark.contract
+def test_get_missing_todo_with_if_none_match_returns_404(client):
+    """Test conditional requests for missing todos still return 404."""
+    response = client.get("/todos/999", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.contract
+def test_openapi_schema_keeps_response_models(client):
+    """Test routes that return pre-encoded JSON still document their models."""
+    paths = client.get("/openapi.json").json()["paths"]
+
+    def schema(path, method, code):
+        content = paths[path][method]["responses"][code]["content"]
+        return content["application/json"]["schema"]
+
+    assert schema("/todos", "post", "201") == {
+        "$ref": "#/components/schemas/TodoResponse"
+    }
+    assert schema("/todos/{todo_id}", "put", "200") == {
+        "$ref": "#/components/schemas/TodoResponse"
+    }
+    assert schema("/todos/bulk", "post", "201") == {
+        "$ref": "#/components/schemas/TodoBulkResponse"
+    }
+    assert schema("/todos", "get", "200")["items"] == {
+        "$ref": "#/components/schemas/TodoResponse"
+    }
+
+
+def write_responses(client, response_encoding):
+    """Run every write route with one encoding; return what each sent."""
+    get_todo_store().clear()
+    app.dependency_overrides[get_settings] = lambda: Settings(
+        response_encoding=response_encoding
+    )
+    try:
+        responses = [
+            client.post("/todos", json={"title": 'Buy "milk" 🥛 \\ 牛奶'}),
+            client.put("/todos/1", json={"completed": True}),
+            client.post("/todos/bulk", json={"items": [{"title": "a\tb"}]}),
+            client.patch(
+                "/todos/bulk",
+                json={"items": [{"id": "2", "title": "</b>"}, {"id": "9"}]},
+            ),
+            client.request("DELETE", "/todos/bulk", json={"ids": ["2", "9"]}),
+        ]
+    finally:
+        app.dependency_overrides.pop(get_settings, None)
+    return [(r.status_code, r.headers["content-type"], r.content) for r in responses]
+
+
+@pytest.mark.contract
+def test_write_routes_use_response_model_by_default():
+    """Test direct encoding of write responses is opt-in."""
+    assert Settings().response_encoding == "model"
+
+
+@pytest.mark.contract
+def test_direct_write_responses_match_response_model(client):
+    """Test every write route sends the same bytes with either encoding."""
+    model = write_responses(client, "model")
+    direct = write_responses(client, "direct")
+
+    assert direct == model
+    [created, updated, bulk_created, bulk_updated, bulk_deleted] = model
+    assert [code for code, _, _ in model] == [201, 200, 201, 200, 200]
+    for _, _, body in (created, updated):
+        assert TodoResponse.model_validate_json(body).model_dump_json() == body.decode()
+    for _, _, body in (bulk_created, bulk_updated, bulk_deleted):
+        assert (
+            TodoBulkResponse.model_validate_json(body).model_dump_json()
+            == body.decode()
+        )
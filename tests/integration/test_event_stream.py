@@ -0,0 +1,118 @@
+"""Integration tests for the /todos/events Server-Sent Events stream."""
+
+import asyncio
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from src.main import app
+
+
+class EventStreamClient:
+    """Drives one GET /todos/events request through the ASGI app.
+
+    The test client buffers whole responses, which never happens for an
+    open stream, so this calls the app directly and hands back body chunks
+    as they are sent.
+    """
+
+    def __init__(self, headers=()):
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self._disconnected = asyncio.Event()
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/todos/events",
+            "raw_path": b"/todos/events",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"test"), *headers],
+            "client": ("test", 1),
+            "server": ("test", 80),
+        }
+        self._task = asyncio.create_task(app(scope, self._receive, self._send))
+
+    async def _receive(self):
+        await self._disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message):
+        await self.messages.put(message)
+
+    async def start(self) -> dict:
+        """Wait for the response start message."""
+        return await asyncio.wait_for(self.messages.get(), 2)
+
+    async def chunk(self) -> bytes:
+        """Wait for the next body chunk."""
+        message = await asyncio.wait_for(self.messages.get(), 2)
+        return message.get("body", b"")
+
+    async def close(self):
+        """Disconnect and wait for the app to finish the request."""
+        self._disconnected.set()
+        await asyncio.wait_for(self._task, 2)
+
+
+def subscribers() -> float:
+    return REGISTRY.get_sample_value("todo_event_subscribers")
+
+
+@pytest.mark.integration
+def test_writes_are_pushed_as_events():
+    """Test create, update and delete each reach a connected client."""
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as http:
+            stream = EventStreamClient()
+            start = await stream.start()
+            assert start["status"] == 200
+            assert (b"content-type", b"text/event-stream; charset=utf-8") in start[
+                "headers"
+            ]
+            assert subscribers() == 1
+
+            todo = (await http.post("/todos", json={"title": "Pushed"})).json()
+            created = await stream.chunk()
+            await http.put(f"/todos/{todo['id']}", json={"completed": True})
+            updated = await stream.chunk()
+            await http.delete(f"/todos/{todo['id']}")
+            deleted = await stream.chunk()
+
+            await stream.close()
+            return created, updated, deleted
+
+    created, updated, deleted = asyncio.run(scenario())
+
+    assert created.startswith(b"id: ")
+    assert b"\nevent: create\n" in created
+    assert b'"title":"Pushed"' in created
+    assert b"\nevent: update\n" in updated
+    assert b'"completed":true' in updated
+    assert b"\nevent: delete\n" in deleted
+    assert b'"deleted":true' in deleted
+    assert subscribers() == 0
+
+
+@pytest.mark.integration
+def test_stream_resumes_after_last_event_id(client):
+    """Test a client reconnecting with Last-Event-ID gets what it missed."""
+    since = int(client.get("/todos").headers["ETag"].strip('"'))
+    client.post("/todos", json={"title": "Missed"})
+
+    async def scenario():
+        stream = EventStreamClient(headers=[(b"last-event-id", b"%d" % since)])
+        await stream.start()
+        chunk = await stream.chunk()
+        await stream.close()
+        return chunk
+
+    chunk = asyncio.run(scenario())
+
+    assert b"\nevent: create\n" in chunk
+    assert b'"title":"Missed"' in chunk
@@ -72,8 +72,8 @@ def test_metrics_use_low_cardinality_labels(client):
 
 
 @pytest.mark.integration
-def test_metrics_normalize_path_with_ids(client):
-    """Test that path normalization replaces IDs with placeholders."""
+def test_metrics_label_paths_with_route_templates(client):
+    """Test that metrics are labelled with the matched route template, not the ID."""
     # Create a todo to get an ID
     create_response = client.post("/todos", json={"title": "Test"})
     todo_id = create_response.json()["id"]
@@ -84,10 +84,23 @@ def test_metrics_normalize_path_with_ids(client):
     # Get metrics
     metrics = client.get("/metrics").text
 
-    # Verify path is normalized to /todos/{id}, not the actual ID
-    assert "/todos/{id}" in metrics or 'path="/todos/{id}"' in metrics
+    # Verify path is the route template, not the actual ID
+    assert 'method="GET",path="/todos/{todo_id}"' in metrics
     # Verify actual ID is NOT in metrics (would cause high cardinality)
-    assert f"/todos/{todo_id}" not in metrics or 'path="/todos/{id}"' in metrics
+    assert f'path="/todos/{todo_id}"' not in metrics
+
+
+@pytest.mark.integration
+def test_metrics_do_not_rewrite_plain_path_segments(client):
+    """Test that hex-looking segments of unknown paths are not treated as IDs."""
+    client.get("/face")
+    client.get("/todos/123/add")
+
+    metrics = client.get("/metrics").text
+
+    assert 'path="/face"' not in metrics
+    assert 'path="/{id}"' not in metrics
+    assert 'path="unmatched",status="404"' in metrics
 
 
 @pytest.mark.integration
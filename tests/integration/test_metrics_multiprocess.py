@@ -0,0 +1,49 @@
+"""Integration tests for multi-process metrics collection."""
+
+import os
+import subprocess
+import sys
+import textwrap
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WORKER = textwrap.dedent("""
+    import sys
+    from fastapi.testclient import TestClient
+    from src.main import app
+
+    client = TestClient(app)
+    for _ in range(int(sys.argv[1])):
+        client.get("/health")
+    if len(sys.argv) > 2:
+        print(client.get("/metrics").text)
+    """)
+
+
+def run_worker(metrics_dir: str, requests: int, scrape: bool = False) -> str:
+    """Run one app process sharing ``metrics_dir`` and return its stdout."""
+    env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=metrics_dir)
+    args = [sys.executable, "-c", WORKER, str(requests)] + (
+        ["scrape"] if scrape else []
+    )
+    result = subprocess.run(
+        args, cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+@pytest.mark.integration
+def test_metrics_are_aggregated_across_processes(tmp_path):
+    """Test /metrics in one worker reports requests served by every worker."""
+    metrics_dir = str(tmp_path)
+
+    run_worker(metrics_dir, 3)
+    run_worker(metrics_dir, 4)
+    output = run_worker(metrics_dir, 5, scrape=True)
+
+    counter = 'http_requests_total{method="GET",path="/health",status="200"}'
+    [line] = [line for line in output.splitlines() if line.startswith(counter)]
+    assert float(line.split()[-1]) == 12.0
+    histogram = 'http_request_duration_seconds_count{method="GET",path="/health"}'
+    assert f"{histogram} 12.0" in output
@@ -0,0 +1,73 @@
+"""Integration tests for the Server-Timing stage breakdown."""
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from src.config import Settings
+from src.main import app
+from src.middleware.server_timing import ServerTimingMiddleware
+
+
+def timed_client(mode: str) -> TestClient:
+    """Client for the app wrapped in a Server-Timing middleware in ``mode``."""
+    return TestClient(
+        ServerTimingMiddleware(app, settings=Settings(server_timing=mode))
+    )
+
+
+def parse_server_timing(header: str) -> dict:
+    """Map each Server-Timing metric to its duration in milliseconds."""
+    metrics = {}
+    for entry in header.split(","):
+        name, _, duration = entry.strip().partition(";dur=")
+        metrics[name] = float(duration)
+    return metrics
+
+
+@pytest.mark.integration
+def test_server_timing_is_off_by_default(client):
+    """Test responses carry no Server-Timing header unless enabled."""
+    response = client.get("/todos", headers={"X-Server-Timing": "1"})
+
+    assert "server-timing" not in response.headers
+
+
+@pytest.mark.integration
+def test_request_mode_times_only_requests_that_ask():
+    """Test mode 'request' adds the header only to requests with X-Server-Timing."""
+    client = timed_client("request")
+
+    plain = client.post("/todos", json={"title": "Plain"})
+    timed = client.post(
+        "/todos", json={"title": "Timed"}, headers={"X-Server-Timing": "1"}
+    )
+
+    assert "server-timing" not in plain.headers
+    stages = parse_server_timing(timed.headers["server-timing"])
+    assert {"middleware", "parse", "lock", "store", "serialize", "total"} <= set(stages)
+    assert all(duration >= 0 for duration in stages.values())
+    assert sum(stages.values()) - stages["total"] == pytest.approx(
+        stages["total"], abs=0.01
+    )
+
+
+@pytest.mark.integration
+def test_always_mode_records_stage_histogram():
+    """Test timed requests are observed in http_request_stage_seconds."""
+    client = timed_client("always")
+    todo_id = client.post("/todos", json={"title": "Test"}).json()["id"]
+    labels = {"method": "GET", "path": "/todos/{todo_id}", "stage": "store"}
+    before = REGISTRY.get_sample_value("http_request_stage_seconds_count", labels)
+
+    response = client.get(f"/todos/{todo_id}")
+
+    assert "store;dur=" in response.headers["server-timing"]
+    after = REGISTRY.get_sample_value("http_request_stage_seconds_count", labels)
+    assert after == (before or 0) + 1
+
+
+@pytest.mark.integration
+def test_unknown_mode_is_rejected():
+    """Test an unknown TODO_SERVER_TIMING value fails fast."""
+    with pytest.raises(ValueError):
+        ServerTimingMiddleware(app, settings=Settings(server_timing="sometimes"))
@@ -1,6 +1,8 @@
 """Integration test for full todo lifecycle."""
 
 import pytest
+from src.storage import memory
+from src.storage.sqlite import SQLiteTodoStore
 
 
 @pytest.mark.integration
@@ -90,3 +92,49 @@ def test_multiple_todos_lifecycle(client):
     # Find the updated todo
     updated = [t for t in final_list if t["id"] == todos[1]["id"]][0]
     assert updated["completed"] is True
+
+
+@pytest.mark.integration
+def test_paginate_through_all_todos(client):
+    """Test following Link headers visits every todo exactly once."""
+    for i in range(7):
+        client.post("/todos", json={"title": f"Task {i+1}"})
+
+    seen = []
+    response = client.get("/todos", params={"limit": 3})
+    while True:
+        assert response.status_code == 200
+        seen.extend(todo["id"] for todo in response.json())
+        if "Link" not in response.headers:
+            break
+        next_url = response.headers["Link"].split(">")[0].lstrip("<")
+        response = client.get(next_url)
+
+    assert seen == [str(i) for i in range(1, 8)]
+
+
+@pytest.mark.integration
+def test_lifecycle_on_a_blocking_backend(client, tmp_path, monkeypatch):
+    """
+    Test the routes work the same when the store runs on the executor.
+    SQLite is a blocking backend, so every call is made from a worker thread.
+    """
+    store = SQLiteTodoStore(str(tmp_path / "todos.db"))
+    monkeypatch.setattr(memory, "_store", store)
+    try:
+        todo_id = client.post("/todos", json={"title": "寫入 SQLite"}).json()["id"]
+        etag = client.get("/todos").headers["ETag"]
+
+        assert client.put(f"/todos/{todo_id}", json={"completed": True}).json()[
+            "completed"
+        ]
+        assert client.get("/todos", headers={"If-None-Match": etag}).status_code == 200
+        assert client.get(f"/todos/{todo_id}").json()["completed"] is True
+
+        changes = client.get("/todos/changes", params={"since": etag.strip('"')})
+        assert [c["op"] for c in changes.json()["changes"]] == ["update"]
+
+        assert client.delete(f"/todos/{todo_id}").status_code == 204
+        assert client.get(f"/todos/{todo_id}").status_code == 404
+    finally:
+        store.close()
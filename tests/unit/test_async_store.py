@@ -0,0 +1,228 @@
+"""Unit tests for awaiting todo stores from the event loop."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.models.todo import TodoCreate, TodoUpdate
+from src.observability.timing import QUEUE, STORE, start_timer, timed_store
+from src.storage.aio import (
+    AsyncTodoStore,
+    get_store_executor,
+    shutdown_store_executor,
+)
+from src.storage.memory import TodoStore
+from src.storage.sqlite import SQLiteTodoStore
+from src.storage.striped import StripedTodoStore
+from src.storage.wal import WALTodoStore
+
+
+class SlowStore(TodoStore):
+    """In-memory store whose reads wait like a blocking backend would."""
+
+    blocking = True
+
+    def get_json(self, todo_id):
+        time.sleep(0.05)
+        return super().get_json(todo_id)
+
+
+def calling_thread(store: TodoStore):
+    """Make ``store.collection_version`` report the thread it runs on."""
+    store.collection_version = lambda: threading.current_thread().name
+
+
+@pytest.mark.unit
+def test_backends_declare_whether_they_block(tmp_path):
+    """Test only the in-memory stores are called inline."""
+    wal = WALTodoStore(str(tmp_path / "wal"))
+    sqlite = SQLiteTodoStore(str(tmp_path / "todos.db"))
+    try:
+        assert AsyncTodoStore(TodoStore()).inline
+        assert AsyncTodoStore(StripedTodoStore()).inline
+        assert not AsyncTodoStore(wal).inline
+        assert not AsyncTodoStore(sqlite).inline
+    finally:
+        wal.close()
+        sqlite.close()
+
+
+@pytest.mark.unit
+def test_in_memory_stores_run_on_the_event_loop():
+    """Test in-memory calls run inline, without a thread hand-off."""
+    store = TodoStore()
+    calling_thread(store)
+
+    async def scenario():
+        return await AsyncTodoStore(store).collection_version()
+
+    assert asyncio.run(scenario()) == threading.current_thread().name
+
+
+@pytest.mark.unit
+def test_blocking_stores_run_on_the_executor():
+    """Test blocking calls run on the given executor."""
+    store = SlowStore()
+    calling_thread(store)
+
+    async def scenario():
+        with ThreadPoolExecutor(1, thread_name_prefix="store-test") as executor:
+            return await AsyncTodoStore(store, executor).collection_version()
+
+    assert asyncio.run(scenario()).startswith("store-test")
+
+
+@pytest.mark.unit
+def test_blocking_calls_leave_the_event_loop_free():
+    """Test other tasks keep running while a blocking call waits."""
+    store = AsyncTodoStore(SlowStore())
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.001)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await asyncio.gather(store.get_json("1"), store.get_json("2"))
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(scenario()) > 10
+
+
+@pytest.mark.unit
+def test_methods_match_the_store(tmp_path):
+    """Test each coroutine returns what the store method returns."""
+    store = AsyncTodoStore(SQLiteTodoStore(str(tmp_path / "todos.db")))
+
+    async def scenario():
+        since = await store.collection_version()
+        created = await store.create(TodoCreate(title="Buy milk"))
+        [second] = await store.create_many([TodoCreate(title="Walk dog")])
+        await store.update(created.id, TodoUpdate(completed=True))
+        await store.update_many([(second.id, TodoUpdate(title="Walk cat"))])
+        page, after = await store.list_page_json(1)
+        version, body = await store.get_versioned_json(created.id)
+        assert version == await store.todo_version(created.id)
+        return (
+            body,
+            await store.list_all_json(completed=True),
+            page,
+            after,
+            await store.search_json("cat", 10),
+            await store.todo_version(created.id) > since,
+            await store.delete(created.id),
+            await store.delete_many([second.id, "404"]),
+            [c.op for c in (await store.changes_json(since, 10)).changes],
+        )
+
+    try:
+        todo, completed, page, after, found, newer, deleted, bulk, ops = asyncio.run(
+            scenario()
+        )
+    finally:
+        store.store.close()
+
+    assert todo == completed[0] == page[0]
+    assert b'"completed":true' in todo
+    assert after == "1"
+    assert found == [b'{"id":"2","title":"Walk cat","completed":false}']
+    assert newer and deleted
+    assert bulk == [True, False]
+    assert ops == ["delete", "delete"]
+
+
+class ScanRecorder(TodoStore):
+    """Blocking store recording which thread produced each scan batch."""
+
+    blocking = True
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+        self.closed = False
+
+    def scan_json(self, completed=None, batch_size=1000):
+        try:
+            for batch in super().scan_json(completed, batch_size):
+                self.threads.append(threading.current_thread().name)
+                yield batch
+        finally:
+            self.closed = True
+
+
+@pytest.mark.unit
+def test_scan_runs_on_the_executor_and_closes_early():
+    """Test scan batches are fetched on the executor and the scan is closed."""
+    store = ScanRecorder()
+    store.create_many([TodoCreate(title=f"Todo {i}") for i in range(5)])
+
+    async def scenario():
+        with ThreadPoolExecutor(1, thread_name_prefix="store-test") as executor:
+            scan = AsyncTodoStore(store, executor).scan_json(batch_size=2)
+            everything = [batch async for batch in scan]
+            scan = AsyncTodoStore(store, executor).scan_json(batch_size=2)
+            first = await anext(scan)
+            await scan.aclose()
+            return everything, first
+
+    everything, first = asyncio.run(scenario())
+
+    assert [len(batch) for batch in everything] == [2, 2, 1]
+    assert first == everything[0]
+    assert store.closed
+    assert all(name.startswith("store-test") for name in store.threads)
+
+
+@pytest.mark.unit
+def test_stage_timer_follows_calls_into_the_executor():
+    """Test time spent in an offloaded call is reported to the request."""
+    store = SlowStore()
+    store.create(TodoCreate(title="Slow"))
+
+    async def scenario():
+        timer = start_timer()
+        await AsyncTodoStore(timed_store(store)).get_json("1")
+        return timer
+
+    assert asyncio.run(scenario()).stages[STORE] >= 0.04
+
+
+@pytest.mark.unit
+def test_wait_for_an_executor_worker_is_reported_as_queue_stage():
+    """Test a call queued behind a busy worker reports the wait as queue time."""
+    store = SlowStore()
+    store.create(TodoCreate(title="Slow"))
+
+    async def timed_get(executor):
+        timer = start_timer()
+        await AsyncTodoStore(timed_store(store), executor).get_json("1")
+        return timer
+
+    async def scenario():
+        with ThreadPoolExecutor(1) as executor:
+            busy = asyncio.create_task(AsyncTodoStore(store, executor).get_json("1"))
+            await asyncio.sleep(0.01)
+            timer = await asyncio.create_task(timed_get(executor))
+            await busy
+            return timer
+
+    assert asyncio.run(scenario()).stages[QUEUE] >= 0.02
+
+
+@pytest.mark.unit
+def test_store_executor_is_recreated_after_shutdown():
+    """Test the shared executor can be used again after app shutdown."""
+    executor = get_store_executor()
+    assert get_store_executor() is executor
+
+    shutdown_store_executor()
+    replacement = get_store_executor()
+
+    assert replacement is not executor
+    assert replacement.submit(lambda: 42).result() == 42
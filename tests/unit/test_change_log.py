@@ -0,0 +1,88 @@
+"""Unit tests for the delta sync change log."""
+
+import json
+import pytest
+from src.storage.changes import ChangeLog, build_batch
+from src.storage.records import TodoRecord
+
+
+@pytest.mark.unit
+def test_read_returns_changes_after_since():
+    """Test read bisects to the changes after the given sequence number."""
+    log = ChangeLog(floor=100)
+    for seq in range(101, 106):
+        log.append(seq, "create", str(seq), TodoRecord(str(seq), "Todo", False, seq))
+
+    assert [seq for seq, *_ in log.read(102, 10, version=105)] == [103, 104, 105]
+    assert [seq for seq, *_ in log.read(100, 2, version=105)] == [101, 102]
+    assert log.read(105, 10, version=105) == []
+
+
+@pytest.mark.unit
+def test_trimming_keeps_retention_and_raises_floor():
+    """Test old changes are dropped in chunks and ``since`` before them fails."""
+    log = ChangeLog(floor=0, retention=8)
+    for seq in range(1, 101):
+        log.append(seq, "delete", "1", None)
+
+    assert 8 <= len(log) <= 9
+    assert log.floor == 100 - len(log)
+    assert log.read(log.floor - 1, 10, version=100) is None
+    assert len(log.read(log.floor, 10, version=100)) == len(log)
+
+
+@pytest.mark.unit
+def test_reset_and_future_versions_require_resync():
+    """Test reset forgets every change and unknown versions return None."""
+    log = ChangeLog(floor=10)
+    log.append(11, "delete", "1", None)
+    log.reset(12)
+
+    assert log.read(11, 10, version=12) is None
+    assert log.read(12, 10, version=12) == []
+    assert log.read(13, 10, version=12) is None
+
+
+@pytest.mark.unit
+def test_invalid_retention_is_rejected():
+    """Test the log must keep at least one change."""
+    with pytest.raises(ValueError):
+        ChangeLog(floor=0, retention=0)
+
+
+@pytest.mark.unit
+def test_build_batch_reports_each_todo_once():
+    """Test a todo changed twice in a batch appears at its last change."""
+    todo = b'{"id":"1","title":"New","completed":false}'
+    entries = [
+        (1, "update", "1", b"old"),
+        (2, "delete", "2", None),
+        (3, "update", "1", todo),
+        (4, "delete", "3", None),
+    ]
+
+    batch = build_batch(entries, since=0, limit=3)
+
+    assert [json.loads(change.data) for change in batch.changes] == [
+        {"seq": 2, "op": "delete", "id": "2", "deleted": True, "todo": None},
+        {
+            "seq": 3,
+            "op": "update",
+            "id": "1",
+            "deleted": False,
+            "todo": {"id": "1", "title": "New", "completed": False},
+        },
+    ]
+    assert batch.next_since == 3
+    assert batch.has_more is True
+    assert build_batch([], since=7, limit=3) == ([], 7, False)
+
+
+@pytest.mark.unit
+def test_build_batch_keeps_creations():
+    """Test a todo created and then updated within a batch is a creation."""
+    entries = [(1, "create", "1", b"{}"), (2, "update", "1", b"{}")]
+
+    [change] = build_batch(entries, since=0, limit=10).changes
+
+    assert (change.seq, change.op) == (2, "create")
@@ -0,0 +1,45 @@
+"""Unit tests for direct JSON encoding of todo responses."""
+
+import pytest
+from src.models.todo import TodoBulkResponse, TodoBulkResult, TodoResponse
+from src.storage.encoding import encode_array, encode_bulk_results, encode_todo
+
+TITLES = [
+    "Buy milk",
+    "購買牛奶",
+    'Quote " and \\ slash',
+    "tab\tnewline\ncontrol\x00\x1f\x7f",
+    "emoji 😀 </script>   ",
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("title", TITLES)
+@pytest.mark.parametrize("completed", [False, True])
+def test_encode_todo_matches_pydantic(title, completed):
+    """Test encoded todos are byte-identical to the response model's JSON."""
+    model = TodoResponse(id="42", title=title, completed=completed)
+
+    assert encode_todo("42", title, completed) == model.model_dump_json().encode()
+
+
+@pytest.mark.unit
+def test_encode_bulk_results_matches_pydantic():
+    """Test bulk results are byte-identical to the bulk response model's JSON."""
+    todo = TodoResponse(id="1", title='購買 "牛奶"', completed=False)
+    results = [("1", 200, todo), ('missing "id"', 404, None)]
+    model = TodoBulkResponse(
+        results=[
+            TodoBulkResult(id=todo_id, status=status, todo=item)
+            for todo_id, status, item in results
+        ]
+    )
+
+    assert encode_bulk_results(results) == model.model_dump_json().encode()
+
+
+@pytest.mark.unit
+def test_encode_array_joins_encoded_values():
+    """Test pre-encoded values are joined into a JSON array."""
+    assert encode_array([]) == b"[]"
+    assert encode_array([b"1", b'{"a":2}']) == b'[1,{"a":2}]'
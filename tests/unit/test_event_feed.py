@@ -0,0 +1,140 @@
+"""Unit tests for the change feed behind /todos/events."""
+
+import asyncio
+import threading
+import pytest
+from prometheus_client import REGISTRY
+from src.api.events import (
+    KEEPALIVE,
+    RESYNC_EVENT,
+    ChangeFeed,
+    event_stream,
+    format_event,
+)
+from src.models.todo import TodoCreate
+from src.storage.aio import AsyncTodoStore
+from src.storage.changes import ChangeEvent
+from src.storage.memory import TodoStore
+
+
+def disconnects(reason: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "todo_event_disconnects_total", {"reason": reason}
+    )
+    return value or 0.0
+
+
+@pytest.mark.unit
+def test_format_event_names_the_operation():
+    """Test events carry the sequence number as ID and the op as name."""
+    event = format_event(ChangeEvent(7, "delete", b'{"seq":7}'))
+
+    assert event == b'id: 7\nevent: delete\ndata: {"seq":7}\n\n'
+
+
+@pytest.mark.unit
+def test_notify_wakes_waiters_once_per_burst():
+    """Test a burst of notifications schedules a single wake-up."""
+    feed = ChangeFeed()
+    feed.notify()  # no subscriber yet: nothing to wake
+
+    async def scenario():
+        first = feed.waiter()
+        for _ in range(100):
+            feed.notify()
+        await asyncio.wait_for(first.wait(), 1)
+
+        second = feed.waiter()
+        await asyncio.sleep(0.01)
+        return first is not second and not second.is_set()
+
+    assert asyncio.run(scenario())
+
+
+@pytest.mark.unit
+def test_notify_from_another_thread():
+    """Test writers on worker threads wake subscribers on the event loop."""
+    feed = ChangeFeed()
+
+    async def scenario():
+        waiter = feed.waiter()
+        threading.Thread(target=feed.notify).start()
+        await asyncio.wait_for(waiter.wait(), 1)
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.unit
+def test_subscribers_in_step_share_one_read():
+    """Test subscribers at the same position read the store once per wake-up."""
+    store = TodoStore()
+    since = store.collection_version()
+    feed = ChangeFeed()
+    reads = []
+    changes_json = store.changes_json
+
+    def counted(*args):
+        reads.append(args)
+        return changes_json(*args)
+
+    store.changes_json = counted
+
+    async def scenario():
+        streams = [
+            event_stream(AsyncTodoStore(store), feed, since, 10) for _ in range(5)
+        ]
+        pending = [asyncio.ensure_future(stream.__anext__()) for stream in streams]
+        await asyncio.sleep(0.01)
+        store.create(TodoCreate(title="Shared"))
+        feed.notify()
+        chunks = await asyncio.wait_for(asyncio.gather(*pending), 1)
+        for stream in streams:
+            await stream.aclose()
+        return chunks
+
+    chunks = asyncio.run(scenario())
+
+    assert len(set(chunks)) == 1 and b"event: create" in chunks[0]
+    assert len(reads) == 2  # on connect, then after the write
+
+
+@pytest.mark.unit
+def test_stream_sends_changes_then_keepalives():
+    """Test the stream sends pending changes, then keepalives while idle."""
+    store = TodoStore()
+    since = store.collection_version()
+    store.create(TodoCreate(title="First"))
+
+    async def scenario():
+        stream = event_stream(
+            AsyncTodoStore(store), ChangeFeed(keepalive=0.01), since, 10
+        )
+        chunks = [await stream.__anext__(), await stream.__anext__()]
+        await stream.aclose()
+        return chunks
+
+    changes, keepalive = asyncio.run(scenario())
+
+    assert b"event: create" in changes
+    assert keepalive == KEEPALIVE
+
+
+@pytest.mark.unit
+def test_clients_further_behind_than_the_buffer_are_disconnected():
+    """Test a client more than ``buffer`` changes behind is told to resync."""
+    store = TodoStore()
+    since = store.collection_version()
+    for i in range(3):
+        store.create(TodoCreate(title=f"Todo {i}"))
+    before = disconnects("slow")
+
+    async def scenario():
+        return [
+            chunk
+            async for chunk in event_stream(
+                AsyncTodoStore(store), ChangeFeed(), since, 2
+            )
+        ]
+
+    assert asyncio.run(scenario()) == [RESYNC_EVENT]
+    assert disconnects("slow") == before + 1
@@ -0,0 +1,72 @@
+"""Unit tests for the storage index structures."""
+
+import pytest
+from src.storage.indexes import (
+    MAX_PREFIX_LENGTH,
+    OrderedIdIndex,
+    TitleIndex,
+    index_terms,
+    query_terms,
+    title_matches,
+    tokenize,
+)
+
+
+@pytest.mark.unit
+def test_ordered_index_add_discard_and_scan():
+    """Test the ordered index stays sorted under out-of-order inserts."""
+    index = OrderedIdIndex([5, 1])
+    index.add(3)
+    index.add(9)
+    index.add(3)
+    index.discard(5)
+    index.discard(42)
+
+    assert list(index) == [1, 3, 9]
+    assert index.after(1, 10) == [3, 9]
+    assert index.after(0, 2) == [1, 3]
+    assert 9 in index and 5 not in index
+
+
+@pytest.mark.unit
+def test_tokenize_normalises_and_splits_scripts():
+    """Test tokens are NFKC-normalised, case-folded and split by script."""
+    assert tokenize("Buy ＭＩＬＫ-2x 購買牛奶!") == ["buy", "milk", "2x", "購買牛奶"]
+
+
+@pytest.mark.unit
+def test_index_terms_for_words_and_cjk():
+    """Test words are indexed by prefix and CJK runs by unigrams and bigrams."""
+    assert index_terms("Milk") == {"m", "mi", "mil", "milk"}
+    assert index_terms("牛奶茶") == {"牛", "奶", "茶", "牛奶", "奶茶"}
+
+
+@pytest.mark.unit
+def test_query_terms_flags_lookups_needing_verification():
+    """Test long CJK runs and over-long words require verification."""
+    assert query_terms("牛奶") == (["牛奶"], ["牛奶"], False)
+    assert query_terms("買牛奶")[2] is True
+    long_word = "a" * (MAX_PREFIX_LENGTH + 1)
+    assert query_terms(long_word) == ([long_word], [long_word[:-1]], True)
+
+
+@pytest.mark.unit
+def test_title_matches():
+    """Test candidate verification against the real title."""
+    assert title_matches("購買牛奶 today", ["買牛奶", "tod"])
+    assert not title_matches("買牛肉和牛奶", ["買牛奶"])
+
+
+@pytest.mark.unit
+def test_title_index_intersects_and_replaces():
+    """Test every term must match and re-adding an ID replaces its title."""
+    index = TitleIndex()
+    index.add(1, "buy milk")
+    index.add(2, "buy bread")
+    index.add(1, "sell milk")
+    index.discard(2)
+
+    assert index.search(["buy"]) == []
+    assert index.search(["sel", "mil"]) == [1]
+    assert index.search([]) == []
+    assert len(index) == 1
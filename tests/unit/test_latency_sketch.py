@@ -0,0 +1,96 @@
+"""Unit tests for latency sketches and the rolling window."""
+
+import random
+import pytest
+from src.observability.latency import LatencySketch, RollingLatency
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("q", [0.5, 0.95, 0.99, 0.999])
+def test_sketch_quantiles_within_relative_accuracy(q):
+    """Test estimated quantiles are within 1% of the exact ones."""
+    rng = random.Random(42)
+    values = [rng.lognormvariate(-7, 1.5) for _ in range(20_000)]
+    sketch = LatencySketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    exact = exact_quantile(values, q)
+    assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+
+
+@pytest.mark.unit
+def test_sketch_merge_matches_single_sketch():
+    """Test merging sketches gives the same result as recording into one."""
+    values = [i / 100_000 for i in range(1, 1001)]
+    whole, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+    for i, value in enumerate(values):
+        whole.add(value)
+        (left if i % 2 else right).add(value)
+
+    left.merge(right)
+
+    assert left.count == whole.count == 1000
+    for q in (0.5, 0.99):
+        assert left.quantile(q) == whole.quantile(q)
+
+
+@pytest.mark.unit
+def test_sketch_rejects_merging_different_accuracies():
+    """Test sketches with different bucket widths cannot be merged."""
+    with pytest.raises(ValueError):
+        LatencySketch(0.01).merge(LatencySketch(0.02))
+
+
+@pytest.mark.unit
+def test_empty_sketch_has_no_quantiles():
+    """Test an empty sketch reports None."""
+    assert LatencySketch().quantile(0.5) is None
+
+
+@pytest.mark.unit
+def test_rolling_window_drops_expired_slots():
+    """Test latencies older than the window stop counting."""
+    clock = FakeClock()
+    rolling = RollingLatency(window=60, slots=6, clock=clock)
+
+    rolling.record("GET /todos", 0.001)
+    clock.now = 30
+    rolling.record("GET /todos", 0.002)
+    assert rolling.snapshot()["GET /todos"].count == 2
+
+    clock.now = 65
+    assert rolling.snapshot()["GET /todos"].count == 1
+
+    clock.now = 95
+    assert rolling.snapshot() == {}
+
+
+@pytest.mark.unit
+def test_rolling_window_reuses_slots():
+    """Test a slot is cleared when time comes back round to it."""
+    clock = FakeClock()
+    rolling = RollingLatency(window=60, slots=6, clock=clock)
+
+    rolling.record("key", 0.5)
+    clock.now = 60
+    rolling.record("key", 0.001)
+
+    sketch = rolling.snapshot()["key"]
+    assert sketch.count == 1
+    assert sketch.quantile(0.5) == pytest.approx(0.001, rel=0.01)
@@ -0,0 +1,166 @@
+"""Unit tests for adaptive log sampling."""
+
+import json
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from src.config import Settings
+from src.middleware.logging import LoggingMiddleware
+from src.observability.sampling import AdaptiveSampler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def request_lines(output: str):
+    """Parse the request_completed lines from captured stdout."""
+    lines = [json.loads(line) for line in output.splitlines() if line.strip()]
+    return [line for line in lines if line["event"] == "request_completed"]
+
+
+@pytest.mark.unit
+def test_sampler_logs_everything_until_rate_is_known():
+    """Test the first window logs every request with weight 1."""
+    sampler = AdaptiveSampler(target_per_second=10, clock=FakeClock())
+
+    assert [sampler.sample("route") for _ in range(50)] == [1] * 50
+
+
+@pytest.mark.unit
+def test_sampler_adapts_to_request_rate():
+    """Test a busy route is sampled down to the target rate."""
+    clock = FakeClock()
+    sampler = AdaptiveSampler(target_per_second=10, clock=clock)
+    for _ in range(1000):
+        sampler.sample("route")
+
+    clock.now = 1.0
+    weights = [sampler.sample("route") for _ in range(1000)]
+
+    logged = [weight for weight in weights if weight]
+    assert len(logged) == 10
+    assert sum(logged) == 1000
+
+
+@pytest.mark.unit
+def test_sampler_tracks_routes_independently():
+    """Test a quiet route keeps logging every request next to a busy one."""
+    clock = FakeClock()
+    sampler = AdaptiveSampler(target_per_second=1, clock=clock)
+    for _ in range(100):
+        sampler.sample("busy")
+    sampler.sample("quiet")
+
+    clock.now = 1.0
+
+    assert sampler.sample("quiet") == 1
+    assert sum(1 for _ in range(100) if sampler.sample("busy")) == 1
+
+
+@pytest.mark.unit
+def test_sampler_weights_cover_skipped_requests_after_slowdown():
+    """Test weights stay exact when the rate drops between windows."""
+    clock = FakeClock()
+    sampler = AdaptiveSampler(target_per_second=1, clock=clock)
+    for _ in range(10):
+        sampler.sample("route")
+    clock.now = 1.0
+    weights = [sampler.sample("route") for _ in range(5)]
+    clock.now = 2.0
+
+    # The slow window resets the interval; the skipped requests are carried
+    assert sampler.sample("route") == 6
+    assert weights == [0] * 5
+
+
+@pytest.mark.unit
+def test_non_positive_target_raises():
+    """Test sampling needs a positive target rate."""
+    with pytest.raises(ValueError):
+        AdaptiveSampler(target_per_second=0)
+
+
+@pytest.mark.unit
+def test_middleware_samples_successes_but_keeps_errors(capsys):
+    """Test sampled lines carry weights and error responses are always logged."""
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {}
+
+    @app.get("/missing")
+    async def missing():
+        raise HTTPException(status_code=404)
+
+    clock = FakeClock()
+    middleware = LoggingMiddleware(
+        app, settings=Settings(log_sample_target=1, log_slow_ms=10_000)
+    )
+    middleware.sampler = AdaptiveSampler(target_per_second=1, clock=clock)
+    client = TestClient(middleware)
+
+    for _ in range(10):
+        client.get("/ok")
+    clock.now = 1.0
+    for _ in range(10):
+        client.get("/ok")
+    client.get("/missing")
+
+    lines = request_lines(capsys.readouterr().out)
+    ok_weights = [line["sample_weight"] for line in lines if line["path"] == "/ok"]
+    assert ok_weights == [1] * 10 + [10]
+    assert [line["sample_weight"] for line in lines if line["path"] == "/missing"] == [
+        1
+    ]
+
+
+@pytest.mark.unit
+def test_middleware_without_sampling_has_no_weight_field(capsys):
+    """Test the default configuration logs every request unchanged."""
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {}
+
+    app.add_middleware(LoggingMiddleware, settings=Settings())
+    client = TestClient(app)
+    for _ in range(3):
+        client.get("/ok")
+
+    lines = request_lines(capsys.readouterr().out)
+    assert len(lines) == 3
+    assert all("sample_weight" not in line for line in lines)
+
+
+@pytest.mark.unit
+def test_middleware_always_logs_slow_requests(capsys):
+    """Test requests above the latency threshold bypass sampling."""
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {}
+
+    clock = FakeClock()
+    middleware = LoggingMiddleware(
+        app, settings=Settings(log_sample_target=1, log_slow_ms=0)
+    )
+    middleware.sampler = AdaptiveSampler(target_per_second=1, clock=clock)
+    client = TestClient(middleware)
+    for _ in range(5):
+        client.get("/ok")
+    clock.now = 1.0
+    for _ in range(5):
+        client.get("/ok")
+
+    lines = request_lines(capsys.readouterr().out)
+    assert [line["sample_weight"] for line in lines] == [1] * 10
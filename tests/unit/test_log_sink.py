@@ -0,0 +1,203 @@
+"""Unit tests for the asynchronous log sink."""
+
+import io
+import json
+import threading
+import pytest
+import structlog
+from src.config import Settings
+from src.middleware.logging import configure_logging
+from src.observability.log_sink import _STOP, AsyncLogSink
+
+
+class SlowStream(io.StringIO):
+    """In-memory stream whose writes wait until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.writes = 0
+
+    def write(self, text):
+        self.release.wait(timeout=5)
+        self.writes += 1
+        return super().write(text)
+
+
+@pytest.fixture
+def restore_logging():
+    """Put the default synchronous logging configuration back after a test."""
+    yield
+    configure_logging(Settings())
+
+
+@pytest.mark.unit
+def test_events_are_rendered_as_json_lines():
+    """Test queued events are written as one JSON object per line."""
+    stream = io.StringIO()
+    sink = AsyncLogSink(stream=stream)
+
+    sink.submit({"event": "first", "n": 1})
+    sink.submit({"event": "第二", "n": 2})
+    sink.close()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines == [{"event": "first", "n": 1}, {"event": "第二", "n": 2}]
+
+
+@pytest.mark.unit
+def test_events_are_written_in_batches():
+    """Test events queued while the writer is busy share one write call."""
+    stream = SlowStream()
+    sink = AsyncLogSink(stream=stream, batch_size=100)
+
+    sink.submit({"event": "first"})
+    for i in range(10):
+        sink.submit({"event": "queued", "n": i})
+    stream.release.set()
+    sink.close()
+
+    assert len(stream.getvalue().splitlines()) == 11
+    assert stream.writes <= 3
+
+
+@pytest.mark.unit
+def test_full_queue_drops_and_counts_lines():
+    """Test the drop policy discards lines instead of waiting."""
+    stream = SlowStream()
+    sink = AsyncLogSink(stream=stream, queue_size=2, batch_size=1)
+
+    for i in range(20):
+        sink.submit({"event": "line", "n": i})
+    dropped = sink.dropped
+    stream.release.set()
+    sink.close()
+
+    assert dropped > 0
+    assert len(stream.getvalue().splitlines()) == 20 - dropped
+
+
+@pytest.mark.unit
+def test_full_queue_blocks_when_configured():
+    """Test the block policy keeps every line."""
+    stream = SlowStream()
+    sink = AsyncLogSink(stream=stream, queue_size=2, batch_size=1, full_policy="block")
+
+    producer = threading.Thread(
+        target=lambda: [sink.submit({"event": "line", "n": i}) for i in range(20)]
+    )
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()
+
+    stream.release.set()
+    producer.join()
+    sink.close()
+
+    assert sink.dropped == 0
+    assert len(stream.getvalue().splitlines()) == 20
+
+
+@pytest.mark.unit
+def test_flush_waits_and_late_events_are_written():
+    """Test flush drains the queue and events after close still get written."""
+    stream = io.StringIO()
+    sink = AsyncLogSink(stream=stream)
+
+    sink.submit({"event": "queued"})
+    sink.flush()
+    assert "queued" in stream.getvalue()
+
+    sink.close()
+    sink.submit({"event": "late"})
+    assert "late" in stream.getvalue()
+
+
+@pytest.mark.unit
+def test_events_queued_while_the_writer_stops_are_written():
+    """Test events that land behind the stop marker are not lost on close."""
+    stream = SlowStream()
+    sink = AsyncLogSink(stream=stream, batch_size=1)
+
+    sink.submit({"event": "first"})
+    # As close() would, while a concurrent submit() is still queueing
+    sink._queue.put(_STOP)
+    sink.submit({"event": "raced"})
+    stream.release.set()
+    sink.close()
+
+    assert [json.loads(line)["event"] for line in stream.getvalue().splitlines()] == [
+        "first",
+        "raced",
+    ]
+
+
+@pytest.mark.unit
+def test_events_queued_after_close_finished_are_written():
+    """Test a submit() that passed the closed check before close() ran."""
+    stream = io.StringIO()
+    sink = AsyncLogSink(stream=stream)
+    put = sink._queue.put_nowait
+
+    def close_then_put(event):
+        sink.close()
+        put(event)
+
+    sink._queue.put_nowait = close_then_put
+    sink.submit({"event": "raced"})
+
+    assert json.loads(stream.getvalue()) == {"event": "raced"}
+
+
+@pytest.mark.unit
+def test_render_failures_are_reported_and_counted():
+    """Test an event the renderer rejects leaves a line and a drop count."""
+
+    def renderer(_, __, event_dict):
+        if event_dict["event"] == "bad":
+            raise TypeError("not serialisable")
+        return json.dumps(event_dict)
+
+    stream = io.StringIO()
+    sink = AsyncLogSink(stream=stream, renderer=renderer)
+
+    sink.submit({"event": "bad"})
+    sink.submit({"event": "good"})
+    sink.close()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines == [
+        {
+            "event": "log_render_failed",
+            "level": "error",
+            "error": "TypeError: not serialisable",
+            "dropped_event": "bad",
+        },
+        {"event": "good"},
+    ]
+    assert sink.dropped == 1
+
+
+@pytest.mark.unit
+def test_unknown_full_policy_raises():
+    """Test invalid queue full policies are rejected."""
+    with pytest.raises(ValueError):
+        AsyncLogSink(full_policy="sometimes")
+
+
+@pytest.mark.unit
+def test_configure_logging_routes_structlog_through_sink(restore_logging, capsys):
+    """Test the async configuration renders the same fields on the sink thread."""
+    sink = configure_logging(Settings(log_sink="async"))
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(request_id="abc")
+
+    structlog.get_logger().info("request_completed", status_code=200)
+    sink.close()
+
+    line = json.loads(capsys.readouterr().out.strip())
+    assert line["event"] == "request_completed"
+    assert line["request_id"] == "abc"
+    assert line["level"] == "info"
+    assert line["status_code"] == 200
+    assert "timestamp" in line
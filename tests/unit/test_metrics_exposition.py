@@ -0,0 +1,71 @@
+"""Unit tests for /metrics exposition caching and negotiation."""
+
+import pytest
+from src.api.metrics import ExpositionCache, accepts_gzip
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+def test_cache_reuses_body_within_ttl():
+    """Test a rendered body is reused until the TTL expires."""
+    clock = FakeClock()
+    cache = ExpositionCache(ttl=5, clock=clock)
+    renders = []
+
+    def render():
+        renders.append(clock.now)
+        return f"body {len(renders)}".encode()
+
+    assert cache.get("text", render) == b"body 1"
+    clock.now = 4.9
+    assert cache.get("text", render) == b"body 1"
+    clock.now = 5.0
+    assert cache.get("text", render) == b"body 2"
+    assert renders == [0.0, 5.0]
+
+
+@pytest.mark.unit
+def test_cache_keeps_variants_apart():
+    """Test different formats are cached under their own keys."""
+    cache = ExpositionCache(ttl=5, clock=FakeClock())
+
+    assert cache.get("text", lambda: b"text") == b"text"
+    assert cache.get("openmetrics", lambda: b"openmetrics") == b"openmetrics"
+    assert cache.get("text", lambda: b"other") == b"text"
+
+
+@pytest.mark.unit
+def test_zero_ttl_always_renders():
+    """Test caching is disabled with a TTL of 0."""
+    cache = ExpositionCache(ttl=0)
+    bodies = iter([b"first", b"second"])
+
+    assert cache.get("text", lambda: next(bodies)) == b"first"
+    assert cache.get("text", lambda: next(bodies)) == b"second"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("identity", False),
+        ("gzip", True),
+        ("deflate, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("*", True),
+        ("br, gzip ; q=0.0", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    """Test Accept-Encoding parsing, including q-values."""
+    assert accepts_gzip(header) is expected
@@ -0,0 +1,47 @@
+"""Unit tests for the stack-sampling profiler."""
+
+import threading
+import time
+import pytest
+from src.observability.profiler import StackSampler, collapse
+
+
+def spin_until(event):
+    while not event.is_set():
+        sum(range(1000))
+
+
+@pytest.mark.unit
+def test_sampler_records_stacks_of_other_threads():
+    """Test sampled stacks are rooted at the thread name and name the function."""
+    done = threading.Event()
+    worker = threading.Thread(target=spin_until, args=(done,), name="busy-worker")
+    worker.start()
+
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    time.sleep(0.1)
+    counts = sampler.stop()
+    done.set()
+    worker.join()
+
+    assert sampler.samples > 0
+    worker_stacks = [stack for stack in counts if stack.startswith("busy-worker;")]
+    assert worker_stacks
+    assert any("spin_until" in stack for stack in worker_stacks)
+    assert not any(stack.startswith("stack-sampler;") for stack in counts)
+
+
+@pytest.mark.unit
+def test_sampler_rejects_non_positive_interval():
+    """Test the sampling interval must be positive."""
+    with pytest.raises(ValueError):
+        StackSampler(interval=0)
+
+
+@pytest.mark.unit
+def test_collapse_formats_one_stack_per_line_by_count():
+    """Test collapsed output is 'stack count' lines, most frequent first."""
+    output = collapse({"main;a;b": 2, "main;a;c": 5})
+
+    assert output == "main;a;c 5\nmain;a;b 2\n"
@@ -0,0 +1,230 @@
+"""Unit tests for the SQLite backed TodoStore."""
+
+import json
+import sqlite3
+import threading
+import pytest
+from src.config import Settings
+from src.models.todo import TodoCreate, TodoUpdate
+from src.storage.memory import create_todo_store
+from src.storage.sqlite import ConnectionPool, SQLiteTodoStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of the SQLite database file."""
+    return str(tmp_path / "todos.db")
+
+
+@pytest.mark.unit
+def test_data_survives_reopen(db_path):
+    """Test todos are persisted in the database file."""
+    store = SQLiteTodoStore(db_path)
+    created = store.create(TodoCreate(title="買牛奶"))
+    store.update(created.id, TodoUpdate(completed=True))
+    store.close()
+
+    reopened = SQLiteTodoStore(db_path)
+
+    assert reopened.get(created.id).model_dump() == {
+        "id": created.id,
+        "title": "買牛奶",
+        "completed": True,
+    }
+    reopened.close()
+
+
+@pytest.mark.unit
+def test_versions_survive_reopen(db_path):
+    """Test the collection and todo versions are persisted."""
+    store = SQLiteTodoStore(db_path)
+    created = store.create(TodoCreate(title="Versioned"))
+    version = store.collection_version()
+    store.close()
+
+    reopened = SQLiteTodoStore(db_path)
+
+    assert reopened.collection_version() == version
+    assert reopened.todo_version(created.id) == version
+    reopened.create(TodoCreate(title="Next"))
+    assert reopened.collection_version() > version
+    reopened.close()
+
+
+@pytest.mark.unit
+def test_database_without_version_column_is_migrated(db_path):
+    """Test databases created before versioning gain a version column."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE todos (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "title TEXT NOT NULL, completed INTEGER NOT NULL DEFAULT 0)"
+    )
+    conn.execute("INSERT INTO todos (title) VALUES ('Old todo')")
+    conn.commit()
+    conn.close()
+
+    store = SQLiteTodoStore(db_path)
+
+    assert store.todo_version("1") == 0
+    store.update("1", TodoUpdate(completed=True))
+    assert store.todo_version("1") == store.collection_version()
+    store.close()
+
+
+@pytest.mark.unit
+def test_changes_survive_reopen_within_retention(db_path):
+    """Test the change log is persisted and keeps the newest changes only."""
+    store = SQLiteTodoStore(db_path, change_retention=3)
+    start = store.collection_version()
+    for i in range(5):
+        store.create(TodoCreate(title=f"Todo {i}"))
+    version = store.collection_version()
+    store.close()
+
+    reopened = SQLiteTodoStore(db_path, change_retention=3)
+
+    assert reopened.changes_json(start, 10) is None
+    batch = reopened.changes_json(version - 3, 10)
+    assert [json.loads(change.data)["id"] for change in batch.changes] == [
+        "3",
+        "4",
+        "5",
+    ]
+    reopened.close()
+
+
+@pytest.mark.unit
+def test_existing_version_triggers_are_replaced(db_path):
+    """Test databases with the pre-change-log triggers start logging changes."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE todos (id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL, completed INTEGER NOT NULL DEFAULT 0,
+            version INTEGER NOT NULL DEFAULT 0);
+        CREATE TABLE todos_version (id INTEGER PRIMARY KEY, version INTEGER);
+        INSERT INTO todos_version VALUES (0, 10);
+        CREATE TRIGGER todos_version_insert AFTER INSERT ON todos BEGIN
+            UPDATE todos_version SET version = version + 1;
+        END;
+        """)
+    conn.close()
+
+    store = SQLiteTodoStore(db_path)
+    store.create(TodoCreate(title="Logged"))
+
+    batch = store.changes_json(10, 10)
+    assert [json.loads(change.data)["seq"] for change in batch.changes] == [11]
+    store.close()
+
+
+@pytest.mark.unit
+def test_change_log_without_op_column_is_migrated(db_path):
+    """Test change logs created before operations were logged gain the column."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE todos_changes (seq INTEGER PRIMARY KEY, todo_id INTEGER NOT NULL)"
+    )
+    conn.close()
+
+    store = SQLiteTodoStore(db_path)
+    since = store.collection_version()
+    store.create(TodoCreate(title="Logged"))
+
+    assert [change.op for change in store.changes_json(since, 10).changes] == ["create"]
+    store.close()
+
+
+@pytest.mark.unit
+def test_search_table_with_diacritics_removed_is_rebuilt(db_path):
+    """Test search tables built by the default unicode61 tokenizer are rebuilt."""
+    store = SQLiteTodoStore(db_path)
+    cafe = store.create(TodoCreate(title="Café order"))
+    store.close()
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        DROP TABLE todos_fts;
+        CREATE VIRTUAL TABLE todos_fts USING fts5(terms, tokenize='unicode61');
+        INSERT INTO todos_fts (rowid, terms) VALUES (1, 'c ca caf café o or ord');
+        """)
+    conn.close()
+
+    store = SQLiteTodoStore(db_path)
+
+    assert store.search("cafe", 10) == []
+    assert [todo.id for todo in store.search("café", 10)] == [cafe.id]
+    store.create(TodoCreate(title="Cafe"))
+    assert [todo.title for todo in store.search("cafe", 10)] == ["Cafe"]
+    store.close()
+
+
+@pytest.mark.unit
+def test_database_uses_wal_journal_mode(db_path):
+    """Test connections run in WAL mode."""
+    store = SQLiteTodoStore(db_path)
+
+    with store._pool.connection() as conn:
+        (mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+
+    assert mode == "wal"
+    store.close()
+
+
+@pytest.mark.unit
+def test_non_numeric_id_is_not_found(db_path):
+    """Test IDs that are not integers behave like missing todos."""
+    store = SQLiteTodoStore(db_path)
+
+    assert store.get("abc") is None
+    assert store.update("abc", TodoUpdate(title="x")) is None
+    assert store.delete("abc") is False
+    store.close()
+
+
+@pytest.mark.unit
+def test_transaction_rolls_back_on_error(db_path):
+    """Test a failing transaction leaves the database unchanged."""
+    store = SQLiteTodoStore(db_path)
+    store.create(TodoCreate(title="Keep"))
+
+    with pytest.raises(RuntimeError):
+        with store.transaction() as conn:
+            conn.execute("DELETE FROM todos")
+            raise RuntimeError("boom")
+
+    assert [todo.title for todo in store.list_all()] == ["Keep"]
+    store.close()
+
+
+@pytest.mark.unit
+def test_pool_never_exceeds_size(db_path):
+    """Test concurrent callers share at most pool_size connections."""
+    pool = ConnectionPool(db_path, size=2)
+    seen = set()
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(20):
+            with pool.connection() as conn:
+                with lock:
+                    seen.add(id(conn))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert 1 <= len(seen) <= 2
+    pool.close()
+
+
+@pytest.mark.unit
+def test_create_todo_store_selects_sqlite(tmp_path):
+    """Test the store factory can build the SQLite backend."""
+    store = create_todo_store(
+        Settings(storage_backend="sqlite", data_dir=str(tmp_path), sqlite_pool_size=2)
+    )
+
+    assert isinstance(store, SQLiteTodoStore)
+    assert store._pool.size == 2
+    store.close()
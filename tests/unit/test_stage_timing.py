@@ -0,0 +1,106 @@
+"""Unit tests for per-request stage timing."""
+
+import threading
+import time
+import pytest
+from contextvars import copy_context
+from src.observability.timing import (
+    LOCK,
+    STORE,
+    StageTimer,
+    TimedLock,
+    current_timer,
+    start_timer,
+    timed_store,
+)
+
+
+class SlowStore:
+    """Store stand-in whose method takes the lock and then works."""
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.name = "slow"
+
+    def get(self, todo_id):
+        with self.lock:
+            time.sleep(0.01)
+            return todo_id
+
+
+def run_timed(func):
+    """Run ``func`` with a fresh timer in its own context; return the timer."""
+
+    def timed():
+        timer = start_timer()
+        func()
+        return timer
+
+    return copy_context().run(timed)
+
+
+@pytest.mark.unit
+def test_no_timer_outside_timed_requests():
+    """Test hooks are inactive unless a timer was started."""
+    store = SlowStore(TimedLock())
+
+    assert current_timer() is None
+    assert timed_store(store) is store
+
+
+@pytest.mark.unit
+def test_timed_lock_reports_wait_as_lock_stage():
+    """Test time spent waiting for a held lock is added to the lock stage."""
+    lock = TimedLock()
+    lock.acquire()
+    releaser = threading.Timer(0.05, lock.release)
+    releaser.start()
+
+    def wait_for_lock():
+        with lock:
+            pass
+
+    timer = run_timed(wait_for_lock)
+    releaser.join()
+
+    assert timer.stages[LOCK] >= 0.04
+
+
+@pytest.mark.unit
+def test_timed_store_excludes_lock_wait_from_store_stage():
+    """Test store time and lock wait do not overlap."""
+    lock = TimedLock()
+    store = SlowStore(lock)
+    lock.acquire()
+    releaser = threading.Timer(0.05, lock.release)
+    releaser.start()
+
+    timer = run_timed(lambda: timed_store(store).get("1"))
+    releaser.join()
+
+    assert timer.stages[LOCK] >= 0.04
+    assert 0.01 <= timer.stages[STORE] < 0.04
+
+
+@pytest.mark.unit
+def test_timed_store_passes_attributes_through():
+    """Test non-callable store attributes are returned unchanged."""
+    store = SlowStore(TimedLock())
+
+    def check():
+        assert timed_store(store).name == "slow"
+
+    run_timed(check)
+
+
+@pytest.mark.unit
+def test_header_lists_stages_in_request_order_with_total():
+    """Test the Server-Timing value orders stages and ends with the total."""
+    timer = StageTimer()
+    timer.add("store", 0.002)
+    timer.add("middleware", 0.0005)
+    timer.add("parse", 0.001)
+
+    assert timer.header(0.004) == (
+        "middleware;dur=0.500, parse;dur=1.000, store;dur=2.000, total;dur=4.000"
+    )
@@ -1,16 +1,29 @@
 """Unit tests for TodoStore."""
 
+import json
 import pytest
-from src.models.todo import TodoCreate, TodoUpdate
+from src.models.todo import TodoCreate, TodoResponse, TodoUpdate
 from src.storage.memory import TodoStore
-
-
-@pytest.fixture
-def store():
-    """Create a fresh TodoStore for each test."""
-    store = TodoStore()
+from src.storage.records import TodoRecord
+from src.storage.sqlite import SQLiteTodoStore
+from src.storage.striped import StripedTodoStore
+from src.storage.wal import WALTodoStore
+
+
+@pytest.fixture(params=["memory", "striped", "wal", "sqlite"])
+def store(request, tmp_path):
+    """Create a fresh store for each test, once per storage backend."""
+    if request.param == "wal":
+        store = WALTodoStore(str(tmp_path / "wal"))
+    elif request.param == "striped":
+        store = StripedTodoStore()
+    elif request.param == "sqlite":
+        store = SQLiteTodoStore(str(tmp_path / "todos.db"))
+    else:
+        store = TodoStore()
     yield store
     store.clear()
+    store.close()
 
 
 @pytest.mark.unit
@@ -146,6 +159,28 @@ def test_delete_non_existent_todo_returns_false(store):
     assert result is False
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "todo_id",
+    ["01", " 1", "1 ", "1_0", "+1", "１", "²", "0", "", str(2**63), "9" * 5000],
+)
+def test_non_canonical_and_out_of_range_ids_do_not_exist(store, todo_id):
+    """Test IDs that are not exactly an issued ID match nothing, on any backend."""
+    store.create(TodoCreate(title="First"))
+    for _ in range(9):
+        store.create(TodoCreate(title="Filler"))
+
+    assert store.get(todo_id) is None
+    assert store.get_json(todo_id) is None
+    assert store.todo_version(todo_id) is None
+    assert store.update(todo_id, TodoUpdate(completed=True)) is None
+    assert store.update_many([(todo_id, TodoUpdate(completed=True))]) == [None]
+    assert store.delete(todo_id) is False
+    assert store.delete_many([todo_id]) == [False]
+    assert len(store.list_all()) == 10
+    assert not any(todo.completed for todo in store.list_all())
+
+
 @pytest.mark.unit
 def test_clear_store(store):
     """Test clearing all todos from store."""
@@ -170,3 +205,408 @@ def test_thread_safety_sequential_ids(store):
     # IDs should be sequential
     assert int(todo2.id) == int(todo1.id) + 1
     assert int(todo3.id) == int(todo2.id) + 1
+
+
+@pytest.mark.unit
+def test_list_page_returns_pages_in_id_order(store):
+    """Test list_page walks every todo once, in ID order."""
+    for i in range(5):
+        store.create(TodoCreate(title=f"Todo {i}"))
+
+    first, next_after = store.list_page(2)
+    second, next_after_2 = store.list_page(2, next_after)
+    third, next_after_3 = store.list_page(2, next_after_2)
+
+    assert [todo.id for todo in first + second + third] == ["1", "2", "3", "4", "5"]
+    assert next_after == "2"
+    assert next_after_3 is None
+
+
+@pytest.mark.unit
+def test_list_page_skips_deleted_todos(store):
+    """Test deleted todos disappear from pages."""
+    for i in range(4):
+        store.create(TodoCreate(title=f"Todo {i}"))
+    store.delete("2")
+
+    todos, next_after = store.list_page(10)
+
+    assert [todo.id for todo in todos] == ["1", "3", "4"]
+    assert next_after is None
+
+
+@pytest.mark.unit
+def test_list_page_exact_fit_has_no_next_page(store):
+    """Test a page that ends on the last todo reports no next page."""
+    store.create(TodoCreate(title="Only"))
+
+    todos, next_after = store.list_page(1)
+
+    assert len(todos) == 1
+    assert next_after is None
+
+
+@pytest.mark.unit
+def test_list_all_filters_by_completed(store):
+    """Test list_all returns only todos with the requested status."""
+    store.create(TodoCreate(title="Open 1"))
+    done = store.create(TodoCreate(title="Done", completed=True))
+    store.create(TodoCreate(title="Open 2"))
+
+    assert [todo.title for todo in store.list_all(completed=False)] == [
+        "Open 1",
+        "Open 2",
+    ]
+    assert [todo.id for todo in store.list_all(completed=True)] == [done.id]
+
+
+class Untouchable:
+    """Stands in for a record that a status-filtered listing must not read."""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"non-matching record read ({name})")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("store_class", [TodoStore, StripedTodoStore])
+def test_list_all_by_status_visits_only_matching_todos(store_class):
+    """Test a status filter walks the status index instead of every todo."""
+    store = store_class()
+    for i in range(200):
+        store.create(TodoCreate(title=f"Todo {i}", completed=i % 50 == 0))
+
+    expected = store.list_all_json(completed=True)
+    untouchable = Untouchable()
+    if store_class is TodoStore:
+        tables = [store._todos]
+    else:
+        tables = [stripe.todos for stripe in store._stripes]
+    for todos in tables:
+        for todo_id in list(todos):
+            if (int(todo_id) - 1) % 50:
+                todos[todo_id] = untouchable
+
+    assert store.list_all_json(completed=True) == expected
+    assert [todo.id for todo in store.list_all(completed=True)] == [
+        "1",
+        "51",
+        "101",
+        "151",
+    ]
+
+
+@pytest.mark.unit
+def test_status_index_follows_updates_and_deletes(store):
+    """Test the completed filter reflects status changes and deletions."""
+    first = store.create(TodoCreate(title="First"))
+    second = store.create(TodoCreate(title="Second"))
+    store.update(first.id, TodoUpdate(completed=True))
+    store.update(first.id, TodoUpdate(title="Still done"))
+    store.delete(second.id)
+
+    assert [todo.title for todo in store.list_all(completed=True)] == ["Still done"]
+    assert store.list_all(completed=False) == []
+
+
+@pytest.mark.unit
+def test_list_page_filters_by_completed(store):
+    """Test list_page pages through matching todos only."""
+    for i in range(6):
+        store.create(TodoCreate(title=f"Todo {i}", completed=i % 2 == 0))
+
+    first, next_after = store.list_page(2, completed=True)
+    rest, last_after = store.list_page(2, next_after, completed=True)
+
+    assert [todo.id for todo in first + rest] == ["1", "3", "5"]
+    assert last_after is None
+
+
+@pytest.mark.unit
+def test_search_matches_word_prefixes(store):
+    """Test search matches title words by prefix, case-insensitively."""
+    milk = store.create(TodoCreate(title="Buy MILK"))
+    store.create(TodoCreate(title="Buy bread"))
+
+    assert [todo.id for todo in store.search("mil", 10)] == [milk.id]
+    assert len(store.search("buy", 10)) == 2
+    assert store.search("ilk", 10) == []
+
+
+@pytest.mark.unit
+def test_search_matches_cjk_substrings(store):
+    """Test search matches Chinese text anywhere in the title."""
+    milk = store.create(TodoCreate(title="購買牛奶"))
+    store.create(TodoCreate(title="買牛肉和牛奶"))
+
+    assert len(store.search("牛奶", 10)) == 2
+    assert [todo.id for todo in store.search("買牛奶", 10)] == [milk.id]
+    assert [todo.id for todo in store.search("購 milk", 10)] == []
+
+
+@pytest.mark.unit
+def test_search_keeps_diacritics(store):
+    """Test accented and unaccented words are different words on every backend."""
+    cafe = store.create(TodoCreate(title="Café order"))
+    naive = store.create(TodoCreate(title="Naïve plan"))
+    plain = store.create(TodoCreate(title="Cafe naive"))
+
+    assert [todo.id for todo in store.search("café", 10)] == [cafe.id]
+    assert [todo.id for todo in store.search("CAFÉ", 10)] == [cafe.id]
+    assert [todo.id for todo in store.search("naïv", 10)] == [naive.id]
+    assert [todo.id for todo in store.search("cafe", 10)] == [plain.id]
+    assert [todo.id for todo in store.search("naive", 10)] == [plain.id]
+
+
+@pytest.mark.unit
+def test_search_follows_updates_deletes_and_limit(store):
+    """Test the title index reflects retitles and deletions and honours limit."""
+    first = store.create(TodoCreate(title="Report draft"))
+    second = store.create(TodoCreate(title="Report final"))
+    store.create(TodoCreate(title="Report review"))
+    store.update(first.id, TodoUpdate(title="Slides"))
+    store.delete(second.id)
+
+    assert [todo.title for todo in store.search("report", 10)] == ["Report review"]
+    assert [todo.id for todo in store.search("slid", 10)] == [first.id]
+    assert len(store.search("r", 1)) == 1
+
+
+@pytest.mark.unit
+def test_json_reads_match_model_reads(store):
+    """Test that the *_json methods encode exactly what the model methods return."""
+    store.create(TodoCreate(title="Buy milk"))
+    store.create(TodoCreate(title="購買牛奶", completed=True))
+    store.create(TodoCreate(title='Quote " and \\ slash'))
+
+    def encoded(todos):
+        return [todo.model_dump_json().encode() for todo in todos]
+
+    assert store.get_json("2") == store.get("2").model_dump_json().encode()
+    assert store.get_json("999") is None
+    assert store.list_all_json() == encoded(store.list_all())
+    assert store.list_all_json(True) == encoded(store.list_all(True))
+    page, next_after = store.list_page_json(2)
+    assert (page, next_after) == (encoded(store.list_page(2)[0]), "2")
+    assert store.search_json("milk", 10) == encoded(store.search("milk", 10))
+
+
+@pytest.mark.unit
+def test_record_response_matches_validated_model():
+    """Test records build the same TodoResponse that validation would."""
+    record = TodoRecord("7", "購買牛奶", True, version=42)
+
+    response = record.to_response()
+
+    assert isinstance(response, TodoResponse)
+    assert response == TodoResponse(id="7", title="購買牛奶", completed=True)
+    assert response.model_fields_set == {"id", "title", "completed"}
+    assert response.model_dump_json().encode() == record.to_json()
+    assert response.model_copy(update={"title": "New"}).title == "New"
+
+
+@pytest.mark.unit
+def test_json_reads_follow_updates_and_deletes(store):
+    """Test that cached encodings are invalidated when a todo changes."""
+    created = store.create(TodoCreate(title="Old title"))
+    assert json.loads(store.get_json(created.id))["title"] == "Old title"
+
+    store.update(created.id, TodoUpdate(title="New title", completed=True))
+    assert json.loads(store.get_json(created.id)) == {
+        "id": created.id,
+        "title": "New title",
+        "completed": True,
+    }
+    assert store.list_all_json(False) == []
+
+    store.delete(created.id)
+    assert store.get_json(created.id) is None
+    assert store.list_all_json() == []
+
+
+@pytest.mark.unit
+def test_updates_replace_records_instead_of_mutating():
+    """Test that a record taken before an update still shows the old state."""
+    store = TodoStore()
+    created = store.create(TodoCreate(title="Old title"))
+    before = store._todos[created.id]
+
+    store.update(created.id, TodoUpdate(title="New title", completed=True))
+
+    assert (before.title, before.completed) == ("Old title", False)
+    assert json.loads(before.to_json())["title"] == "Old title"
+    assert store._todos[created.id] is not before
+    assert store.get(created.id).title == "New title"
+
+
+@pytest.mark.unit
+def test_scan_json_yields_batches_in_id_order(store):
+    """Test scan_json walks the whole collection one batch at a time."""
+    for i in range(5):
+        store.create(TodoCreate(title=f"Todo {i}", completed=i == 3))
+    store.delete("2")
+
+    batches = list(store.scan_json(batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2]
+    assert [json.loads(todo)["id"] for batch in batches for todo in batch] == [
+        "1",
+        "3",
+        "4",
+        "5",
+    ]
+    assert list(store.scan_json(completed=True)) == [[store.get_json("4")]]
+
+
+@pytest.mark.unit
+def test_get_versioned_json_reads_version_and_body_together(store):
+    """Test get_versioned_json matches todo_version and get_json."""
+    todo = store.create(TodoCreate(title="Versioned"))
+    store.update(todo.id, TodoUpdate(completed=True))
+
+    assert store.get_versioned_json(todo.id) == (
+        store.todo_version(todo.id),
+        store.get_json(todo.id),
+    )
+    assert store.get_versioned_json("404") is None
+    assert store.get_versioned_json("abc") is None
+
+
+@pytest.mark.unit
+def test_scan_json_is_a_snapshot_as_of_the_first_batch(store):
+    """Test writes made mid-scan do not show up in the rest of the scan."""
+    for i in range(6):
+        store.create(TodoCreate(title=f"Todo {i}", completed=i < 2))
+    everything = [store.get_json(str(i)) for i in range(1, 7)]
+
+    scan = store.scan_json(batch_size=2)
+    done = store.scan_json(completed=True, batch_size=1)
+    first, first_done = next(scan), next(done)
+    store.update("2", TodoUpdate(title="Renamed"))
+    store.update("4", TodoUpdate(completed=True))
+    store.delete("5")
+    store.create(TodoCreate(title="Added", completed=True))
+
+    assert first + [todo for batch in scan for todo in batch] == everything
+    assert first_done + [todo for batch in done for todo in batch] == everything[:2]
+
+
+@pytest.mark.unit
+def test_changes_report_writes_since_a_version(store):
+    """Test changes_json returns each todo changed since a version once."""
+    kept = store.create(TodoCreate(title="Kept"))
+    since = store.collection_version()
+    removed = store.create(TodoCreate(title="Removed"))
+    store.update(kept.id, TodoUpdate(title="Renamed"))
+    store.update(kept.id, TodoUpdate(completed=True))
+    store.delete(removed.id)
+    added = store.create(TodoCreate(title="Added"))
+    store.update(added.id, TodoUpdate(title="Added later"))
+
+    batch = store.changes_json(since, 100)
+
+    changes = [json.loads(change.data) for change in batch.changes]
+    assert [(change["id"], change["op"], change["deleted"]) for change in changes] == [
+        (kept.id, "update", False),
+        (removed.id, "delete", True),
+        (added.id, "create", False),
+    ]
+    assert [change.op for change in batch.changes] == ["update", "delete", "create"]
+    assert changes[0]["todo"] == {"id": kept.id, "title": "Renamed", "completed": True}
+    assert changes[1]["todo"] is None
+    assert changes[2]["todo"]["title"] == "Added later"
+    assert changes[-1]["seq"] == batch.next_since == store.collection_version()
+    assert batch.has_more is False
+    assert store.changes_json(batch.next_since, 100) == (
+        [],
+        batch.next_since,
+        False,
+    )
+
+
+@pytest.mark.unit
+def test_changes_are_read_in_batches(store):
+    """Test limit splits the changes and next_since continues after a batch."""
+    since = store.collection_version()
+    for i in range(5):
+        store.create(TodoCreate(title=f"Todo {i}"))
+
+    ids = []
+    batch = store.changes_json(since, 2)
+    while True:
+        ids.extend(json.loads(change.data)["id"] for change in batch.changes)
+        if not batch.has_more:
+            break
+        batch = store.changes_json(batch.next_since, 2)
+
+    assert ids == ["1", "2", "3", "4", "5"]
+
+
+@pytest.mark.unit
+def test_changes_from_unknown_versions_require_resync(store):
+    """Test versions newer than the store or older than its log give None."""
+    store.create(TodoCreate(title="Todo"))
+    version = store.collection_version()
+
+    assert store.changes_json(version + 1, 10) is None
+    assert store.changes_json(0, 10) is None
+
+
+@pytest.mark.unit
+def test_clear_resets_the_change_log(store):
+    """Test versions from before a clear require a resync."""
+    since = store.collection_version()
+    store.create(TodoCreate(title="Before"))
+    before_clear = store.collection_version()
+
+    store.clear()
+    store.create(TodoCreate(title="After"))
+
+    assert store.changes_json(since, 10) is None
+    assert store.changes_json(before_clear, 10) is None
+    batch = store.changes_json(store.collection_version(), 10)
+    assert batch.changes == []
+
+
+@pytest.mark.unit
+def test_bulk_operations_apply_in_order(store):
+    """Test create_many, update_many and delete_many report per-item outcomes."""
+    created = store.create_many(
+        [TodoCreate(title="Todo A"), TodoCreate(title="Todo B", completed=True)]
+    )
+    assert [todo.id for todo in created] == ["1", "2"]
+    assert [todo.completed for todo in created] == [False, True]
+
+    updated = store.update_many(
+        [("1", TodoUpdate(completed=True)), ("999", TodoUpdate(title="Missing"))]
+    )
+    assert updated[0].completed is True
+    assert updated[1] is None
+    assert [todo.id for todo in store.list_all(completed=True)] == ["1", "2"]
+
+    assert store.delete_many(["2", "999", "2"]) == [True, False, False]
+    assert [todo.id for todo in store.list_all()] == ["1"]
+
+
+@pytest.mark.unit
+def test_versions_change_only_on_writes(store):
+    """Test collection and todo versions track writes, not reads."""
+    first = store.create(TodoCreate(title="First"))
+    second = store.create(TodoCreate(title="Second"))
+    version = store.collection_version()
+    first_version = store.todo_version(first.id)
+
+    assert store.todo_version(second.id) == version
+    assert first_version < version
+    store.get(first.id)
+    store.list_all()
+    assert store.collection_version() == version
+
+    store.update(second.id, TodoUpdate(completed=True))
+    assert store.todo_version(first.id) == first_version
+    assert store.todo_version(second.id) == store.collection_version() > version
+
+    version = store.collection_version()
+    store.delete(first.id)
+    assert store.todo_version(first.id) is None
+    assert store.collection_version() > version
+    assert store.todo_version("999") is None
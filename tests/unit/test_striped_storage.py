@@ -0,0 +1,144 @@
+"""Unit tests for the lock-striped TodoStore."""
+
+import threading
+import pytest
+from src.config import Settings
+from src.models.todo import TodoCreate, TodoUpdate
+from src.storage import indexes, striped
+from src.storage.memory import create_todo_store
+from src.storage.striped import StripedTodoStore
+
+
+@pytest.mark.unit
+def test_concurrent_creates_get_unique_ids():
+    """Test lock-free ID allocation never hands out the same ID twice."""
+    store = StripedTodoStore(stripes=4)
+    ids = []
+    lock = threading.Lock()
+
+    def worker():
+        created = [store.create(TodoCreate(title="Todo")).id for _ in range(500)]
+        with lock:
+            ids.extend(created)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(ids) == len(set(ids)) == 4000
+    assert len(store.list_all()) == 4000
+
+
+@pytest.mark.unit
+def test_todos_are_spread_across_stripes():
+    """Test todos are partitioned instead of piling into one stripe."""
+    store = StripedTodoStore(stripes=4)
+    for i in range(100):
+        store.create(TodoCreate(title=f"Todo {i}"))
+
+    sizes = [len(stripe.todos) for stripe in store._stripes]
+
+    assert sum(sizes) == 100
+    assert sum(1 for size in sizes if size) > 1
+
+
+@pytest.mark.unit
+def test_list_all_is_in_id_order():
+    """Test list_all merges stripes back into creation order."""
+    store = StripedTodoStore(stripes=8)
+    for i in range(50):
+        store.create(TodoCreate(title=f"Todo {i}"))
+    store.update("7", TodoUpdate(completed=True))
+
+    result = store.list_all()
+
+    assert [todo.id for todo in result] == [str(i) for i in range(1, 51)]
+    assert result[6].completed is True
+
+
+@pytest.mark.unit
+def test_invalid_stripe_count_raises():
+    """Test a store needs at least one stripe."""
+    with pytest.raises(ValueError):
+        StripedTodoStore(stripes=0)
+
+
+@pytest.mark.unit
+def test_create_todo_store_selects_striped():
+    """Test the store factory can build the striped backend."""
+    store = create_todo_store(Settings(storage_backend="striped", storage_stripes=3))
+
+    assert isinstance(store, StripedTodoStore)
+    assert len(store._stripes) == 3
+
+
+@pytest.mark.unit
+def test_titles_are_tokenized_outside_the_index_lock(monkeypatch):
+    """Test writes hold the global index lock only for index mutations."""
+    store = StripedTodoStore(stripes=4)
+    tokenized = []
+    original = indexes.index_terms
+
+    def index_terms(title):
+        assert not store._index_lock.locked()
+        tokenized.append(title)
+        return original(title)
+
+    monkeypatch.setattr(striped, "index_terms", index_terms)
+    monkeypatch.setattr(indexes, "index_terms", index_terms)
+    store.create(TodoCreate(title="Buy milk"))
+    store.update("1", TodoUpdate(title="Buy bread"))
+    store.delete("1")
+
+    assert tokenized == ["Buy milk", "Buy bread", "Buy milk", "Buy bread"]
+    assert store.search("buy", 10) == []
+
+
+@pytest.mark.unit
+def test_title_index_stays_correct_when_retitled_after_the_peek(monkeypatch):
+    """Test a write racing between the unlocked peek and the lock is handled."""
+    store = StripedTodoStore(stripes=4)
+    store.create(TodoCreate(title="Buy milk"))
+    peek = striped._peek_terms
+
+    def racing_peek(stripe, todo_id):
+        seen = peek(stripe, todo_id)
+        monkeypatch.setattr(striped, "_peek_terms", peek)
+        store.update(todo_id, TodoUpdate(title="Walk dog"))
+        return seen
+
+    monkeypatch.setattr(striped, "_peek_terms", racing_peek)
+    store.update("1", TodoUpdate(title="Read book"))
+
+    assert [todo.title for todo in store.search("read", 10)] == ["Read book"]
+    assert store.search("walk", 10) == store.search("milk", 10) == []
+
+
+@pytest.mark.unit
+def test_reads_render_outside_the_stripe_locks(monkeypatch):
+    """Test reads only copy record references while holding a stripe lock."""
+    store = StripedTodoStore(stripes=4)
+    for i in range(8):
+        store.create(TodoCreate(title=f"Todo {i}", completed=i % 2 == 0))
+    rendered = []
+
+    def checked(render):
+        def render_unlocked(record):
+            assert not any(stripe.lock.locked() for stripe in store._stripes)
+            rendered.append(record.id)
+            return render(record)
+
+        return render_unlocked
+
+    monkeypatch.setattr(striped, "_to_response", checked(striped._to_response))
+    monkeypatch.setattr(striped, "_to_json", checked(striped._to_json))
+
+    assert store.get("3").id == "3"
+    assert store.get_json("3") is not None
+    assert len(store.list_all()) == 8
+    assert len(store.list_all_json(completed=True)) == 4
+    assert len(store.list_page_json(3)[0]) == 3
+    assert len(store.search("todo", 5)) == 5
+    assert len(rendered) == 2 + 8 + 4 + 3 + 5
@@ -0,0 +1,246 @@
+"""Unit tests for the write-ahead-log backed TodoStore."""
+
+import errno
+import os
+import pytest
+from src.config import Settings
+from src.models.todo import TodoCreate, TodoUpdate
+from src.storage.memory import TodoStore, create_todo_store
+from src.storage.wal import SNAPSHOT_FILENAME, WALCorruptionError, WALTodoStore
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Directory holding the log segments and snapshot."""
+    return str(tmp_path / "data")
+
+
+def reopen(store: WALTodoStore, data_dir: str, **kwargs) -> WALTodoStore:
+    """Close a store and recover a new one from the same directory."""
+    store.close()
+    return WALTodoStore(data_dir, **kwargs)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("policy", ["always", "batch", "interval"])
+def test_state_survives_restart(data_dir, policy):
+    """Test creates, updates and deletes are recovered for every fsync policy."""
+    store = WALTodoStore(data_dir, fsync_policy=policy)
+    kept = store.create(TodoCreate(title="買牛奶"))
+    removed = store.create(TodoCreate(title="Remove me"))
+    store.update(kept.id, TodoUpdate(completed=True))
+    store.delete(removed.id)
+
+    recovered = reopen(store, data_dir, fsync_policy=policy)
+
+    assert [todo.model_dump() for todo in recovered.list_all()] == [
+        {"id": kept.id, "title": "買牛奶", "completed": True}
+    ]
+    recovered.close()
+
+
+@pytest.mark.unit
+def test_bulk_writes_survive_restart(data_dir):
+    """Test batches applied under one durability wait are all recovered."""
+    store = WALTodoStore(data_dir)
+    store.create_many([TodoCreate(title=f"Todo {i}") for i in range(3)])
+    store.update_many([("2", TodoUpdate(completed=True))])
+    store.delete_many(["1"])
+
+    recovered = reopen(store, data_dir)
+
+    assert [todo.model_dump() for todo in recovered.list_all()] == [
+        {"id": "2", "title": "Todo 1", "completed": True},
+        {"id": "3", "title": "Todo 2", "completed": False},
+    ]
+    recovered.close()
+
+
+@pytest.mark.unit
+def test_versions_are_not_reused_after_restart(data_dir):
+    """Test recovered todos get versions newer than any handed out before."""
+    store = WALTodoStore(data_dir)
+    created = store.create(TodoCreate(title="Versioned"))
+    version = store.collection_version()
+
+    recovered = reopen(store, data_dir)
+
+    assert recovered.todo_version(created.id) > version
+    assert recovered.collection_version() > version
+    recovered.close()
+
+
+@pytest.mark.unit
+def test_ids_continue_after_restart(data_dir):
+    """Test recovered stores never reuse IDs."""
+    store = WALTodoStore(data_dir)
+    store.create(TodoCreate(title="First"))
+    last = store.create(TodoCreate(title="Second"))
+    store.delete(last.id)
+
+    recovered = reopen(store, data_dir)
+    new_todo = recovered.create(TodoCreate(title="Third"))
+
+    assert int(new_todo.id) == int(last.id) + 1
+    recovered.close()
+
+
+@pytest.mark.unit
+def test_clear_is_persisted(data_dir):
+    """Test clear empties the store and resets IDs after a restart."""
+    store = WALTodoStore(data_dir)
+    store.create(TodoCreate(title="Todo"))
+    store.clear()
+
+    recovered = reopen(store, data_dir)
+
+    assert recovered.list_all() == []
+    assert recovered.create(TodoCreate(title="Again")).id == "1"
+    recovered.close()
+
+
+@pytest.mark.unit
+def test_snapshot_truncates_log_and_recovers(data_dir):
+    """Test a snapshot removes covered segments and recovery uses it."""
+    store = WALTodoStore(data_dir)
+    for i in range(5):
+        store.create(TodoCreate(title=f"Todo {i}"))
+    store.snapshot()
+    store.update("1", TodoUpdate(title="After snapshot"))
+
+    segments = [name for name in os.listdir(data_dir) if name.endswith(".log")]
+    assert segments == ["wal-00000001.log"]
+    assert os.path.exists(os.path.join(data_dir, SNAPSHOT_FILENAME))
+
+    recovered = reopen(store, data_dir)
+
+    assert len(recovered.list_all()) == 5
+    assert recovered.get("1").title == "After snapshot"
+    recovered.close()
+
+
+@pytest.mark.unit
+def test_background_snapshot_after_threshold(data_dir):
+    """Test a snapshot is taken automatically after snapshot_every writes."""
+    store = WALTodoStore(data_dir, snapshot_every=3)
+    for i in range(3):
+        store.create(TodoCreate(title=f"Todo {i}"))
+    store.close()
+
+    assert os.path.exists(os.path.join(data_dir, SNAPSHOT_FILENAME))
+    recovered = WALTodoStore(data_dir)
+    assert len(recovered.list_all()) == 3
+    recovered.close()
+
+
+@pytest.mark.unit
+def test_torn_tail_is_ignored(data_dir):
+    """Test a partially written record at the end of the log is discarded."""
+    store = WALTodoStore(data_dir)
+    store.create(TodoCreate(title="Durable"))
+    store.close()
+
+    with open(os.path.join(data_dir, "wal-00000000.log"), "ab") as f:
+        f.write(b"\x20\x00\x00\x00garbage")
+
+    recovered = WALTodoStore(data_dir)
+    recovered.create(TodoCreate(title="After crash"))
+    recovered = reopen(recovered, data_dir)
+
+    assert [todo.title for todo in recovered.list_all()] == ["Durable", "After crash"]
+    recovered.close()
+
+
+@pytest.mark.unit
+def test_corrupt_sealed_segment_stops_recovery(data_dir):
+    """Test damage before the last segment raises instead of skipping segments."""
+    store = WALTodoStore(data_dir)
+    store.create(TodoCreate(title="First segment"))
+    store.create(TodoCreate(title="Also first segment"))
+    store._wal.rotate()
+    store.create(TodoCreate(title="Second segment"))
+    store.close()
+
+    first = os.path.join(data_dir, "wal-00000000.log")
+    second = os.path.join(data_dir, "wal-00000001.log")
+    sizes = (os.path.getsize(first), os.path.getsize(second))
+    with open(first, "r+b") as f:
+        f.seek(sizes[0] - 2)
+        f.write(b"XX")
+
+    with pytest.raises(WALCorruptionError, match="wal-00000000.log"):
+        WALTodoStore(data_dir)
+
+    assert (os.path.getsize(first), os.path.getsize(second)) == sizes
+
+
+class FullDisk:
+    """Segment file stand-in that writes part of a frame, then fails."""
+
+    def __init__(self, file):
+        self.file = file
+        self.closed = False
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def write(self, data):
+        self.file.write(bytes(data[:3]))
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+
+@pytest.mark.unit
+def test_failed_append_leaves_no_trace(data_dir):
+    """Test a write whose log append fails is not applied, logged or replayed."""
+    store = WALTodoStore(data_dir)
+    kept = store.create(TodoCreate(title="Kept"))
+    version = store.collection_version()
+    changes = store.changes_json(version, 10)
+    segment = store._wal._file
+    store._wal._file = FullDisk(segment)
+
+    with pytest.raises(OSError):
+        store.create(TodoCreate(title="Lost"))
+    with pytest.raises(OSError):
+        store.update(kept.id, TodoUpdate(title="Lost"))
+    with pytest.raises(OSError):
+        store.delete(kept.id)
+    with pytest.raises(OSError):
+        store.clear()
+
+    assert [todo.title for todo in store.list_all()] == ["Kept"]
+    assert store.collection_version() == version
+    assert store.todo_version(kept.id) == version
+    assert store.changes_json(version, 10) == changes
+    assert store.search("lost", 10) == []
+
+    store._wal._file = segment
+    store.create(TodoCreate(title="Next"))
+    recovered = reopen(store, data_dir)
+
+    assert [todo.model_dump() for todo in recovered.list_all()] == [
+        {"id": kept.id, "title": "Kept", "completed": False},
+        {"id": "2", "title": "Next", "completed": False},
+    ]
+    recovered.close()
+
+
+@pytest.mark.unit
+def test_unknown_fsync_policy_raises(data_dir):
+    """Test an invalid fsync policy is rejected."""
+    with pytest.raises(ValueError):
+        WALTodoStore(data_dir, fsync_policy="sometimes")
+
+
+@pytest.mark.unit
+def test_create_todo_store_selects_backend(data_dir):
+    """Test the store factory honours the configured backend."""
+    memory = create_todo_store(Settings())
+    wal = create_todo_store(Settings(storage_backend="wal", data_dir=data_dir))
+
+    assert type(memory) is TodoStore
+    assert isinstance(wal, WALTodoStore)
+    wal.close()
+
+    with pytest.raises(ValueError):
+        create_todo_store(Settings(storage_backend="tape"))